@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+
+
+logger = logging.getLogger("BrowserPool")
+
+class BrowserContextPool:
+    """Keeps pre-warmed browser contexts ready so sessions don't pay for context startup"""
+
+    def __init__(self, browser, size, factory, max_idle_time=600, max_concurrent=None):
+        """Initialize the pool; factory(browser) must return a new context"""
+        self.browser = browser
+        self.size = size
+        self.factory = factory
+        self.max_idle_time = max_idle_time
+        self.idle = asyncio.Queue(maxsize=size)
+        self.semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        self.cleanup_task = None
+        self.refill_task = None
+        self.closed = False
+
+    async def warm_up(self):
+        """Eagerly create contexts until the idle queue is full"""
+        while not self.closed and not self.idle.full():
+            try:
+                context = await self.factory(self.browser)
+            except Exception as e:
+                logger.error(f"Error warming up browser context: {e}")
+                break
+            if not await self._put_idle(context, time.monotonic()):
+                break
+        self.start_cleanup()
+
+    def start_cleanup(self):
+        """Start the background task that closes stale idle contexts"""
+        if self.cleanup_task is None or self.cleanup_task.done():
+            self.cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def acquire(self):
+        """Take a warm context (or build one) and return (context, release)"""
+        if self.semaphore:
+            await self.semaphore.acquire()
+        try:
+            try:
+                context, _ = self.idle.get_nowait()
+            except asyncio.QueueEmpty:
+                context = await self.factory(self.browser)
+        except Exception:
+            if self.semaphore:
+                self.semaphore.release()
+            raise
+
+        # Top the pool back up in the background for the next acquire
+        if self.refill_task is None or self.refill_task.done():
+            self.refill_task = asyncio.create_task(self.warm_up())
+
+        released = False
+
+        async def release(discard=False):
+            nonlocal released
+            if released:
+                return
+            released = True
+            try:
+                await self._return(context, discard)
+            finally:
+                if self.semaphore:
+                    self.semaphore.release()
+
+        return context, release
+
+    async def _return(self, context, discard):
+        """Put a context back in the idle queue, or close it"""
+        if discard or self.closed:
+            await self._close_context(context)
+            return
+        await self._put_idle(context, time.monotonic())
+
+    async def _put_idle(self, context, idle_since):
+        """Queue a context as idle; close it and return False if the pool is already full"""
+        try:
+            self.idle.put_nowait((context, idle_since))
+            return True
+        except asyncio.QueueFull:
+            # A concurrent warm_up or release filled the slot while this
+            # context was being created
+            await self._close_context(context)
+            return False
+
+    async def _cleanup_loop(self):
+        """Close contexts that sat idle longer than max_idle_time"""
+        while not self.closed:
+            await asyncio.sleep(self.max_idle_time / 2)
+            now = time.monotonic()
+            fresh = []
+            while not self.idle.empty():
+                context, idle_since = self.idle.get_nowait()
+                if now - idle_since > self.max_idle_time:
+                    await self._close_context(context)
+                else:
+                    fresh.append((context, idle_since))
+            for context, idle_since in fresh:
+                await self._put_idle(context, idle_since)
+
+    async def _close_context(self, context):
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+
+    async def close(self):
+        """Close every idle context and stop background tasks"""
+        self.closed = True
+        for task in (self.cleanup_task, self.refill_task):
+            if task and not task.done():
+                task.cancel()
+        while not self.idle.empty():
+            context, _ = self.idle.get_nowait()
+            await self._close_context(context)
@@ -1,96 +1,140 @@
-import os
-import threading
-import time
-import logging
-import queue
-
-
-logger = logging.getLogger("ProfileWatcher")
-logging.basicConfig(level=logging.INFO)
-
-class ProfileFileWatcher:
-    """Watches a profile URL file for changes and loads new profiles"""
-    
-    def __init__(self, file_path, profile_queue):
-        """Initialize the watcher"""
-        self.file_path = file_path
-        self.profile_queue = profile_queue
-        self.processed_urls = set()
-        self.last_modified = 0
-        self.running = False
-        self.thread = None
-    
-    def start(self):
-        """Start the watcher thread"""
-        self.running = True
-        self.thread = threading.Thread(target=self._watch_loop, name="ProfileWatcher")
-        self.thread.daemon = True
-        self.thread.start()
-        logger.info(f"Started profile file watcher for {self.file_path}")
-    
-    def stop(self):
-        """Stop the watcher thread"""
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=2)
-        logger.info("Stopped profile file watcher")
-    
-    def _watch_loop(self):
-        """Main watcher loop"""
-        # Initial load
-        self._load_new_profiles()
-        
-        while self.running:
-            try:
-                # Check if file was modified
-                if os.path.exists(self.file_path):
-                    modified_time = os.path.getmtime(self.file_path)
-                    if modified_time > self.last_modified:
-                        logger.info(f"Profile file {self.file_path} was modified. Loading new profiles.")
-                        self._load_new_profiles()
-                        self.last_modified = modified_time
-            except Exception as e:
-                logger.error(f"Error watching profile file: {e}")
-                
-            # Check every 60 seconds
-            time.sleep(60)
-    
-    def _load_new_profiles(self):
-        """Load new profiles from the file"""
-        try:
-            if not os.path.exists(self.file_path):
-                logger.error(f"Profile file {self.file_path} does not exist")
-                return
-                
-            # Load state to get previously processed URLs
-            try:
-                from playwright_scrapper import load_state, save_state
-                state = load_state()
-                processed_urls = state.get("processed_urls", [])
-                
-                # Update the in-memory set with URLs from state
-                self.processed_urls.update(processed_urls)
-            except Exception as e:
-                logger.warning(f"Could not load state: {e}")
-                
-            with open(self.file_path, 'r') as f:
-                new_count = 0
-                for line in f:
-                    url = line.strip()
-                    if url and "/in/" in url and url not in self.processed_urls:
-                        self.profile_queue.put(url)
-                        self.processed_urls.add(url)
-                        new_count += 1
-            
-            # Save processed URLs back to state
-            try:
-                state = load_state()  # Reload to avoid overwriting other changes
-                state["processed_urls"] = list(self.processed_urls)
-                save_state(state)
-            except Exception as e:
-                logger.warning(f"Could not save state: {e}")
-            
-            if new_count > 0:
-                logger.info(f"Added {new_count} new profiles to the queue")
-        except Exception as e:
+import os
+import re
+import mmap
+import threading
+import time
+import logging
+import queue
+
+
+logger = logging.getLogger("ProfileWatcher")
+
+# The tail stops at quotes, brackets and markup so CSV/HTML/Markdown wrappers
+# around a URL aren't captured with it
+PROFILE_URL_RE = re.compile(rb'(?:https?://)?(?:[\w-]+\.)?linkedin\.com/in/[^\s,"\'<>()]+')
+
+
+def read_profile_urls(file_path):
+    """Return every LinkedIn profile URL in a file, scanned in one regex pass"""
+    with open(file_path, 'rb') as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            matches = PROFILE_URL_RE.findall(mm)
+    # page.goto needs an absolute URL
+    return [
+        url if url.startswith('http') else 'https://' + url
+        for url in (match.decode('utf-8', 'ignore') for match in matches)
+    ]
+
+
+def profile_slug(url):
+    """Reduce a profile URL to its canonical /in/<slug> key"""
+    slug = url.rsplit('/in/', 1)[-1]
+    slug = slug.split('?', 1)[0].split('#', 1)[0]
+    return slug.strip('/').lower()
+
+class ProfileFileWatcher:
+    """Watches a profile URL file for changes and loads new profiles"""
+    
+    def __init__(self, file_path, profile_queue, loop=None):
+        """Initialize the watcher; pass the loop that owns profile_queue if it is an asyncio.Queue"""
+        self.file_path = file_path
+        self.profile_queue = profile_queue
+        self.loop = loop
+        # Seen profiles keyed by slug, so scheme/host/trailing-slash variants
+        # of the same URL dedupe and the set holds only the short tail
+        self.processed_urls = set()
+        self.last_modified = 0
+        self.running = False
+        self.thread = None
+    
+    def start(self):
+        """Start the watcher thread"""
+        self.running = True
+        self.thread = threading.Thread(target=self._watch_loop, name="ProfileWatcher")
+        self.thread.daemon = True
+        self.thread.start()
+        logger.info(f"Started profile file watcher for {self.file_path}")
+    
+    def stop(self):
+        """Stop the watcher thread"""
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=2)
+        logger.info("Stopped profile file watcher")
+    
+    def _watch_loop(self):
+        """Main watcher loop"""
+        # Initial load
+        self._load_new_profiles()
+        
+        while self.running:
+            try:
+                # Check if file was modified
+                if os.path.exists(self.file_path):
+                    modified_time = os.path.getmtime(self.file_path)
+                    if modified_time > self.last_modified:
+                        logger.info(f"Profile file {self.file_path} was modified. Loading new profiles.")
+                        self._load_new_profiles()
+                        self.last_modified = modified_time
+            except Exception as e:
+                logger.error(f"Error watching profile file: {e}")
+                
+            # Check every 60 seconds
+            time.sleep(60)
+    
+    def mark_seen(self, urls):
+        """Record urls queued elsewhere so the watcher doesn't queue them again"""
+        self.processed_urls.update(map(profile_slug, urls))
+
+    def _enqueue(self, urls):
+        """Put urls on the profile queue"""
+        enqueue = self.profile_queue.put_nowait
+        for url in urls:
+            enqueue(url)
+
+    def _load_new_profiles(self):
+        """Load new profiles from the file"""
+        try:
+            if not os.path.exists(self.file_path):
+                logger.error(f"Profile file {self.file_path} does not exist")
+                return
+                
+            # Load state to get previously processed URLs
+            try:
+                from playwright_scrapper import load_state
+                state = load_state()
+                # Copy first: the scraping loop may add to the set meanwhile
+                processed_urls = list(state.get("processed_urls", []))
+                
+                # Update the in-memory set with URLs from state
+                self.processed_urls.update(map(profile_slug, processed_urls))
+            except Exception as e:
+                logger.warning(f"Could not load state: {e}")
+                
+            # Anti-join the whole file against the seen set with set operations
+            # instead of a per-URL membership test; dict keys keep file order
+            # and, for a repeated slug, the first URL the file lists
+            urls = read_profile_urls(self.file_path)
+            by_slug = {}
+            for slug, url in zip(map(profile_slug, urls), urls):
+                by_slug.setdefault(slug, url)
+            new_slugs = by_slug.keys() - self.processed_urls
+            new_urls = [url for slug, url in by_slug.items() if slug in new_slugs]
+            self.processed_urls |= new_slugs
+
+            if self.loop:
+                # asyncio.Queue isn't thread-safe; hand the batch to its loop
+                self.loop.call_soon_threadsafe(self._enqueue, new_urls)
+            else:
+                self._enqueue(new_urls)
+            new_count = len(new_urls)
+
+            # The state only records profiles once they are scraped (see
+            # scrape_profile); queued ones are remembered in processed_urls
+            if new_count > 0:
+                logger.info(f"Added {new_count} new profiles to the queue")
+        except Exception as e:
             logger.error(f"Error loading new profiles: {e}")
\ No newline at end of file
@@ -1,2558 +1,3252 @@
-import asyncio
-import random
-import re
-import json
-import os
-import logging
-import argparse
-import traceback
-import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-import polars as pl
-import threading
-import queue
-import signal
-import sys
-import re
-from bs4 import BeautifulSoup
-import traceback
-from file_watcher import ProfileFileWatcher
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("linkedin_scraper.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
-
-STATE_FILE = "linkedin_state.json"
-logging.getLogger().setLevel(logging.DEBUG)
-
-def load_state() -> dict:
-        if os.path.exists(STATE_FILE):
-            with open(STATE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
-
-def save_state(state: dict):
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-
-def parse_linkedin_timestamp(ts):
-    if not ts:
-        return None
-    try:
-        # ISO datetime
-        return datetime.fromisoformat(ts)
-    except Exception:
-        pass
-    # Relative dates like '2d', '3mo', '1yr'
-    match = re.match(r'(\d+)\s*(d|mo|yr)', ts)
-    if match:
-        num, unit = int(match.group(1)), match.group(2)
-        if unit == "d":
-            return datetime.now() - timedelta(days=num)
-        elif unit == "mo":
-            return datetime.now() - timedelta(days=num * 30)
-        elif unit == "yr":
-            return datetime.now() - timedelta(days=num * 365)
-    # If all fails
-    return None
-
-class PlaywrightProfileScraper:
-    """LinkedIn profile scraper using Playwright"""
-    def __init__(self, worker_id: int, credentials: Dict[str, str], proxy: Optional[str] = None, headless: bool = False):
-        """Initialize the scraper with credentials"""
-        self.worker_id = worker_id
-        self.email = credentials['email']
-        self.password = credentials['password']
-        self.proxy = proxy
-        self.headless = headless
-        self.browser = None
-        self.context = None
-        self.page = None
-        self.session_start_time = None
-        self.profiles_scraped = 0
-        self.max_profiles_per_session = random.randint(5, 10)  # Randomize session limits
-        self.session_duration_limit = timedelta(hours=random.uniform(2, 4))  # Random session duration
-        
-        # State tracking
-        self.is_logged_in = False
-        self.in_cooldown = False
-        self.cooldown_until = None
-        
-        # Configuration
-        self.config = {
-            'scrape_activity': True  # Whether to scrape activity (posts, comments)
-        }
-    
-    async def _is_authwall_present(self) -> bool:
-        """Detect if we’re stuck on an auth-wall or login page rather than seeing feed content."""
-        # 1) If we see the main feed container, we're good.
-        if await self.page.locator("div.feed-identity-module").count() > 0:
-            return False
-
-        # 2) If the login form or authwall overlay is visible, we're blocked
-        if await self.page.locator("form.login__form, div.authwall, div.sign-in-form").count() > 0:
-            return True
-
-        # 3) URL heuristics for checkpoints or authwalls
-        url = self.page.url.lower()
-        if any(token in url for token in ("checkpoint", "challenge", "authwall", "/login", "/signup")):
-            return True
-
-        # 4) Fallback: if we see the username field but aren't in feed
-        if await self.page.locator("#username").count() > 0:
-            return True
-
-        return False
-
-    async def save_cookies(self, context, path):
-        try:
-            cookies = await context.cookies()
-            with open(path, "w") as f:
-                json.dump(cookies, f)
-            logger.info(f"Worker {self.worker_id}: Cookies saved to {path}")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: Could not save cookies: {e}")
-
-    async def load_cookies(self, context, path):
-        try:
-            if os.path.exists(path) and os.path.getsize(path) > 0:
-                with open(path, "r") as f:
-                    cookies = json.load(f)
-                if cookies:  # Only load if cookies exist
-                    await context.add_cookies(cookies)
-                    logger.info(f"Worker {self.worker_id}: Cookies loaded from {path}")
-                    return True
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            logger.warning(f"Worker {self.worker_id}: Could not load cookies: {e}")
-        return False
-
-    def test_proxy(self, proxy_url):
-        """Test if a proxy is working"""
-        import requests
-        try:
-            proxies = {
-                'http': proxy_url,
-                'https': proxy_url
-            }
-            response = requests.get('https://httpbin.org/ip', proxies=proxies, timeout=10)
-            if response.status_code == 200:
-                logger.info(f"Proxy {proxy_url} is working")
-                return True
-        except Exception as e:
-            logger.warning(f"Proxy {proxy_url} failed test: {e}")
-        return False
-
-    async def initialize(self):
-        """Initialize Playwright browser, context, and optionally restore session via cookies."""
-        try:
-            # Launch Playwright
-            self.playwright = await async_playwright().start()
-
-            # Browser launch args
-            browser_args = [
-                '--no-sandbox',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor'
-            ]
-
-            proxy_config = None
-            if self.proxy:
-                logger.info(f"Worker {self.worker_id}: Testing proxy {self.proxy}")
-                if self.test_proxy(self.proxy):
-                    # Configure proxy for Playwright
-                    if self.proxy.startswith('http://') or self.proxy.startswith('https://'):
-                        proxy_parts = self.proxy.replace('http://', '').replace('https://', '').split(':')
-                        if len(proxy_parts) >= 2:
-                            proxy_config = {
-                                'server': f"http://{proxy_parts[0]}:{proxy_parts[1]}"
-                            }
-                            # Add authentication if provided
-                            if len(proxy_parts) >= 4:
-                                proxy_config['username'] = proxy_parts[2]
-                                proxy_config['password'] = proxy_parts[3]
-                else:
-                    logger.warning(f"Worker {self.worker_id}: Proxy failed test, proceeding without proxy")
-                    self.proxy = None
-
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=browser_args
-            )
-            if not self.browser:
-                logger.error(f"Worker {self.worker_id}: Failed to launch browser.")
-                await self.cleanup()
-                return False
-
-            # Randomize viewport & UA
-            viewport = random.choice([
-                {'width': 1366, 'height': 768},
-                {'width': 1440, 'height': 900},
-                {'width': 1536, 'height': 864},
-                {'width': 1680, 'height': 1050},
-                {'width': 1920, 'height': 1080}
-            ])
-
-            with open("userAgents.json", "r") as ua:
-                user_agents = json.load(ua)
-
-            user_agent = random.choice(user_agents)
-
-            # Create context
-            self.context = await self.browser.new_context(
-                viewport=viewport,
-                user_agent=user_agent,
-                locale="en-US",
-                timezone_id=random.choice([
-                    "America/New_York", "Europe/London", "Asia/Tokyo"
-                ]),
-                geolocation={"longitude": -122.084, "latitude": 37.422},
-                permissions=["geolocation"],
-                extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
-            )
-            if not self.context:
-                logger.error(f"Worker {self.worker_id}: Failed to create browser context.")
-                await self.cleanup()
-                return False
-
-            # Stealth
-            await self._apply_stealth_mode()
-
-            # New page
-            self.page = await self.context.new_page()
-            if not self.page:
-                logger.error(f"Worker {self.worker_id}: Failed to create browser page.")
-                await self.cleanup()
-                return False
-
-            self.page.set_default_timeout(30000)
-            self.page.on("console", lambda msg: logger.debug(f"Browser console: {msg.text}"))
-            self._check_cooldown_state()
-
-            if self.in_cooldown:
-                logger.info(f"Worker {self.worker_id}: In cooldown until {self.cooldown_until}")
-                return True
-
-            # --- Attempt to load cookies BEFORE any navigation ---
-            cookie_path = f"cookies_worker_{self.worker_id}.json"
-            cookies_loaded = await self.load_cookies(self.context, cookie_path)
-
-            self.session_start_time = datetime.now()
-            self.profiles_scraped = 0
-
-            # Always go to /feed and check login status
-            try:
-                await self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
-            except Exception as nav_ex:
-                logger.error(f"Worker {self.worker_id}: Couldn't reach feed page: {nav_ex}")
-                await self.cleanup()
-                return False
-
-            # Robust login/authwall check
-            if cookies_loaded and "feed" in self.page.url and not await self._is_authwall_present():
-                self.is_logged_in = True
-                logger.info(f"Worker {self.worker_id}: Session restored via cookies.")
-            else:
-                self.is_logged_in = False
-                logger.info(f"Worker {self.worker_id}: Not logged in, will perform fresh login.")
-
-            self.last_activity_time = datetime.now()
-            self._check_cooldown_state()
-
-            # Only start activity simulation if logged in and not in cooldown
-            if not self.in_cooldown and self.is_logged_in:
-                await self.start_activity_simulation()
-
-            return True  # So login() will run if not authenticated
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error initializing browser: {e}")
-            logger.debug(traceback.format_exc())
-            await self.cleanup()
-            return False
-
-    async def _apply_stealth_mode(self):
-        """Apply stealth mode to avoid detection"""
-        # JavaScript to modify navigator properties
-        await self.context.add_init_script("""
-        () => {
-            // Function to override property
-            const overrideProperty = (obj, propName, value) => {
-                Object.defineProperty(obj, propName, {
-                    value,
-                    writable: false,
-                    configurable: false,
-                    enumerable: true
-                });
-            };
-            
-            // WebDriver
-            overrideProperty(navigator, 'webdriver', false);
-            
-            // Plugins
-            overrideProperty(navigator, 'plugins', {
-                length: Math.floor(Math.random() * 5) + 3,
-                refresh: () => {},
-                item: () => {},
-                namedItem: () => {},
-                // Add some fake plugins
-                0: { name: 'Chrome PDF Plugin', description: 'Portable Document Format', filename: 'internal-pdf-viewer' },
-                1: { name: 'Chrome PDF Viewer', description: '', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
-                2: { name: 'Native Client', description: '', filename: 'internal-nacl-plugin' }
-            });
-            
-            // User agent components
-            const brands = [
-                { brand: 'Chromium', version: '115' },
-                { brand: 'Not:A-Brand', version: '8' },
-                { brand: 'Google Chrome', version: '115' }
-            ];
-            
-            // userAgentData
-            if (!navigator.userAgentData) {
-                overrideProperty(navigator, 'userAgentData', {
-                    brands,
-                    mobile: false,
-                    platform: 'Windows',
-                    toJSON: () => ({}),
-                    getHighEntropyValues: () => Promise.resolve({
-                        architecture: 'x86',
-                        bitness: '64',
-                        brands,
-                        mobile: false,
-                        model: '',
-                        platform: 'Windows',
-                        platformVersion: '10.0',
-                        uaFullVersion: '120.0.6099.109'
-                    })
-                });
-            }
-            
-            // Hardware concurrency
-            overrideProperty(navigator, 'hardwareConcurrency', Math.floor(Math.random() * 8) + 4);
-            
-            // Device memory
-            overrideProperty(navigator, 'deviceMemory', Math.pow(2, Math.floor(Math.random() * 4) + 4));
-            
-            // Languages
-            overrideProperty(navigator, 'languages', ['en-US', 'en']);
-            
-            // Add Chrome object
-            if (!window.chrome) {
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: () => {},
-                    csi: () => {},
-                    app: {}
-                };
-            }
-        }
-        """)
-
-    async def start_activity_simulation(self):
-        """Start a background task to keep the session alive with random activity"""
-        task = asyncio.create_task(self._activity_simulation_loop())
-        task.set_name(f"activity_simulation_{self.worker_id}")
-
-    async def _activity_simulation_loop(self):
-        """Loop that performs random human-like actions to keep the session alive"""
-        logger.info(f"Worker {self.worker_id}: Started activity simulation loop")
-        
-        while self.is_logged_in and not self.in_cooldown:
-            # Wait for a random interval (5-15 minutes between activities)
-            await asyncio.sleep(random.uniform(300, 900))
-            
-            if not self.is_logged_in or self.in_cooldown:
-                break
-                
-            try:
-                logger.info(f"Worker {self.worker_id}: Performing random activity to keep session alive")
-                
-                # Select a random activity
-                activities = [
-                    self._check_feed_activity,
-                    self._check_notifications_activity,
-                    self._check_my_network_activity,
-                    self._check_messaging_activity,
-                    self._visit_own_profile_activity
-                ]
-                
-                # Perform 1-2 random activities
-                for _ in range(random.randint(1, 2)):
-                    activity = random.choice(activities)
-                    await activity()
-                    await self._human_sleep(2, 5)
-                    
-            except Exception as e:
-                logger.error(f"Worker {self.worker_id}: Error in activity simulation: {e}")
-
-    async def _check_feed_activity(self):
-        """Check feed and scroll through it"""
-        try:
-            await self.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
-            await self._human_sleep(2, 4)
-            
-            # Scroll feed 2-5 times
-            scroll_count = random.randint(2, 5)
-            for _ in range(scroll_count):
-                scroll_amount = random.randint(300, 800)
-                await self.page.evaluate(f"window.scrollBy(0, {scroll_amount});")
-                await self._human_sleep(1, 3)
-                
-            logger.debug(f"Worker {self.worker_id}: Performed feed activity")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: Feed activity failed: {e}")
-
-    async def _check_notifications_activity(self):
-        """Check notifications"""
-        try:
-            # Click notifications icon
-            await self.page.click("a[data-test-global-nav-link='notifications']")
-            await self._human_sleep(2, 4)
-            
-            # Scroll through notifications
-            scroll_count = random.randint(1, 3)
-            for _ in range(scroll_count):
-                await self.page.evaluate("window.scrollBy(0, 300);")
-                await self._human_sleep(1, 2)
-                
-            # Click back to close
-            await self.page.click("body")
-            await self._human_sleep(1, 2)
-            
-            logger.debug(f"Worker {self.worker_id}: Performed notifications activity")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: Notifications activity failed: {e}")
-
-    async def _check_my_network_activity(self):
-        """Check my network page"""
-        try:
-            await self.page.click("a[data-test-global-nav-link='mynetwork']")
-            await self._human_sleep(2, 4)
-            
-            # Scroll through network page
-            scroll_count = random.randint(1, 3)
-            for _ in range(scroll_count):
-                await self.page.evaluate("window.scrollBy(0, 300);")
-                await self._human_sleep(1, 2)
-                
-            logger.debug(f"Worker {self.worker_id}: Performed my network activity")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: My network activity failed: {e}")
-
-    async def _check_messaging_activity(self):
-        """Check messaging page"""
-        try:
-            await self.page.click("a[data-test-global-nav-link='messaging']")
-            await self._human_sleep(2, 4)
-            
-            # Scroll through messages
-            await self.page.evaluate("window.scrollBy(0, 200);")
-            await self._human_sleep(1, 2)
-            
-            logger.debug(f"Worker {self.worker_id}: Performed messaging activity")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: Messaging activity failed: {e}")
-
-    async def _visit_own_profile_activity(self):
-        """Visit own profile"""
-        try:
-            # Click on profile picture/menu
-            await self.page.click("button.global-nav__me-photo")
-            await self._human_sleep(1, 2)
-            
-            # Click "View profile"
-            profile_link = await self.page.query_selector("a[href*='/in/'][data-link-to='profile']")
-            if profile_link:
-                await profile_link.click()
-                await self._human_sleep(3, 5)
-                
-                # Scroll profile
-                await self._scroll_page()
-                
-            logger.debug(f"Worker {self.worker_id}: Performed own profile visit activity")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: Own profile activity failed: {e}")
-
-    async def cleanup(self):
-        for task in asyncio.all_tasks():
-            if task.get_name().startswith(f"activity_simulation_{self.worker_id}"):
-                task.cancel()
-        try:
-            if self.page:
-                await self.page.close()
-                self.page = None
-            if self.context:
-                await self.context.close()
-                self.context = None
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            if hasattr(self, 'playwright') and self.playwright:
-                await self.playwright.stop()
-            logger.info(f"Worker {self.worker_id}: Resources cleaned up")
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error during cleanup: {e}")
-
-    async def login(self):
-        """Log into LinkedIn with robust session and authentication checks."""
-        # 1) Try to restore an existing session
-        try:
-            logger.info(f"Worker {self.worker_id}: Checking LinkedIn authentication status")
-            await self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
-        except Exception as e:
-            logger.warning(f"Worker {self.worker_id}: Could not reach feed page for session check: {e}")
-
-        # If feed loads and no auth-wall, we’re good
-        if "feed" in self.page.url and not await self._is_authwall_present():
-            logger.info(f"Worker {self.worker_id}: Session restored via cookies.")
-            self.is_logged_in = True
-            return True
-
-        # 2) Fresh login
-        logger.info(f"Worker {self.worker_id}: Performing fresh login")
-        await self.page.goto("https://www.linkedin.com/login", wait_until="networkidle")
-
-        # Enter email
-        logger.debug(f"Worker {self.worker_id}: Entering email")
-        await self.page.wait_for_selector("#username", state="visible", timeout=10000)
-        await self._human_type("#username", self.email)
-
-        # Enter password
-        logger.debug(f"Worker {self.worker_id}: Entering password")
-        await self._human_type("input[name='session_password']", self.password)
-
-        # Submit form
-        logger.debug(f"Worker {self.worker_id}: Submitting login form")
-        await self.page.click("button[type='submit']")
-        await self._human_sleep(3, 6)
-
-        # Handle 2FA or other challenges
-        await self._handle_verification()
-
-        # 3) Verify real authentication by revisiting the feed
-        await self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
-        if "feed" in self.page.url and not await self._is_authwall_present():
-            logger.info(f"Worker {self.worker_id}: Login succeeded")
-            self.is_logged_in = True
-
-            # Persist cookies for next run
-            cookie_path = f"cookies_worker_{self.worker_id}.json"
-            await self.save_cookies(self.context, cookie_path)
-            return True
-
-        # Login failed or hit auth-wall
-        logger.warning(f"Worker {self.worker_id}: Login failed or auth-wall detected. URL={self.page.url}")
-        self.is_logged_in = False
-        return False
-    
-    async def _handle_verification(self):
-        """Handle verification challenges if they appear"""
-        try:
-            # Check for security verification
-            if "checkpoint" in self.page.url or "challenge" in self.page.url:
-                logger.warning(f"Worker {self.worker_id}: Hit verification challenge: {self.page.url}")
-                
-                # Check for email verification option
-                try:
-                    email_button = await self.page.wait_for_selector("button[data-auth-method='EMAIL']", timeout=5000)
-                    if email_button:
-                        await email_button.click()
-                        logger.info(f"Worker {self.worker_id}: Selected email verification")
-                        await self._human_sleep(2, 3)
-                        
-                        # Click send code button
-                        send_button = await self.page.wait_for_selector("button[type='submit']", timeout=5000)
-                        if send_button:
-                            await send_button.click()
-                            logger.info(f"Worker {self.worker_id}: Requested verification code")
-                            
-                            # Get verification code from user
-                            code = input(f"Worker {self.worker_id}: Enter the verification code sent to your email: ")
-                            
-                            # Enter the code
-                            await self._human_type("#input__email_verification_pin", code)
-                            
-                            # Submit the form
-                            await self.page.click("button[type='submit']")
-                            await self._human_sleep(3, 5)
-                except Exception as e:
-                    logger.warning(f"Worker {self.worker_id}: Couldn't process email verification: {e}")
-                
-                # If we're still on a challenge page, ask for manual intervention
-                if "checkpoint" in self.page.url or "challenge" in self.page.url:
-                    logger.warning(f"Worker {self.worker_id}: Manual verification required")
-                    input(f"Worker {self.worker_id}: Please complete verification manually in the browser window and press Enter when done...")
-                
-                return True
-            
-            # Check for "Remember this device" prompt
-            try:
-                remember_button = await self.page.wait_for_selector(
-                    "button[data-litms-control-urn='remember_me_save']", 
-                    timeout=3000
-                )
-                if remember_button:
-                    await remember_button.click()
-                    logger.info(f"Worker {self.worker_id}: Clicked 'Remember this device'")
-                    await self._human_sleep(1, 2)
-            except:
-                pass
-            
-            # Check for premium offer or other popups
-            try:
-                dismiss_button = await self.page.wait_for_selector(
-                    "button.artdeco-modal__dismiss", 
-                    timeout=3000
-                )
-                if dismiss_button:
-                    await dismiss_button.click()
-                    logger.info(f"Worker {self.worker_id}: Dismissed modal popup")
-                    await self._human_sleep(1, 2)
-            except:
-                pass
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error handling verification: {e}")
-            return False
-    
-    async def scrape_profile(self, profile_url: str):
-        """Scrape a LinkedIn profile with robust error handling and processed URL tracking"""
-
-        if not self.session_start_time:
-            self.session_start_time = datetime.now()
-
-        # Check cooldown status first - if in cooldown, don't process anything
-        if self.in_cooldown:
-            if datetime.now() < self.cooldown_until:
-                remaining_time = (self.cooldown_until - datetime.now()).total_seconds()
-                logger.warning(f"Worker {self.worker_id}: In cooldown until {self.cooldown_until} ({remaining_time/3600:.1f} hours remaining)")
-                return None
-            else:
-                logger.info(f"Worker {self.worker_id}: Cooldown expired, resuming operations")
-                self.in_cooldown = False
-                # Clear cooldown state
-                state = load_state()
-                state[f"worker_{self.worker_id}_cooldown"] = {"in_cooldown": False, "cooldown_until": None}
-                save_state(state)
-
-        # Check if session needs to be refreshed
-        if (
-            datetime.now() - self.session_start_time > self.session_duration_limit or 
-            self.profiles_scraped >= self.max_profiles_per_session
-        ):
-            logger.info(f"Worker {self.worker_id}: Session limit reached. Reinitializing browser.")
-            await self.cleanup()
-            await self.initialize()
-
-        # Ensure logged in
-        if not self.is_logged_in:
-            login_success = await self.login()
-            if not login_success:
-                logger.error(f"Worker {self.worker_id}: Failed to login")
-                return None
-
-        # --- Skip if already processed ---
-        state = load_state()
-        if profile_url in state.get("processed_urls", []):
-            logger.info(f"Worker {self.worker_id}: Profile {profile_url} already processed, skipping.")
-            return None
-
-        # Get previous scraping state for this profile
-        profile_state = state.get(profile_url, {})
-        last_post_time = profile_state.get("last_post_time")
-        last_comment_time = profile_state.get("last_comment_time")
-        last_reaction_time = profile_state.get("last_reaction_time")
-
-        # Initialize profile data structure
-        profile_data = {
-            'basic_info': {},
-            'experience': [],
-            'scraped_at': datetime.now().isoformat(),
-            'profile_url': profile_url,
-            'scraper_worker_id': self.worker_id
-        }
-
-        try:
-            # Navigate to profile
-            logger.info(f"Worker {self.worker_id}: Navigating to {profile_url}")
-            await self.page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
-            await self._human_sleep(2, 4)
-
-            # Check if we need to handle sign-in wall
-            await self._handle_sign_in_wall()
-
-            # Scroll the page to trigger lazy loading
-            await self._scroll_page()
-
-            # Save page screenshot and source for debugging
-            if logger.level == logging.DEBUG:
-                content = await self.page.content()
-                with open(f"profile_source_{self.worker_id}.html", "w", encoding="utf-8") as f:
-                    f.write(content)
-
-            # Check for blocks or limits
-            if await self._check_for_blocks():
-                logger.warning(f"Worker {self.worker_id}: Detected block or limit")
-                self._enter_cooldown()
-                return None
-
-            # Extract profile sections
-            logger.info(f"Worker {self.worker_id}: Extracting profile data")
-            html = await self.page.content()
-            profile_data['basic_info'] = await self._extract_basic_info()
-            profile_data['experience'] = self._extract_experience(html)
-
-            # Extract activity data if configured
-            if self.config.get('scrape_activity', False):
-                logger.info(f"Worker {self.worker_id}: Extracting activity data")
-                activity_data, new_times = await self.scrape_user_activity(
-                    profile_url,
-                    last_post_time,
-                    last_comment_time,
-                    last_reaction_time
-                )
-                profile_data['activity'] = activity_data
-
-                # Save the latest timestamps for incremental scraping
-                state[profile_url] = new_times
-                save_state(state)
-
-            # Increment the profile count
-            self.profiles_scraped += 1
-
-            # Save the profile data
-            self._save_profile_data(profile_data)
-
-            # --- Mark as processed ---
-            if "processed_urls" not in state:
-                state["processed_urls"] = []
-            if profile_url not in state["processed_urls"]:
-                state["processed_urls"].append(profile_url)
-                save_state(state)
-
-            logger.info(f"Worker {self.worker_id}: Successfully scraped profile {profile_url}")
-
-            return profile_data
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error scraping profile {profile_url}: {e}")
-            logger.debug(traceback.format_exc())
-            return None
-
-    async def _handle_sign_in_wall(self):
-        """Handle the LinkedIn sign-in wall if it appears"""
-        try:
-            # Check if we hit a sign-in wall
-            sign_in_wall = await self.page.query_selector(".signin-content, .organic-signup-modal")
-            
-            if sign_in_wall:
-                logger.info(f"Worker {self.worker_id}: Hit sign-in wall, logging in again")
-                await self.login()
-                
-                # Navigate back to the profile
-                current_url = self.page.url
-                await self.page.goto(current_url, wait_until="domcontentloaded")
-                await self._human_sleep(2, 4)
-        except:
-            pass
-    
-    async def _scroll_page(self):
-        """Scroll the page to simulate human behavior and trigger lazy loading"""
-        # Get page dimensions
-        page_height = await self.page.evaluate("document.body.scrollHeight")
-        viewport_height = await self.page.evaluate("window.innerHeight")
-        
-        # Initial pause to let the page load
-        await self._human_sleep(2, 4)
-        
-        # Scroll down gradually with random pauses
-        current_position = 0
-        scroll_step = random.randint(int(viewport_height * 0.2), int(viewport_height * 0.8))
-        
-        while current_position < page_height:
-            # Calculate next position with variable step size
-            next_position = current_position + scroll_step
-            
-            # Scroll with smooth behavior
-            await self.page.evaluate(f"""
-                window.scrollTo({{
-                    top: {next_position},
-                    behavior: 'smooth'
-                }});
-            """)
-            
-            current_position = next_position
-            
-            # Random pause between scrolls
-            await self._human_sleep(0.7, 2.0)
-            
-            # Occasionally pause longer to simulate reading
-            if random.random() < 0.3:  # 30% chance
-                await self._human_sleep(1.5, 4.0)
-            
-            # Occasionally scroll back up slightly
-            if random.random() < 0.15:  # 15% chance
-                scroll_back = random.randint(100, 300)
-                current_position = max(0, current_position - scroll_back)
-                await self.page.evaluate(f"window.scrollTo(0, {current_position});")
-                await self._human_sleep(0.7, 1.5)
-            
-            # Update page height as it might have changed due to lazy loading
-            page_height = await self.page.evaluate("document.body.scrollHeight")
-            
-            # Update scroll step for variability
-            scroll_step = random.randint(int(viewport_height * 0.2), int(viewport_height * 0.8))
-        
-        # After reaching bottom, scroll back up partially
-        final_position = random.randint(int(page_height * 0.2), int(page_height * 0.5))
-        await self.page.evaluate(f"window.scrollTo(0, {final_position});")
-        await self._human_sleep(1.0, 2.5)
-    
-    async def _check_for_blocks(self):
-        """
-        Improved block/captcha detection:
-        - Checks for known block URLs.
-        - Checks for visible or structural CAPTCHA in HTML (not just the word).
-        - Only blocks on visible reCAPTCHA iframe.
-        - Logs findings for debugging.
-        """
-        try:
-            current_url = self.page.url.lower()
-            html = await self.page.content()
-            blocked = False
-
-            # 1. URL-based block detection (very reliable)
-            block_url_keywords = [
-                "/checkpoint", "/authwall", "/login", "/signup", "/challenge", "/verify"
-            ]
-            for kw in block_url_keywords:
-                if kw in current_url:
-                    logger.warning(f"Worker {self.worker_id}: Block detected by URL: '{kw}' in '{current_url}'")
-                    blocked = True
-
-            # 2. Visible reCAPTCHA iframe (not just present in DOM)
-            recaptcha_iframes = await self.page.query_selector_all('iframe[src*="recaptcha"]')
-            recaptcha_visible = False
-
-            for iframe in recaptcha_iframes:
-                box = await iframe.bounding_box()
-                if box and box['height'] > 20 and box['width'] > 20:
-                    recaptcha_visible = True
-                    break
-
-            if recaptcha_visible:
-                logger.warning(f"Worker {self.worker_id}: **Visible** reCAPTCHA iframe detected on the page")
-                blocked = True
-            elif recaptcha_iframes:
-                logger.info(f"Worker {self.worker_id}: reCAPTCHA iframe(s) present but not visible—continuing")
-
-            # 3. Common structural CAPTCHA triggers in HTML (not just the word)
-            if (
-                '<strong>reCAPTCHA</strong>' in html
-                or 'id="captcha"' in html
-                or 'class="g-recaptcha"' in html
-            ):
-                logger.warning(f"Worker {self.worker_id}: CAPTCHA widget detected in HTML")
-                blocked = True
-
-            # 4. Heuristic: page overlays asking to verify identity/human
-            if "please verify you are a human" in html.lower():
-                logger.warning(f"Worker {self.worker_id}: Human verification message found")
-                blocked = True
-
-            # 5. Save HTML for debugging if a block was detected
-            if blocked:
-                with open(f"debug_block_page_{self.worker_id}.html", "w", encoding="utf-8") as f:
-                    f.write(html)
-
-            return blocked
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error checking for blocks: {e}")
-            return False
-        
-    def _enter_cooldown(self, hours=None):
-        """
-        Enter a cooldown period to avoid detection
-        Optionally specify cooldown duration in hours, otherwise uses random default
-        """
-        if hours is None:
-            hours = random.uniform(2, 4)
-        
-        self.cooldown_until = datetime.now() + timedelta(hours=hours)
-        self.in_cooldown = True
-        
-        # Save the cooldown state to persist across restarts
-        try:
-            state = load_state()
-            state[f"worker_{self.worker_id}_cooldown"] = {
-                "in_cooldown": True,
-                "cooldown_until": self.cooldown_until.isoformat()
-            }
-            save_state(state)
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Failed to save cooldown state: {e}")
-        
-        logger.warning(f"Worker {self.worker_id}: Entering cooldown until {self.cooldown_until}")
-
-    def _check_cooldown_state(self):
-        """Check if worker should be in cooldown based on saved state"""
-        try:
-            state = load_state()
-            worker_state = state.get(f"worker_{self.worker_id}_cooldown", {})
-            
-            if worker_state.get("in_cooldown", False):
-                cooldown_until = datetime.fromisoformat(worker_state.get("cooldown_until", ""))
-                
-                if datetime.now() < cooldown_until:
-                    self.in_cooldown = True
-                    self.cooldown_until = cooldown_until
-                    logger.info(f"Worker {self.worker_id}: Restored cooldown state until {cooldown_until}")
-                else:
-                    # Cooldown expired
-                    self.in_cooldown = False
-                    self.cooldown_until = None
-                
-            # Clear the cooldown state
-            state[f"worker_{self.worker_id}_cooldown"] = {
-                "in_cooldown": False,
-                "cooldown_until": None
-            }
-            save_state(state)
-            
-            logger.info(f"Worker {self.worker_id}: Cooldown expired")
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error checking cooldown state: {e}")
-
-    async def refresh_session(self):
-        """Refresh the session to avoid timeouts/logouts"""
-        try:
-            logger.info(f"Worker {self.worker_id}: Refreshing session")
-
-            # Navigate to LinkedIn homepage
-            await self.page.goto("https://www.linkedin.com/", wait_until="domcontentloaded")
-            await self._human_sleep(2, 4)
-
-            # Check if we need to re-login
-            if await self._is_authwall_present():
-                logger.info(f"Worker {self.worker_id}: Session expired, logging in again")
-                await self.login()
-            else:
-                logger.info(f"Worker {self.worker_id}: Session still valid")
-                
-            # Save cookies to maintain session for next time
-            cookie_path = f"cookies_worker_{self.worker_id}.json"
-            await self.save_cookies(self.context, cookie_path)
-
-            # Reset session start time
-            self.session_start_time = datetime.now()
-            return True
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error refreshing session: {e}")
-            return False
-
-    async def _perform_random_actions(self):
-        """Perform random actions to simulate natural browsing"""
-        try:
-            actions = [
-                self._random_scroll_action,
-                self._check_notifications_action,
-                self._hover_random_elements_action
-            ]
-                    
-            # Choose 1-2 random actions
-            num_actions = random.randint(1, 2)
-            selected_actions = random.sample(actions, num_actions)
-            
-            for action in selected_actions:
-                await action()
-                await self._human_sleep(1, 3)
-                    
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error performing random actions: {e}")
-    
-    async def _random_scroll_action(self):
-        """Random scrolling action"""
-        try:
-            scroll_amount = random.randint(300, 800)
-            direction = random.choice([-1, 1])
-            await self.page.evaluate(f"window.scrollBy(0, {direction * scroll_amount});")
-            logger.debug(f"Worker {self.worker_id}: Performed random scroll")
-        except:
-            pass
-    
-    async def _check_notifications_action(self):
-        """Check notifications action"""
-        try:
-            # Try to find and click notifications icon
-            notif_icon = await self.page.query_selector("a[data-test-global-nav-link='notifications']")
-            if notif_icon:
-                await notif_icon.click()
-                await self._human_sleep(2, 4)
-                
-                # Click back to close
-                await self.page.click("body")
-                logger.debug(f"Worker {self.worker_id}: Checked notifications")
-        except:
-            pass
-    
-    async def _hover_random_elements_action(self):
-        """Hover over random elements action"""
-        try:
-            # Find all interactive elements
-            elements = await self.page.query_selector_all("a, button, [role='button']")
-            
-            if elements:
-                # Hover over 2-3 random elements
-                for _ in range(random.randint(2, 3)):
-                    element = random.choice(elements)
-                    await element.hover()
-                    await self._human_sleep(0.5, 1.5)
-                
-                logger.debug(f"Worker {self.worker_id}: Hovered over random elements")
-        except:
-            pass
-    
-    async def _scrape_contact_info_modal(self):
-        """
-        Parses the contact information from the modal dialog.
-        This function is designed to be called after the modal is visible.
-        """
-        contact_info = {}
-        try:
-            # Select all sections within the modal (e.g., for Profile, Email, etc.)
-            sections = await self.page.query_selector_all("section.pv-contact-info__contact-type")
-            
-            for section in sections:
-                # Get the header to identify the type of information
-                header_elem = await section.query_selector("h3.pv-contact-info__header")
-                if not header_elem:
-                    continue
-                
-                header_text = (await header_elem.inner_text()).strip()
-
-                # Extract data based on the header text
-                if "Profile" in header_text:
-                    link_elem = await section.query_selector("a")
-                    if link_elem:
-                        contact_info['linkedin_profile_url'] = await link_elem.get_attribute('href')
-                elif "Email" in header_text:
-                    email_elem = await section.query_selector("a")
-                    if email_elem:
-                        contact_info['email'] = (await email_elem.inner_text()).strip()
-                elif "Connected" in header_text:
-                    date_elem = await section.query_selector("span.t-14.t-black.t-normal")
-                    if date_elem:
-                        contact_info['connected_date'] = (await date_elem.inner_text()).strip()
-                # This can be extended for other fields like 'Phone', 'Website', etc.
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error parsing contact info modal: {e}")
-            
-        return contact_info
-
-    async def _extract_basic_info(self):
-        """Extracts basic profile information and clicks to reveal/scrape contact info."""
-        basic_info = {}
-        
-        try:
-            # --- Scrape Basic Info (Name, Headline, etc.) ---
-            name_elem = await self.page.query_selector("h1.t-24.v-align-middle")
-            if name_elem:
-                basic_info['name'] = (await name_elem.inner_text()).strip()
-
-            headline_elem = await self.page.query_selector(".text-body-medium.break-words")
-            if headline_elem:
-                basic_info['headline'] = (await headline_elem.inner_text()).strip()
-
-            location_elem = await self.page.query_selector(".text-body-small.inline.t-black--light.break-words")
-            if location_elem:
-                basic_info['location'] = (await location_elem.inner_text()).strip()
-                
-            # --- Click to Open and Scrape Contact Info Modal ---
-            try:
-                contact_info_link = await self.page.query_selector("a#top-card-text-details-contact-info")
-                if contact_info_link:
-                    await contact_info_link.click()
-                    
-                    # Wait for the modal to be visible
-                    await self.page.wait_for_selector("div.artdeco-modal__content section.pv-contact-info__contact-type", timeout=8000)
-                    
-                    # Use the new helper function to scrape the modal content
-                    contact_details = await self._scrape_contact_info_modal()
-                    basic_info.update(contact_details)
-                    
-                    # Close the modal
-                    close_button = await self.page.query_selector("button[aria-label='Dismiss']")
-                    if close_button:
-                        await close_button.click()
-                        await self.page.wait_for_timeout(1000) # Give it a moment to close
-                    
-                    logger.info(f"Worker {self.worker_id}: Successfully scraped contact details: {contact_details}")
-
-            except Exception as e:
-                logger.warning(f"Worker {self.worker_id}: Could not open or scrape contact info modal: {e}")
-
-            logger.info(f"Worker {self.worker_id}: Successfully extracted basic info.")
-            return basic_info
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: A critical error occurred in _extract_basic_info: {e}")
-            return basic_info
-
-    def safe_get_text(self, soup_elem):
-        return soup_elem.get_text(strip=True) if soup_elem else None
-       
-    def _is_grouped_experience(self, top_li):
-        """Check if this is a grouped experience (multiple roles at same company)"""
-        # Look for nested ul elements that contain multiple li items (roles)
-        nested_uls = top_li.find_all("ul", recursive=True)
-        for ul in nested_uls:
-            # Make sure this ul is a direct child structure of the top li
-            parent_li = ul.find_parent('li')
-            if parent_li == top_li:
-                role_lis = ul.find_all('li', recursive=False)
-                # Filter out non-role items (like skills sections)
-                actual_roles = []
-                for li in role_lis:
-                    # Check if this li contains a job title
-                    title_spans = li.select('span[aria-hidden="true"]')
-                    for span in title_spans:
-                        text = span.get_text(strip=True)
-                        # Skip if it looks like skills or other metadata
-                        if text and not any(skip_word in text.lower() for skip_word in ['skills', 'see more', '…see more']):
-                            # Check if parent structure suggests it's a job title
-                            parent_div = span.find_parent('div')
-                            if parent_div and ('hoverable-link-text' in parent_div.get('class', []) or 't-bold' in parent_div.get('class', [])):
-                                actual_roles.append(li)
-                                break
-                
-                if len(actual_roles) > 1:
-                    return True
-        return False
-
-    def _extract_role(self,li, is_ungrouped):
-        """Extract a single role from an li element"""
-        role = {
-            "title": None,
-            "dates": None,
-            "location": None
-        }
-        
-        # Extract job title - look for spans with aria-hidden="true" in hoverable-link-text divs
-        title_spans = li.select('div.hoverable-link-text.t-bold span[aria-hidden="true"]')
-        if not title_spans:
-            # Alternative selector for titles
-            title_spans = li.select('span[aria-hidden="true"]')
-            for span in title_spans:
-                text = span.get_text(strip=True)
-                if text and not any(skip_word in text.lower() for skip_word in ['skills', 'see more', '…see more', 'full-time', 'part-time', 'internship']):
-                    parent_div = span.find_parent('div')
-                    if parent_div and ('hoverable-link-text' in parent_div.get('class', []) or 't-bold' in parent_div.get('class', [])):
-                        role["title"] = text
-                        break
-        else:
-            role["title"] = title_spans[0].get_text(strip=True)
-        
-        if not role["title"]:
-            return None
-
-        # Extract dates and location using LinkedIn's standard structure
-        # LinkedIn typically structures role info as: Title -> Company/Duration -> Date -> Location
-        
-        # Get all text spans in order
-        all_spans = li.select('span[aria-hidden="true"]')
-        span_texts = []
-        
-        for span in all_spans:
-            text = span.get_text(strip=True)
-            if text:
-                span_texts.append(text)
-        
-        # Extract dates first - look for patterns with years, months, duration
-        date_patterns = ['present', '20', 'yr', 'mo', 'month', 'year', ' - ', '·']
-        for text in span_texts:
-            if text == role["title"]:
-                continue
-                
-            # Check if this looks like a date/duration
-            text_lower = text.lower()
-            has_date_indicators = any(pattern in text_lower for pattern in date_patterns)
-            
-            # Additional check for date format patterns
-            has_date_format = (
-                ('20' in text and len(text) > 4) or  # Contains year
-                (' - ' in text) or  # Date range
-                ('·' in text and ('yr' in text_lower or 'mo' in text_lower)) or  # Duration
-                'present' in text_lower
-            )
-            
-            if has_date_indicators and has_date_format and not role["dates"]:
-                role["dates"] = text
-                break
-        
-        # Extract location - it's typically the remaining text that's not title, dates, or company info
-        for text in span_texts:
-            if text == role["title"] or text == role.get("dates"):
-                continue
-                
-            # Skip company info patterns (contains employment type indicators)
-            if '·' in text and any(work_type in text.lower() for work_type in ['full-time', 'part-time', 'internship', 'contract']):
-                continue
-                
-            # Skip if it looks like a company name (no location-specific patterns)
-            text_lower = text.lower()
-            
-            # Generic location patterns (not hardcoded places)
-            location_patterns = [
-                '·', # Often separates location from work type
-                ',',  # City, State format
-                'area',  # Geographic area indicator
-                'region',  # Geographic region
-                'metroplex',  # Metro area
-                'remote',  # Work arrangement
-                'hybrid',  # Work arrangement
-                'on-site',  # Work arrangement
-                'onsite'  # Work arrangement
-            ]
-            
-            # Check if text has location-like patterns
-            has_location_pattern = any(pattern in text_lower for pattern in location_patterns)
-            
-            # Additional structural checks
-            is_likely_location = (
-                has_location_pattern or
-                (', ' in text and len(text.split(', ')) >= 2) or  # City, State pattern
-                text.endswith(' Area') or
-                text.endswith(' Region') or
-                text.endswith(' Metroplex') or
-                ('·' in text and not any(work_type in text_lower for work_type in ['full-time', 'part-time', 'internship']))
-            )
-            
-            if is_likely_location and not role["location"]:
-                role["location"] = text
-                break
-        
-        # Alternative approach: use caption wrappers which often contain structured data
-        if not role["dates"] or not role["location"]:
-            caption_spans = li.select('span.pvs-entity__caption-wrapper[aria-hidden="true"]')
-            
-            for i, span in enumerate(caption_spans):
-                text = span.get_text(strip=True)
-                if not text:
-                    continue
-                    
-                # First caption wrapper is usually dates
-                if i == 0 and not role["dates"]:
-                    # Check if it looks like a date
-                    if any(pattern in text.lower() for pattern in ['20', 'present', 'yr', 'mo', ' - ']):
-                        role["dates"] = text
-                        
-                # Second caption wrapper or non-date text is usually location
-                elif not role["location"]:
-                    # If it doesn't look like a date, treat as location
-                    if not any(pattern in text.lower() for pattern in ['20', 'present', 'yr', 'mo']) or '·' in text:
-                        role["location"] = text
-
-        return role
-    
-    def _find_experience_section(self,soup: BeautifulSoup):
-        """Find the experience section in the HTML"""
-        # Look for the section with id="experience" or containing "Experience" header
-        exp_section = soup.find('div', {'id': 'experience'})
-        if exp_section:
-            return exp_section.find_parent('section')
-        
-        # Fallback: look for headers containing "Experience"
-        headers = soup.find_all(['h2', 'h3'])
-        for h in headers:
-            if 'experience' in h.get_text(strip=True).lower():
-                return h.find_parent('section') or h.find_parent('div')
-        return None
-
-    def _extract_experience(self, html: str) -> Dict[str, Any]:
-        """Main function to extract all experience data"""
-        soup = BeautifulSoup(html, "html.parser")
-        experience = {}
-
-        exp_section = self._find_experience_section(soup)
-        if not exp_section:
-            return experience
-
-        exp_list = exp_section.find("ul")
-        if not exp_list:
-            return experience
-
-        # Get all top-level experience items
-        top_level_items = exp_list.find_all('li', recursive=False)
-        
-        for i, top_li in enumerate(top_level_items):
-            # Skip items that don't look like experience entries
-            if not top_li.select('div.hoverable-link-text'):
-                continue
-
-            company_name = None
-            company_url = None
-            total_period = None
-            company_location = None
-
-            # Extract company URL
-            company_link_elem = top_li.select_one("a.optional-action-target-wrapper")
-            if company_link_elem:
-                company_url = company_link_elem.get('href')
-
-            is_grouped = self._is_grouped_experience(top_li)
-
-            if is_grouped:
-                # For grouped experiences, extract company info from the top level
-                main_div = top_li.select_one("div.display-flex.flex-column.align-self-center.flex-grow-1")
-                if main_div:
-                    # Look for company name in hoverable-link-text spans
-                    company_elem = main_div.select_one("div.hoverable-link-text.t-bold span[aria-hidden='true']")
-                    if company_elem:
-                        company_name = company_elem.get_text(strip=True)
-
-                    # Look for total period and company location
-                    all_spans = main_div.select("span[aria-hidden='true']")
-                    for span in all_spans:
-                        text = span.get_text(strip=True)
-                        if not text:
-                            continue
-                            
-                        # Check for total period (duration)
-                        if ('yr' in text.lower() or 'mo' in text.lower() or 'year' in text.lower() or 'month' in text.lower()) and not total_period:
-                            total_period = text
-                        # Check for company location (not company name, not duration)
-                        elif not company_location and text != company_name and text != total_period:
-                            # Generic location pattern detection
-                            text_lower = text.lower()
-                            location_patterns = [
-                                'area', 'region', 'metroplex', 'county', 'district',
-                                'remote', 'hybrid', 'on-site', 'onsite',
-                                ',',  # Geographic separator
-                                '·'   # LinkedIn separator
-                            ]
-                            
-                            # Check if this looks like a location
-                            is_location = (
-                                any(pattern in text_lower for pattern in location_patterns) or
-                                (', ' in text and len(text.split(', ')) >= 2) or  # City, State format
-                                text.endswith(' Area') or
-                                text.endswith(' Region') or
-                                text.endswith(' Metroplex')
-                            )
-                            
-                            if is_location:
-                                company_location = text
-
-                company_key = company_name if company_name else f"company_{i}"
-                if company_key not in experience:
-                    experience[company_key] = {
-                        "company_url": company_url,
-                        "total_period": total_period,
-                        "positions": []
-                    }
-
-                # Extract individual roles from nested lists
-                nested_uls = top_li.find_all("ul", recursive=True)
-                for ul in nested_uls:
-                    if ul.find_parent('li') == top_li:
-                        for role_li in ul.find_all('li', recursive=False):
-                            role = self._extract_role(role_li, is_ungrouped=False)
-                            if role:
-                                # If role doesn't have location but company does, use company location
-                                if not role["location"] and company_location:
-                                    role["location"] = company_location
-                                experience[company_key]["positions"].append(role)
-            else:
-                # For ungrouped experiences, extract company info differently
-                # Look for company name in the span.t-14.t-normal text (like "Zinc Technologies · Internship")
-                company_span = top_li.select_one("span.t-14.t-normal span[aria-hidden='true']")
-                if company_span:
-                    company_text = company_span.get_text(strip=True)
-                    # Extract company name (before the · symbol)
-                    if '·' in company_text:
-                        company_name = company_text.split('·')[0].strip()
-                    else:
-                        company_name = company_text
-                
-                # If no company name found, use the job title as fallback
-                if not company_name:
-                    title_elem = top_li.select_one("div.hoverable-link-text.t-bold span[aria-hidden='true']")
-                    if title_elem:
-                        company_name = title_elem.get_text(strip=True)
-                
-                company_key = company_name if company_name else f"company_{i}"
-                
-                # For ungrouped, each top-level li is a separate company, so always create new entry
-                experience[company_key] = {
-                    "company_url": company_url,
-                    "total_period": total_period,
-                    "positions": []
-                }
-                
-                role = self._extract_role(top_li, is_ungrouped=True)
-                if role:
-                    experience[company_key]["positions"].append(role)
-
-        return experience
-        
-    async def _extract_education(self):
-        """Extract education information"""
-        education = []
-
-        try:
-            # Find the education section anchor by id
-            edu_section = await self.page.query_selector("div#education")
-            if edu_section:
-                # Try to click "show all education" if it exists
-                try:
-                    show_all = await self.page.query_selector(
-                        ".pvs-list__footer .artdeco-button"
-                    )
-                    if show_all:
-                        await show_all.click()
-                        await self._human_sleep(2, 3)
-                except Exception:
-                    pass
-
-                # Get the education list container: ul with a long class name
-                edu_list = await edu_section.evaluate_handle(
-                    '''node => node.parentElement.querySelector('ul.WgIFHisduBdzsrWAQusrmrSnsmWzyvZPoKDpc')'''
-                )
-                if edu_list:
-                    edu_items = await edu_list.query_selector_all(
-                        "li.artdeco-list__item"
-                    )
-                    for item in edu_items:
-                        try:
-                            edu = {}
-
-                            # School name
-                            school_elem = await item.query_selector(
-                                ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']"
-                            )
-                            if school_elem:
-                                edu['school'] = (await school_elem.inner_text()).strip()
-
-                            # Degree
-                            degree_elem = await item.query_selector(
-                                ".t-14.t-normal span[aria-hidden='true']"
-                            )
-                            if degree_elem:
-                                edu['degree'] = (await degree_elem.inner_text()).strip()
-
-                            # Date range
-                            date_elem = await item.query_selector(
-                                ".t-14.t-normal.t-black--light .pvs-entity__caption-wrapper[aria-hidden='true']"
-                            )
-                            if date_elem:
-                                edu['date_range'] = (await date_elem.inner_text()).strip()
-
-                            # Description (optional, e.g. coursework, activities)
-                            desc_elem = await item.query_selector(
-                                ".PmOOsbJzcyufrBWTZcPmdIKMvpIECBvYKLZYQ span[aria-hidden='true']"
-                            )
-                            if desc_elem:
-                                edu['description'] = (await desc_elem.inner_text()).strip()
-
-                            education.append(edu)
-
-                        except Exception as ex:
-                            logger.error(f"Worker {self.worker_id}: Error extracting individual education: {ex}")
-
-                # Close the modal if it was opened
-                try:
-                    close_button = await self.page.query_selector("button.artdeco-modal__dismiss")
-                    if close_button:
-                        await close_button.click()
-                        await self._human_sleep(1, 2)
-                except Exception:
-                    pass
-
-            return education
-
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error extracting education section: {e}")
-            return education
-    
-    async def _extract_certifications(self):
-        """Extract certifications"""
-        certifications = []
-        
-        try:
-            # Find the certifications section
-            cert_section = await self.page.query_selector("section#certifications")
-            
-            if cert_section:
-                cert_items = await cert_section.query_selector_all(".pvs-list__item-container")
-                
-                for item in cert_items:
-                    try:
-                        cert = {}
-                        
-                        # Name
-                        name_elem = await item.query_selector(".t-bold span[aria-hidden='true']")
-                        if name_elem:
-                            cert['name'] = await name_elem.inner_text()
-                        
-                        # Issuer
-                        issuer_elem = await item.query_selector(".t-normal.t-black--light span[aria-hidden='true']")
-                        if issuer_elem:
-                            cert['issuer'] = await issuer_elem.inner_text()
-                        
-                        # Date
-                        date_elements = await item.query_selector_all(".t-normal.t-black--light span[aria-hidden='true']")
-                        if len(date_elements) > 1:
-                            cert['date'] = await date_elements[1].inner_text()
-                        
-                        certifications.append(cert)
-                        
-                    except Exception as ex:
-                        logger.error(f"Worker {self.worker_id}: Error extracting certification: {ex}")
-            
-            return certifications
-            
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error extracting certifications: {e}")
-            return certifications
-
-    async def scrape_user_activity(self, profile_url, last_post_time=None, last_comment_time=None, last_reaction_time=None):
-        """
-        Scrapes a user's activity incrementally. It gets posts from the '/all' endpoint
-        and then navigates directly to the specific URLs for comments and reactions.
-        Returns both the activity_data dict and a new_times dict for state saving.
-        """
-        logger.info(f"[STATE] {profile_url}: last_post_time={last_post_time}, last_comment_time={last_comment_time}, last_reaction_time={last_reaction_time}")
-
-        activity_data = {
-            'posts': [],
-            'comments': [],
-            'reactions': [],
-            'scraped_at': datetime.now().isoformat()
-        }
-        new_times = {
-            "last_post_time": last_post_time,
-            "last_comment_time": last_comment_time,
-            "last_reaction_time": last_reaction_time
-        }
-
-        base_url = profile_url.rstrip('/')
-
-        try:
-            # --- 1. Scrape Posts from the '/all' Activity View ---
-            all_activity_url = f"{base_url}/recent-activity/all/"
-            print(f"Navigating to the 'All' activity feed for posts: {all_activity_url}")
-            await self.page.goto(all_activity_url, wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
-
-            no_activity = await self.page.query_selector(".pv-recent-activity-empty-container")
-            if not no_activity:
-                posts, most_recent_post_time = await self._extract_posts(since_timestamp=last_post_time)
-                activity_data['posts'] = posts
-                if most_recent_post_time:
-                    new_times["last_post_time"] = most_recent_post_time
-            else:
-                logger.info("No activity found on the profile.")
-
-            # --- 2. Scrape Comments from its Direct URL ---
-            comments_url = f"{base_url}/recent-activity/comments/"
-            print(f"Navigating directly to Comments: {comments_url}")
-            await self.page.goto(comments_url, wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
-
-            no_activity = await self.page.query_selector(".pv-recent-activity-empty-container")
-            if not no_activity:
-                comments, most_recent_comment_time = await self._extract_comments(since_timestamp=last_comment_time)
-                activity_data['comments'] = comments
-                if most_recent_comment_time:
-                    new_times["last_comment_time"] = most_recent_comment_time
-            else:
-                logger.info("No comment activity found.")
-
-            # --- 3. Scrape Reactions from its Direct URL ---
-            reactions_url = f"{base_url}/recent-activity/reactions/"
-            print(f"Navigating directly to Reactions: {reactions_url}")
-            await self.page.goto(reactions_url, wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
-
-            no_activity = await self.page.query_selector(".pv-recent-activity-empty-container")
-            if not no_activity:
-                reactions, most_recent_reaction_time = await self._extract_reactions(since_timestamp=last_reaction_time)
-                activity_data['reactions'] = reactions
-                if most_recent_reaction_time:
-                    new_times["last_reaction_time"] = most_recent_reaction_time
-            else:
-                logger.info("No reaction activity found.")
-
-            print("Successfully completed all activity scraping.")
-            return activity_data, new_times
-
-        except Exception as e:
-            logger.error(f"A critical error occurred in scrape_user_activity: {e}")
-            return activity_data, new_times
-
-    async def _extract_posts(self, since_timestamp=None, max_posts=None):
-        """
-        High-performance extractor for the 'Posts' tab.
-        Only returns posts newer than since_timestamp (if set).
-        Returns: (filtered_posts, most_recent_time_iso)
-        """
-        await self.efficient_scroll_page(self.page)
-        try:
-            print(" Starting high-performance post extraction with all selectors...")
-
-            extraction_script = """
-                () => {
-                    // Gather all possible post containers (li, div, and data-urn)
-                    const post_cards = [
-                        ...document.querySelectorAll('ul.display-flex.flex-wrap.list-style-none.justify-center > li'),
-                        ...document.querySelectorAll('li.artdeco-list__item'),
-                        ...document.querySelectorAll('div.fie-impression-container'),
-                        ...document.querySelectorAll('div[data-urn^="urn:li:activity:"]')
-                    ];
-                    const seen = new Set();
-                    const posts = [];
-
-                    // Helper functions
-                    const getText = (element, selectors) => {
-                        for (const selector of selectors) {
-                            const el = element.querySelector(selector);
-                            if (el) return (el.innerText || el.textContent).trim();
-                        }
-                        return '';
-                    };
-                    const getAttr = (element, selectors, attr) => {
-                        for (const selector of selectors) {
-                            const el = element.querySelector(selector);
-                            if (el) return el.getAttribute(attr);
-                        }
-                        return '';
-                    };
-
-                    for (const card of post_cards) {
-                        // Deduplicate by data-urn if present
-                        const postUrn = getAttr(card, ['.feed-shared-update-v2', '[data-urn^="urn:li:activity:"]'], 'data-urn');
-                        if (postUrn && seen.has(postUrn)) continue;
-                        if (postUrn) seen.add(postUrn);
-
-                        // Repost detection
-                        const repostHeaderText = getText(card, [
-                            '.update-components-header__text-view',
-                            '.feed-shared-actor__meta--repost',
-                            '.update-components-actor__sub-description'
-                        ]);
-                        const isRepost = repostHeaderText.toLowerCase().includes('reposted this') ||
-                                        repostHeaderText.toLowerCase().includes('reshared this') ? 1 : 0;
-
-                        // Author
-                        const authorNameSelectors = [
-                            '.update-components-actor__title span[dir="ltr"] span[aria-hidden="true"]',
-                            '.update-components-actor__name',
-                            '.feed-shared-actor__name'
-                        ];
-                        const authorUrlSelectors = [
-                            '.update-components-actor__meta-link',
-                            '.update-components-actor__image',
-                            '.feed-shared-actor__container-link'
-                        ];
-                        const postTextSelectors = [
-                            '.update-components-update-v2__commentary .update-components-text',
-                            '.feed-shared-update-v2__description',
-                            '.feed-shared-text',
-                            '.update-components-text',
-                            '.feed-shared-article__description',
-                            '.feed-shared-external-video__description',
-                            '.feed-shared-linkedin-video__description'
-                        ];
-                        const timestampSelectors = [
-                            '.update-components-actor__sub-description span[aria-hidden="true"]',
-                            '.feed-shared-actor__sub-description span[aria-hidden="true"]'
-                        ];
-
-                        const authorName = getText(card, authorNameSelectors);
-                        let authorUrl = getAttr(card, authorUrlSelectors, 'href');
-                        if (authorUrl && authorUrl.startsWith('/')) {
-                            authorUrl = 'https://www.linkedin.com' + authorUrl;
-                        }
-                        const postText = getText(card, postTextSelectors);
-                        const timestampText = getText(card, timestampSelectors);
-
-                        // Post URL from data-urn
-                        const postUrl = postUrn ? `https://www.linkedin.com/feed/update/${postUrn}` : '';
-
-                        const timestamp = timestampText.split('•')[0].trim();
-
-                        // --- Engagement Metrics from both sides ---
-                        // LEFT: reactions (likes)
-                        let leftReactions = '';
-                        const leftReactionsElem = card.querySelector('.social-details-social-counts__reactions--left-aligned .social-details-social-counts__reactions-count');
-                        if (leftReactionsElem) {
-                            leftReactions = leftReactionsElem.innerText.trim();
-                        }
-
-                        // RIGHT: reposts/shares/comments
-                        let rightReposts = '';
-                        let rightComments = '';
-                        const rightItems = card.querySelectorAll('.social-details-social-counts__item--right-aligned');
-                        rightItems.forEach(item => {
-                            const text = item.innerText.trim();
-                            if (/repost|share/i.test(text)) {
-                                rightReposts = text.replace(/[^0-9]/g, '');
-                            }
-                            if (/comment/i.test(text)) {
-                                rightComments = text.replace(/[^0-9]/g, '');
-                            }
-                        });
-
-                        // Fallback: also parse the general engagement text as before
-                        const engagementText = getText(card, [
-                            '.social-details-social-counts',
-                            '.feed-shared-social-counts'
-                        ]);
-                        const likesMatch = engagementText.match(/([\\d,.]+\\w*)\\s*(like|reaction)/i);
-                        const commentsMatch = engagementText.match(/([\\d,.]+\\w*)\\s*comment/i);
-                        const sharesMatch = engagementText.match(/([\\d,.]+\\w*)\\s*(repost|share)/i);
-
-                        // Combine all sources, prefer left/right if available, else fallback to regex
-                        const engagement = {
-                            likes: leftReactions || (likesMatch ? likesMatch[1] : '0'),
-                            comments: rightComments || (commentsMatch ? commentsMatch[1] : '0'),
-                            shares: rightReposts || (sharesMatch ? sharesMatch[1] : '0')
-                        };
-
-                        // Media selectors
-                        const media = [];
-                        const imageElements = card.querySelectorAll(
-                            '.update-components-image__image, .feed-shared-image__image, .feed-shared-image img'
-                        );
-                        imageElements.forEach(img => {
-                            if (img.src) media.push({ type: 'image', url: img.src });
-                        });
-                        if (card.querySelector('.update-components-linkedin-video, .feed-shared-video, .feed-shared-external-video')) {
-                            media.push({ type: 'video', present: true });
-                        }
-
-                        // Only add if we have a post URL (guarantees uniqueness and validity)
-                        if (postUrl) {
-                            posts.push({
-                                reposted: isRepost,
-                                author_name: authorName,
-                                author_url: authorUrl,
-                                url: postUrl,
-                                text: postText,
-                                timestamp: timestamp,
-                                engagement: engagement,
-                                media: media
-                            });
-                        }
-                    }
-                    return posts;
-                }
-            """
-
-            posts_data = await self.page.evaluate(extraction_script)
-            if max_posts is not None:
-                posts_data = posts_data[:max_posts]
-            print(f"✅ Successfully extracted {len(posts_data)} posts with all selectors.")
-
-            # --- Incremental filtering ---
-            filtered = []
-            most_recent = None
-
-            cutoff = parse_linkedin_timestamp(since_timestamp) if since_timestamp else None
-
-            for post in posts_data:
-                post_time = parse_linkedin_timestamp(post.get('timestamp'))
-                if cutoff and post_time and post_time <= cutoff:
-                    continue
-                filtered.append(post)
-                if not most_recent or (post_time and post_time > most_recent):
-                    most_recent = post_time
-                if max_posts and len(filtered) >= max_posts:
-                    break
-
-            return filtered, most_recent.isoformat() if most_recent else None
-
-        except Exception as e:
-            logger.error(f"Error during universal post extraction: {e}")
-            return [], None
-
-    async def efficient_scroll_page(self, page, max_scrolls=100, scroll_pause=1, patience=3):
-        """
-        Scrolls the main page efficiently and patiently to ensure all activity cards are loaded.
-        Stops early if 0 cards are found for 'patience' consecutive scrolls.
-        This is the correct method for the 'Comments' activity feed.
-        """
-        last_count = 0
-        stagnant_scrolls = 0
-        zero_scrolls = 0  # Tracks consecutive zero-card scrolls
-
-        print("🔁 Starting smart scroll of the main page to load all activity cards...")
-
-        for i in range(max_scrolls):
-            # 1. Count the number of loaded activity cards
-            current_count = await page.evaluate(
-                "document.querySelectorAll('ul.display-flex.flex-wrap.list-style-none.justify-center > li').length"
-            )
-            
-            print(f"Scroll {i+1}/{max_scrolls}: Found {current_count} cards (previously {last_count}).")
-
-            # Stop if 0 cards found for 'patience' consecutive scrolls
-            if current_count == 0:
-                zero_scrolls += 1
-                if zero_scrolls >= patience:
-                    print(f"No cards found for {patience} consecutive scrolls. Stopping scroll.")
-                    break
-            else:
-                zero_scrolls = 0
-
-            # Check if scrolling has stalled (no new cards loaded for 'patience' scrolls)
-            if current_count == last_count and last_count > 0:
-                stagnant_scrolls += 1
-                if stagnant_scrolls >= patience:
-                    print(f"No new cards loaded for {patience} consecutive scrolls. Assuming all are loaded.")
-                    break
-            else:
-                stagnant_scrolls = 0  # Reset if new content is found
-
-            last_count = current_count
-
-            # 3. Scroll to bottom
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-
-            # 4. Wait for new content to load
-            await asyncio.sleep(scroll_pause)
-
-        print(f"🏁 Finished scrolling. A total of {last_count} cards are loaded and ready for extraction.")
-
-
-    async def _extract_comments(self, since_timestamp=None, max_comments=None):
-        """
-        High-performance extractor for the 'Comments' activity tab.
-        Returns only comments newer than since_timestamp, plus most recent ISO time.
-        """
-        await self.efficient_scroll_page(self.page)
-        try:
-            print("Starting high-performance comment extraction with all selectors...")
-
-            extraction_script = """
-                () => {
-                    // Gather all possible comment containers (li, div, and data-urn)
-                    const cards = [
-                        ...document.querySelectorAll('ul.display-flex.flex-wrap.list-style-none.justify-center > li'),
-                        ...document.querySelectorAll('li.artdeco-list__item'),
-                        ...document.querySelectorAll('div.fie-impression-container'),
-                        ...document.querySelectorAll('div[data-urn^="urn:li:activity:"]')
-                    ];
-                    const seen = new Set();
-                    const comments = [];
-
-                    // Helper functions with fallback logic
-                    const getText = (element, selectors) => {
-                        for (const selector of selectors) {
-                            const el = element.querySelector(selector);
-                            if (el) return (el.innerText || el.textContent).trim();
-                        }
-                        return '';
-                    };
-                    const getAttr = (element, selectors, attr) => {
-                        for (const selector of selectors) {
-                            const el = element.querySelector(selector);
-                            if (el) return el.getAttribute(attr);
-                        }
-                        return '';
-                    };
-
-                    for (const card of cards) {
-                        // Deduplicate by data-urn if present
-                        const postUrn = getAttr(card, ['.feed-shared-update-v2', '[data-urn^="urn:li:activity:"]'], 'data-urn');
-                        if (postUrn && seen.has(postUrn)) continue;
-                        if (postUrn) seen.add(postUrn);
-
-                        // --- Post Owner Details (with fallbacks) ---
-                        const postOwnerName = getText(card, [
-                            '.update-components-actor__title span[aria-hidden="true"]',
-                            '.feed-shared-actor__name',
-                            '.update-components-actor__name'
-                        ]);
-                        const postOwnerUrl = getAttr(card, [
-                            '.update-components-actor__meta-link',
-                            '.feed-shared-actor__container-link'
-                        ], 'href');
-
-                        // --- Post URL (most reliable method) ---
-                        const postUrl = postUrn ? `https://www.linkedin.com/feed/update/${postUrn}` : '';
-
-                        // --- Parent Post Text (fallbacks for various layouts) ---
-                        const parentPostText = getText(card, [
-                            '.feed-shared-update-v2__description .update-components-text',
-                            '.feed-shared-update-v2__description',
-                            '.feed-shared-text',
-                            '.update-components-text'
-                        ]);
-
-                        // --- Your Comment Details (with fallbacks) ---
-                        const yourCommentText = getText(card, [
-                            'article.comments-comment-entity .comments-comment-item__main-content span[dir="ltr"]',
-                            'article.comments-comment-entity .update-components-text',
-                            '.comments-comment-entity .update-components-text',
-                            'article.comments-comment-entity .comments-comment-item__main-content',
-                            '.comments-comment-item__main-content span[aria-hidden="true"]'
-                        ]);
-                        const yourCommentTimestamp = getText(card, [
-                            'article.comments-comment-entity time.comments-comment-meta__data',
-                            'time.comments-comment-meta__data',
-                            '.comments-comment-entity time',
-                            'time'
-                        ]);
-
-                        // Filter out cards that are not valid comment activities
-                        // Both your comment text and the post owner's name should exist
-                        if (yourCommentText && postOwnerName) {
-                            comments.push({
-                                "post_owner_name": postOwnerName,
-                                "post_owner_url": postOwnerUrl,
-                                "post_url": postUrl,
-                                "parent_post_text": parentPostText,
-                                "text": yourCommentText,
-                                "timestamp": yourCommentTimestamp,
-                            })
-                        }
-                    }
-                    return comments;
-                }
-            """
-
-            comments = await self.page.evaluate(extraction_script)
-            if max_comments is not None:
-                comments = comments[:max_comments]
-            print(f"Successfully extracted {len(comments)} comments using all selectors.")
-
-            # --- Incremental filtering ---
-            filtered = []
-            most_recent = None
-
-            cutoff = parse_linkedin_timestamp(since_timestamp) if since_timestamp else None
-            for comment in comments:
-                comment_time = parse_linkedin_timestamp(comment.get('timestamp'))
-                if cutoff and comment_time and comment_time <= cutoff:
-                    continue
-                filtered.append(comment)
-                if not most_recent or (comment_time and comment_time > most_recent):
-                    most_recent = comment_time
-                if max_comments and len(filtered) >= max_comments:
-                    break
-
-            return filtered, most_recent.isoformat() if most_recent else None
-
-        except Exception as e:
-            logger.error(f"Error during high-performance extraction: {e}")
-            return [], None
-
-    async def _extract_reactions(self, since_timestamp=None, max_reactions=None):
-        """
-        High-performance extractor for the 'Reactions' activity tab.
-        Returns only reactions newer than since_timestamp, plus most recent ISO time.
-        """
-        await self.efficient_scroll_page(self.page)
-        try:
-            print("Starting high-performance reaction extraction with all selectors...")
-
-            extraction_script = """
-                () => {
-                    // Gather all possible reaction containers (li, div, and data-urn)
-                    const cards = [
-                        ...document.querySelectorAll('ul.display-flex.flex-wrap.list-style-none.justify-center > li'),
-                        ...document.querySelectorAll('li.artdeco-list__item'),
-                        ...document.querySelectorAll('div.fie-impression-container'),
-                        ...document.querySelectorAll('div[data-urn^="urn:li:activity:"]')
-                    ];
-                    const seen = new Set();
-                    const reactions = [];
-
-                    // Helper functions with fallback logic
-                    const getText = (element, selectors) => {
-                        for (const selector of selectors) {
-                            const el = element.querySelector(selector);
-                            if (el) return (el.innerText || el.textContent).trim();
-                        }
-                        return '';
-                    };
-                    const getAttr = (element, selectors, attr) => {
-                        for (const selector of selectors) {
-                            const el = element.querySelector(selector);
-                            if (el) return el.getAttribute(attr);
-                        }
-                        return '';
-                    };
-
-                    for (const card of cards) {
-                        // Deduplicate by data-urn if present
-                        const postUrn = getAttr(card, ['.feed-shared-update-v2', '[data-urn^="urn:li:activity:"]'], 'data-urn');
-                        if (postUrn && seen.has(postUrn)) continue;
-                        if (postUrn) seen.add(postUrn);
-
-                        // --- Post Owner Details (with fallbacks) ---
-                        const postOwnerName = getText(card, [
-                            '.update-components-actor__title span[aria-hidden="true"]',
-                            '.feed-shared-actor__name',
-                            '.update-components-actor__name'
-                        ]);
-                        const postOwnerUrl = getAttr(card, [
-                            '.update-components-actor__meta-link',
-                            '.feed-shared-actor__container-link'
-                        ], 'href');
-
-                        // --- Post URL (most reliable method) ---
-                        const postUrl = postUrn ? `https://www.linkedin.com/feed/update/${postUrn}` : '';
-
-                        // --- Post Text (fallbacks for various layouts) ---
-                        const postText = getText(card, [
-                            '.feed-shared-update-v2__description .update-components-text',
-                            '.feed-shared-update-v2__description',
-                            '.feed-shared-text',
-                            '.update-components-text'
-                        ]);
-
-                        // --- Timestamp (with fallbacks) ---
-                        const timestampText = getText(card, [
-                            '.update-components-actor__sub-description span[aria-hidden="true"]',
-                            '.feed-shared-actor__sub-description span[aria-hidden="true"]'
-                        ]);
-                        const timestamp = timestampText.split('•')[0].trim();
-
-                        // Only add if we have a post owner and a post URL
-                        if (postOwnerName && postUrl) {
-                            reactions.push({
-                                post_owner_name: postOwnerName,
-                                post_owner_url: postOwnerUrl,
-                                post_url: postUrl,
-                                post_text: postText,
-                                timestamp: timestamp
-                            });
-                        }
-                    }
-                    return reactions;
-                }
-            """
-
-            reactions_data = await self.page.evaluate(extraction_script)
-            if max_reactions is not None:
-                reactions_data = reactions_data[:max_reactions]
-            print(f"✅ Successfully extracted {len(reactions_data)} reactions with all selectors.")
-
-            # --- Incremental filtering ---
-            filtered = []
-            most_recent = None
-
-            cutoff = parse_linkedin_timestamp(since_timestamp) if since_timestamp else None
-
-            for reaction in reactions_data:
-                reaction_time = parse_linkedin_timestamp(reaction.get('timestamp'))
-                if cutoff and reaction_time and reaction_time <= cutoff:
-                    continue
-                filtered.append(reaction)
-                if not most_recent or (reaction_time and reaction_time > most_recent):
-                    most_recent = reaction_time
-                if max_reactions and len(filtered) >= max_reactions:
-                    break
-
-            return filtered, most_recent.isoformat() if most_recent else None
-
-        except Exception as e:
-            logger.error(f"Error during universal reaction extraction: {e}")
-            return [], None
-
-    def _save_profile_data(self, profile_data):
-        """Save profile data to a JSON file"""
-        try:
-            if not profile_data:
-                return
-                
-            # Create directory if it doesn't exist
-            os.makedirs("linkedin_data", exist_ok=True)
-            
-            # Create filename from name or URL
-            if 'basic_info' in profile_data and 'name' in profile_data['basic_info'] and profile_data['basic_info']['name']:
-                safe_name = re.sub(r'[^\w\s-]', '', profile_data['basic_info']['name'])
-                safe_name = re.sub(r'[\s-]+', '_', safe_name).strip('_').lower()
-                filename = f"linkedin_data/profile_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            else:
-                # Extract username from URL
-                username = re.search(r'/in/([^/]+)/?', profile_data['profile_url'])
-                if username:
-                    filename = f"linkedin_data/profile_{username.group(1)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                else:
-                    # Use timestamp if no username or name available
-                    filename = f"linkedin_data/profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"Worker {self.worker_id}: Saved profile data to {filename}")
-            
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error saving profile data: {e}")
-    
-    async def _human_sleep(self, min_seconds, max_seconds):
-        """Sleep for a random duration to mimic human behavior"""
-        sleep_time = random.uniform(min_seconds, max_seconds)
-        await asyncio.sleep(sleep_time)
-    
-    async def _human_type(self, selector, text):
-        """Type text like a human with variable speed and occasional mistakes"""
-        try:
-            # Find the element
-            element = await self.page.query_selector(selector)
-            if not element:
-                logger.error(f"Worker {self.worker_id}: Element not found for typing: {selector}")
-                return
-            
-            # Clear the field first
-            await element.click()
-            await element.focus()
-            
-            # Type with human-like variations
-            for i, char in enumerate(text):
-                # Occasionally add a typo and then correct it
-                if random.random() < 0.03 and i < len(text) - 1:  # 3% chance of typo
-                    typo_char = random.choice('qwertyuiop[]asdfghjkl;\'zxcvbnm,./1234567890-=')
-                    await self.page.keyboard.type(typo_char)
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
-                    await self.page.keyboard.press("Backspace")
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
-                
-                # Type the character
-                await self.page.keyboard.type(char)
-                
-                # Variable delay between keystrokes
-                if char in ' .,;:?!':  # Longer pauses after punctuation
-                    await asyncio.sleep(random.uniform(0.1, 0.4))
-                else:
-                    await asyncio.sleep(random.uniform(0.05, 0.15))
-                
-                # Occasionally pause longer to simulate thinking
-                if random.random() < 0.02:  # 2% chance to pause
-                    await asyncio.sleep(random.uniform(0.5, 1.2))
-                    
-        except Exception as e:
-            logger.error(f"Worker {self.worker_id}: Error during human typing: {e}")
-
-class LinkedInMassProfileScraper:
-    """Distributed scraper for handling thousands of LinkedIn profiles"""
-    
-    def __init__(self, config):
-        """Initialize the scraper with configuration"""
-        self.config = config
-        self.worker_pool = []
-        self.profile_queue = queue.Queue()
-        self.results_queue = queue.Queue()
-        self.active_workers = 0
-        self.processed_profiles = 0
-        self.successful_profiles = 0
-        self.running = False
-        self.lock = threading.Lock()
-        
-        self.file_watcher = None
-        if config.get('profile_file'):
-            self.file_watcher = ProfileFileWatcher(config.get('profile_file'), self.profile_queue)
-        
-        # Load proxy list if provided
-        self.proxies = self._load_proxies(config.get('proxy_file'))
-        
-        # Initialize event loop for each worker
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        
-        # Initialize workers
-        self._init_workers()
-        
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-    
-    def _load_proxies(self, proxy_file):
-        """Load proxies from a file if provided"""
-        proxies = []
-        
-        if not proxy_file:
-            return proxies
-            
-        try:
-            with open(proxy_file, 'r') as f:
-                for line in f:
-                    proxy = line.strip()
-                    if proxy:
-                        proxies.append(proxy)
-            
-            logger.info(f"Loaded {len(proxies)} proxies from {proxy_file}")
-            return proxies
-            
-        except Exception as e:
-            logger.error(f"Error loading proxies: {e}")
-            return []
-    
-    def _init_workers(self):
-        """Initialize worker threads based on configuration"""
-        worker_count = self.config.get('worker_count', 3)
-        credentials_list = self.config.get('credentials', [])
-        
-        if not credentials_list:
-            logger.error("No credentials provided. Cannot initialize workers.")
-            return
-        
-        logger.info(f"Initializing {worker_count} workers")
-        
-        for i in range(worker_count):
-            # Assign credentials with round-robin distribution
-            credentials = credentials_list[i % len(credentials_list)]
-            
-            # Assign proxy if available
-            proxy = None
-            if self.proxies:
-                proxy = self.proxies[i % len(self.proxies)]
-            
-            # Create worker
-            worker = PlaywrightProfileScraper(
-                worker_id=i,
-                credentials=credentials,
-                proxy=proxy,
-                headless=self.config.get('headless', False)
-            )
-            
-            self.worker_pool.append(worker)
-    
-    def load_profile_urls(self, source):
-        """Load profile URLs from file or database"""
-        try:
-            if isinstance(source, str) and os.path.isfile(source):
-                # Load from file
-                with open(source, 'r') as f:
-                    count = 0
-                    for line in f:
-                        url = line.strip()
-                        if url and "/in/" in url:
-                            self.profile_queue.put(url)
-                            count += 1
-                
-                logger.info(f"Loaded {count} profile URLs from {source}")
-                
-            elif isinstance(source, list):
-                # Load from list
-                count = 0
-                for url in source:
-                    if url and "/in/" in url:
-                        self.profile_queue.put(url)
-                        count += 1
-                
-                logger.info(f"Loaded {count} profile URLs from provided list")
-                
-            else:
-                logger.error(f"Unsupported profile source: {source}")
-                
-        except Exception as e:
-            logger.error(f"Error loading profile URLs: {e}")
-    
-    def start_scraping(self):
-        """Start the scraping process with multiple workers"""
-        if self.running:
-            logger.warning("Scraping already in progress")
-            return
-            
-        if self.profile_queue.empty():
-            logger.error("No profiles to scrape. Load profiles first.")
-            return
-            
-        self.running = True
-        logger.info(f"Starting scraping with {len(self.worker_pool)} workers")
-        
-        if self.file_watcher:
-            self.file_watcher.start()
-    
-        # Create and start worker threads
-        threads = []
-        for i, worker in enumerate(self.worker_pool):
-            thread = threading.Thread(
-                target=self._worker_thread,
-                args=(worker,),
-                name=f"Worker-{i}"
-            )
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-            logger.info(f"Started worker thread {i}")
-        
-        # Start result processor thread
-        result_thread = threading.Thread(
-            target=self._result_processor,
-            name="ResultProcessor"
-        )
-        result_thread.daemon = True
-        result_thread.start()
-        
-        # Start progress monitor thread
-        monitor_thread = threading.Thread(
-            target=self._progress_monitor,
-            name="ProgressMonitor"
-        )
-        monitor_thread.daemon = True
-        monitor_thread.start()
-        
-        # Wait for all threads to complete
-        try:
-            for thread in threads:
-                thread.join()
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt. Shutting down...")
-            self._shutdown()
-        
-        self.running = False
-        logger.info("Scraping completed")
-    
-    def _worker_thread(self, worker):
-        """Worker thread with improved async handling"""
-        with self.lock:
-            self.active_workers += 1
-        
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Initialize the worker
-            init_success = loop.run_until_complete(worker.initialize())
-            if not init_success:
-                logger.error(f"Worker {worker.worker_id}: Initialization failed")
-                return
-                
-            last_profile_time = time.time()
-
-            while self.running:
-                try:
-                    # Check if worker is in cooldown
-                    if worker.in_cooldown and worker.cooldown_until:
-                        remaining_cooldown = (worker.cooldown_until - datetime.now()).total_seconds()
-                        if remaining_cooldown > 0:
-                            logger.info(f"Worker {worker.worker_id}: In cooldown for {remaining_cooldown/3600:.1f} more hours")
-                            time.sleep(min(300, remaining_cooldown))  # Sleep for 5 minutes or remaining time
-                            continue
-                        else:
-                            worker.in_cooldown = False
-                            logger.info(f"Worker {worker.worker_id}: Cooldown expired")
-                    
-                    # Check for session timeout
-                    if time.time() - last_profile_time > 1800:  # 30 minutes
-                        logger.info(f"Worker {worker.worker_id}: Refreshing session due to inactivity")
-                        loop.run_until_complete(worker.refresh_session())
-                        last_profile_time = time.time()
-                    
-                    # Get next profile URL
-                    try:
-                        profile_url = self.profile_queue.get(timeout=5)
-                        last_profile_time = time.time()
-                    except queue.Empty:
-                        logger.debug(f"Worker {worker.worker_id}: Queue empty, waiting...")
-                        time.sleep(10)
-                        continue
-                    
-                    # Process the profile
-                    logger.info(f"Worker {worker.worker_id}: Processing {profile_url}")
-                    profile_data = loop.run_until_complete(worker.scrape_profile(profile_url))
-                    
-                    # Put result in results queue
-                    self.results_queue.put({
-                        'url': profile_url,
-                        'success': profile_data is not None,
-                        'data': profile_data,
-                        'worker_id': worker.worker_id,
-                        'timestamp': datetime.now().isoformat()
-                    })
-                    
-                    self.profile_queue.task_done()
-                    
-                    # If scraping failed (likely due to blocks), increase delay
-                    if profile_data is None:
-                        delay = random.uniform(300, 600)  # 5-10 minutes if failed
-                        logger.warning(f"Worker {worker.worker_id}: Profile failed, extended wait of {delay:.1f}s")
-                    else:
-                        # Normal delay for successful scrapes
-                        delay = random.uniform(
-                            self.config.get('min_delay', 120),
-                            self.config.get('max_delay', 300)
-                        )
-                    
-                    logger.info(f"Worker {worker.worker_id}: Waiting {delay:.1f}s before next profile")
-                    time.sleep(delay)
-                    
-                except Exception as e:
-                    logger.error(f"Worker {worker.worker_id}: Error processing profile: {e}")
-                    time.sleep(5)
-        
-        finally:
-            # Clean up
-            try:
-                loop.run_until_complete(worker.cleanup())
-                loop.close()
-            except Exception as e:
-                logger.error(f"Worker {worker.worker_id}: Cleanup error: {e}")
-                
-            with self.lock:
-                self.active_workers -= 1
-    
-    def _result_processor(self):
-        """Process and store results from workers"""
-        while self.running or not self.results_queue.empty():
-            try:
-                # Get result with timeout
-                try:
-                    result = self.results_queue.get(timeout=5)
-                except queue.Empty:
-                    continue
-                
-                # Update counters
-                with self.lock:
-                    self.processed_profiles += 1
-                    if result['success']:
-                        self.successful_profiles += 1
-                
-                # Save combined data periodically
-                if self.processed_profiles % 10 == 0:
-                    self._save_progress_stats()
-                
-                # Mark as done
-                self.results_queue.task_done()
-                
-            except Exception as e:
-                logger.error(f"Error processing result: {e}")
-    
-    def _progress_monitor(self):
-        """Monitor progress"""
-        while self.running or self.active_workers > 0:
-            try:
-                with self.lock:
-                    remaining = self.profile_queue.qsize()
-                    active = self.active_workers
-                    processed = self.processed_profiles
-                    successful = self.successful_profiles
-                
-                logger.info(f"Progress: {processed} processed ({successful} successful), {remaining} remaining, {active} active workers")
-                
-                time.sleep(60)
-                
-            except Exception as e:
-                logger.error(f"Error in progress monitor: {e}")
-                time.sleep(60)
-    
-    def _save_progress_stats(self):
-        """Save progress statistics"""
-        try:
-            stats = {
-                'timestamp': datetime.now().isoformat(),
-                'total_processed': self.processed_profiles,
-                'successful': self.successful_profiles,
-                'remaining': self.profile_queue.qsize(),
-                'active_workers': self.active_workers,
-                'worker_stats': [
-                    {
-                        'worker_id': worker.worker_id,
-                        'profiles_scraped': worker.profiles_scraped,
-                        'in_cooldown': worker.in_cooldown,
-                        'cooldown_until': worker.cooldown_until.isoformat() if worker.cooldown_until else None
-                    }
-                    for worker in self.worker_pool
-                ]
-            }
-            
-            with open(f"linkedin_data/scraping_stats_{datetime.now().strftime('%Y%m%d')}.json", 'w') as f:
-                json.dump(stats, f, indent=2)
-                
-        except Exception as e:
-            logger.error(f"Error saving progress stats: {e}")
-    
-    def _signal_handler(self, sig, frame):
-        """Handle termination signals"""
-        logger.info(f"Received signal {sig}. Shutting down gracefully...")
-        self._shutdown()
-        sys.exit(0)
-    
-    def _shutdown(self):
-        """Shutdown the scraper gracefully"""
-        logger.info("Shutting down scrapers...")
-        self.running = False
-        
-        # Final progress report
-        with self.lock:
-            logger.info(f"Final stats: {self.processed_profiles} processed, {self.successful_profiles} successful")
-        
-        if self.file_watcher:
-            self.file_watcher.stop()
-
-        # Save final stats
-        self._save_progress_stats()
-        
-        # Give time for threads to finish current tasks
-        time.sleep(5)
-
-def main():
-    """Main function to run the mass profile scraper"""
-    parser = argparse.ArgumentParser(description='LinkedIn Mass Profile Scraper (Playwright version)')
-    
-    parser.add_argument('--profile-file', type=str, help='File containing LinkedIn profile URLs')
-    parser.add_argument('--workers', type=int, default=3, help='Number of worker threads')
-    parser.add_argument('--credentials-file', type=str, required=True, help='JSON file with LinkedIn credentials')
-    parser.add_argument('--proxy-file', type=str, help='File containing proxy list')
-    parser.add_argument('--headless', action='store_true', help='Run in headless mode')
-    parser.add_argument('--min-delay', type=int, default=30, help='Minimum delay between profiles in seconds')
-    parser.add_argument('--max-delay', type=int, default=90, help='Maximum delay between profiles in seconds')
-    
-    args = parser.parse_args()
-    
-    # Load credentials from file
-    try:
-        with open(args.credentials_file, 'r') as f:
-            credentials = json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading credentials: {e}")
-        return
-    
-    # Configure the scraper
-    config = {
-        'worker_count': 1,
-        'credentials': credentials,
-        'proxy_file': args.proxy_file,
-        # 'headless': args.headless,
-        'headless': False,
-        'min_delay': 120,
-        'max_delay': 300,
-        'profile_file': args.profile_file
-    }
-    
-    # Initialize the scraper
-    scraper = LinkedInMassProfileScraper(config)
-    
-    # Load profile URLs
-    if args.profile_file:
-        scraper.load_profile_urls(args.profile_file)
-    else:
-        logger.error("No profile source provided. Use --profile-file")
-        return
-    
-    # Start scraping
-    scraper.start_scraping()
-
-if __name__ == "__main__":
+import asyncio
+import random
+import re
+import json
+import orjson
+import os
+import logging
+import math
+import argparse
+import atexit
+import gzip
+import hashlib
+import traceback
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Any
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+import polars as pl
+import requests
+from requests.adapters import HTTPAdapter
+import threading
+import signal
+import sys
+import textwrap
+import re
+from bs4 import BeautifulSoup
+import soupsieve as sv
+import traceback
+from file_watcher import ProfileFileWatcher, read_profile_urls
+from browser_pool import BrowserContextPool
+from proxy_pool import ProxyPool
+
+# uvloop is optional; without it the worker loop uses the default asyncio loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler("linkedin_scraper.log"),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "linkedin_state.json"
+logging.getLogger().setLevel(logging.DEBUG)
+
+# Pieces of the output filename built in _save_profile_data()
+FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
+FILENAME_SEPARATOR_RE = re.compile(r'[\s-]+')
+PROFILE_USERNAME_RE = re.compile(r'/in/([^/?#\s]+)')
+
+# Selectors and skip words for experience parsing, compiled once at import
+ARIA_HIDDEN_SPAN_SELECTOR = sv.compile('span[aria-hidden="true"]')
+ROLE_TITLE_SPAN_SELECTOR = sv.compile('div.hoverable-link-text.t-bold span[aria-hidden="true"]')
+# Keyword sets for classifying role spans, each a single case-insensitive
+# alternation so one C-level scan replaces a per-keyword `in` loop
+GROUPED_ROLE_SKIP_RE = re.compile(r'skills|see more', re.I)
+ROLE_TITLE_SKIP_RE = re.compile(r'skills|see more|full-time|part-time|internship', re.I)
+EMPLOYMENT_TYPE_RE = re.compile(r'full-time|part-time|internship|contract', re.I)
+DATE_HINT_RE = re.compile(r'present|20|yr|mo|year| - |·', re.I)
+DATE_WORD_RE = re.compile(r'20|present|yr|mo', re.I)
+# Generic location patterns (not hardcoded places): '·' often separates
+# location from work type, ',' is City, State, then geographic area
+# indicators and work arrangements
+ROLE_LOCATION_RE = re.compile(r'[·,]|area|region|metroplex|remote|hybrid|on-?site', re.I)
+# Company-level locations also accept counties and districts
+COMPANY_LOCATION_RE = re.compile(r'[·,]|area|region|metroplex|county|district|remote|hybrid|on-?site', re.I)
+EXPERIENCE_ITEM_SELECTOR = sv.compile('div.hoverable-link-text')
+COMPANY_LINK_SELECTOR = sv.compile('a.optional-action-target-wrapper')
+COMPANY_HEADER_SELECTOR = sv.compile('div.display-flex.flex-column.align-self-center.flex-grow-1')
+COMPANY_SPAN_SELECTOR = sv.compile('span.t-14.t-normal span[aria-hidden="true"]')
+EXPERIENCE_ANCHOR_SELECTOR = sv.compile('div#experience')
+SECTION_HEADER_SELECTOR = sv.compile('h2, h3')
+
+# Resource types never needed for extraction. Stylesheets stay enabled so
+# layout-dependent checks (visibility, bounding boxes, scrolling) still work
+BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font"))
+# Tracking and ad beacons, aborted whatever their resource type
+BLOCKED_URL_RE = re.compile(
+    r'^https?://(?:px\.ads\.linkedin\.com|[^/]*\.doubleclick\.net|www\.google-analytics\.com'
+    r'|www\.googletagmanager\.com|bat\.bing\.com|sb\.scorecardresearch\.com)/'
+    r'|^https?://www\.linkedin\.com/(?:li/track|platform-telemetry|sensorCollect)'
+)
+
+# Pooled session for proxy checks, so re-testing an endpoint reuses its connection
+PROXY_TEST_SESSION = requests.Session()
+PROXY_TEST_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+
+# Chromium flags shared by per-worker launches and the shared browser
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor'
+]
+
+# The state file is parsed once; afterwards load_state() hands out the live
+# in-memory dict. Writers go through update_state()/mark_processed(), which
+# change it under the lock and mark it dirty. A background flusher writes
+# it out at most every STATE_FLUSH_INTERVAL seconds, so the file is rewritten
+# a few times a minute instead of once per profile. The lock serializes those
+# writers (scraping loop and file watcher thread) with the flusher's dump, so
+# it never sees a half-updated dict; the disk write itself runs outside it,
+# under _state_write_lock.
+# In memory state["processed_urls"] is a set; on disk it is a sorted list
+STATE_FLUSH_INTERVAL = 5
+_state_cache = None
+_state_dirty = False
+_state_lock = threading.Lock()
+_state_write_lock = threading.Lock()
+_state_flush_stop = threading.Event()
+_state_flush_thread = None
+
+def load_state() -> dict:
+        global _state_cache
+        # Once loaded the cache is never replaced by another load, so the
+        # common path skips the lock
+        state = _state_cache
+        if state is not None:
+            return state
+        with _state_lock:
+            if _state_cache is None:
+                if os.path.exists(STATE_FILE):
+                    with open(STATE_FILE, "rb") as f:
+                        _state_cache = orjson.loads(f.read())
+                else:
+                    _state_cache = {}
+                _state_cache["processed_urls"] = set(_state_cache.get("processed_urls", []))
+            return _state_cache
+
+def is_processed(url: str) -> bool:
+    """Return whether url is already in the state's processed_urls"""
+    return url in load_state()["processed_urls"]
+
+def filter_unprocessed(urls) -> list:
+    """Return the urls not yet in processed_urls, checked under one lock"""
+    state = load_state()
+    with _state_lock:
+        processed = state["processed_urls"]
+        return [url for url in urls if url not in processed]
+
+def mark_processed(urls):
+    """Add the urls not yet processed to the state's processed_urls"""
+    state = load_state()
+    with _state_lock:
+        processed = state["processed_urls"]
+        new_urls = [url for url in urls if url not in processed]
+        if not new_urls:
+            return False
+        processed.update(new_urls)
+    save_state(state)
+    return True
+
+def _state_json_default(obj):
+    # processed_urls is kept as a set in memory and written as a sorted list
+    if isinstance(obj, set):
+        return sorted(obj)
+    raise TypeError
+
+# One Playwright driver and Chromium process for every worker in this process;
+# workers only open contexts on it. Created lazily on the scraping event loop
+_shared_playwright = None
+_shared_browser = None
+_shared_browser_lock = asyncio.Lock()
+
+# Caps how many pages are open and driven at the same time: scrape_profile
+# holds one permit for the worker's page and each extra activity tab takes its own
+PAGE_SEMAPHORE = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_PAGES", "8")))
+
+async def get_shared_browser(headless: bool = False):
+    """Return the process-wide browser, launching it on first use"""
+    global _shared_playwright, _shared_browser
+    async with _shared_browser_lock:
+        if _shared_browser is None or not _shared_browser.is_connected():
+            if _shared_playwright is None:
+                _shared_playwright = await async_playwright().start()
+            # Signals are handled by the scraper; letting Playwright also
+            # trap SIGINT races the loop's own handlers under uvloop
+            _shared_browser = await _shared_playwright.chromium.launch(
+                headless=headless,
+                args=BROWSER_ARGS,
+                handle_sigint=False
+            )
+            logger.info("Launched shared browser")
+        return _shared_browser
+
+async def close_shared_browser():
+    """Close the process-wide browser and stop its Playwright driver"""
+    global _shared_playwright, _shared_browser
+    async with _shared_browser_lock:
+        if _shared_browser:
+            await _shared_browser.close()
+            _shared_browser = None
+        if _shared_playwright:
+            await _shared_playwright.stop()
+            _shared_playwright = None
+
+def _write_gz(path: str, text: str):
+    # Level 1 is the fastest setting and still shrinks page HTML several-fold
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=1) as f:
+        f.write(text)
+
+def atomic_write(path: str, data: bytes):
+    """Write data to a temp file, fsync it and swap it into place"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def save_state(state: dict):
+        global _state_cache, _state_dirty
+        with _state_lock:
+            if state is not _state_cache:
+                state["processed_urls"] = set(state.get("processed_urls", []))
+            _state_cache = state
+            _state_dirty = True
+
+def update_state(key: str, value):
+    """Set one top-level state entry under the lock and mark the state dirty"""
+    global _state_dirty
+    state = load_state()
+    with _state_lock:
+        state[key] = value
+        _state_dirty = True
+
+def flush_state():
+    """Write the cached state to disk if it changed since the last flush"""
+    global _state_dirty
+    # The write lock keeps concurrent flushes from racing on the temp file or
+    # landing an older snapshot after a newer one
+    with _state_write_lock:
+        with _state_lock:
+            if not _state_dirty:
+                return
+            data = orjson.dumps(_state_cache, default=_state_json_default, option=orjson.OPT_INDENT_2)
+            _state_dirty = False
+        # The fsync runs without the state lock so the scraping loop isn't stalled
+        try:
+            atomic_write(STATE_FILE, data)
+        except Exception:
+            with _state_lock:
+                _state_dirty = True
+            raise
+
+def _state_flush_loop(interval):
+    while not _state_flush_stop.wait(interval):
+        try:
+            flush_state()
+        except Exception as e:
+            logger.error(f"Error flushing state: {e}")
+
+def start_state_flusher(interval: float = STATE_FLUSH_INTERVAL):
+    """Start the background thread that periodically flushes dirty state"""
+    global _state_flush_thread
+    if _state_flush_thread and _state_flush_thread.is_alive():
+        return
+    _state_flush_stop.clear()
+    _state_flush_thread = threading.Thread(
+        target=_state_flush_loop, args=(interval,), name="StateFlusher", daemon=True
+    )
+    _state_flush_thread.start()
+
+def stop_state_flusher():
+    """Stop the flusher thread and write any pending state"""
+    _state_flush_stop.set()
+    if _state_flush_thread:
+        _state_flush_thread.join(timeout=STATE_FLUSH_INTERVAL)
+    flush_state()
+
+# Never lose the last few seconds of state, whichever way the process exits
+atexit.register(flush_state)
+
+@lru_cache(maxsize=None)
+def load_user_agents(path: str = "userAgents.json") -> tuple:
+    """Read the user-agent list once per process; every context draws from it"""
+    with open(path, "rb") as f:
+        return tuple(orjson.loads(f.read()))
+
+@lru_cache(maxsize=256)
+def parse_proxy(proxy: str) -> Optional[dict]:
+    """Convert an http(s)://host:port[:user:pass] string to a Playwright proxy dict.
+
+    Cached per proxy string and shared between workers; callers must not mutate it.
+    """
+    if not (proxy.startswith('http://') or proxy.startswith('https://')):
+        return None
+    proxy_parts = proxy.replace('http://', '').replace('https://', '').split(':')
+    if len(proxy_parts) < 2:
+        return None
+    proxy_config = {
+        'server': f"http://{proxy_parts[0]}:{proxy_parts[1]}"
+    }
+    # Add authentication if provided
+    if len(proxy_parts) >= 4:
+        proxy_config['username'] = proxy_parts[2]
+        proxy_config['password'] = proxy_parts[3]
+    return proxy_config
+
+def rows_from_columns(columns: dict) -> list:
+    """Zip a column-per-field payload from an extraction script back into row dicts"""
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
+def posts_from_columns(columns: dict) -> list:
+    """Rebuild post dicts, including the nested engagement block, from column arrays"""
+    return [
+        {
+            "reposted": reposted,
+            "author_name": author_name,
+            "author_url": author_url,
+            "url": url,
+            "text": text,
+            "timestamp": timestamp,
+            "engagement": {"likes": likes, "comments": comments, "shares": shares},
+            "media": media,
+        }
+        for reposted, author_name, author_url, url, text, timestamp, likes, comments, shares, media in zip(
+            columns["reposted"], columns["author_name"], columns["author_url"], columns["url"],
+            columns["text"], columns["timestamp"], columns["likes"], columns["comments"],
+            columns["shares"], columns["media"]
+        )
+    ]
+
+RELATIVE_TS_RE = re.compile(r'(\d+)\s*(d|mo|yr)')
+RELATIVE_TS_DAYS = {"d": 1, "mo": 30, "yr": 365}
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_text(ts):
+    """Parse a timestamp string into a datetime (ISO) or a timedelta (relative)"""
+    try:
+        # ISO datetime
+        return datetime.fromisoformat(ts)
+    except Exception:
+        pass
+    # Relative dates like '2d', '3mo', '1yr'; cached as an offset so the
+    # result never goes stale
+    match = RELATIVE_TS_RE.match(ts)
+    if match:
+        return timedelta(days=int(match.group(1)) * RELATIVE_TS_DAYS[match.group(2)])
+    # If all fails
+    return None
+
+def parse_linkedin_timestamp(ts, now=None):
+    if not ts:
+        return None
+    parsed = _parse_timestamp_text(ts)
+    if isinstance(parsed, timedelta):
+        return (now or datetime.now()) - parsed
+    return parsed
+
+def lognormal_delay(median, sigma=0.5, lo=None, hi=None):
+    """Log-normal delay around median, redrawn until it falls strictly inside (lo, hi)"""
+    # Clusters near a typical value with an occasional long pause, like a
+    # person browsing, instead of the flat spread of random.uniform. Out of
+    # range draws are redrawn, not clamped, so no value repeats at a bound
+    lo = lo or 0
+    hi = hi or 10 * median
+    for _ in range(100):
+        delay = median * math.exp(random.gauss(0, sigma))
+        if lo < delay < hi:
+            return delay
+    # Only reachable with bounds far out in the tails
+    return random.uniform(lo, hi)
+
+def range_delay(min_seconds, max_seconds, sigma=None):
+    """Log-normal delay for a nominal [min_seconds, max_seconds] range"""
+    if min_seconds <= 0:
+        # No geometric mean to centre on
+        return random.uniform(min_seconds, max_seconds)
+    # The nominal range spans about +/-2 sigma around its geometric mean; the
+    # hard bounds sit at half the minimum and twice the maximum
+    if sigma is None:
+        sigma = math.log(max_seconds / min_seconds) / 4
+    return lognormal_delay(
+        math.sqrt(min_seconds * max_seconds), sigma,
+        lo=min_seconds / 2, hi=max_seconds * 2
+    )
+
+def incremental_filter(items, since_timestamp=None, max_count=None):
+    """Keep the activity items newer than since_timestamp; returns (items, most_recent_iso)"""
+    filtered = []
+    most_recent = None
+    # One reference time for the whole batch: relative stamps that parse to the
+    # same offset then compare equal, and datetime.now() runs once
+    now = datetime.now()
+    cutoff = parse_linkedin_timestamp(since_timestamp, now) if since_timestamp else None
+    for item in items:
+        item_time = parse_linkedin_timestamp(item.get('timestamp'), now)
+        if cutoff and item_time and item_time <= cutoff:
+            continue
+        filtered.append(item)
+        if not most_recent or (item_time and item_time > most_recent):
+            most_recent = item_time
+        if max_count and len(filtered) >= max_count:
+            break
+    return filtered, most_recent.isoformat() if most_recent else None
+
+# In-page extraction scripts for the activity tabs. The prelude holds the
+# setup every tab needs (card list, URN dedup set, selector/text helpers).
+# Each tab is scraped on its own page, so the scripts can't be fused into one
+# DOM pass; they share this source instead of carrying three copies of it
+ACTIVITY_SCRIPT_PRELUDE = """
+        // Gather all possible activity containers (li, div, and data-urn)
+        // One joined selector walks the DOM once and returns each element once, in document order
+        const cards = document.querySelectorAll(
+            'ul.display-flex.flex-wrap.list-style-none.justify-center > li, ' +
+            'li.artdeco-list__item, ' +
+            'div.fie-impression-container, ' +
+            'div[data-urn^="urn:li:activity:"]'
+        );
+        // Keyed on the numeric id after the last ':' of each data-urn
+        const seen = new Set();
+
+        // A fallback cascade: one joined query per lookup, then the
+        // highest-priority selector wins, as with the old per-selector loop
+        const cascade = (list) => ({ list, joined: list.join(', ') });
+        const pickFirst = (element, selectors) => {
+            const found = element.querySelectorAll(selectors.joined);
+            if (found.length <= 1) return found[0] || null;
+            const list = selectors.list;
+            let best = null;
+            let bestRank = list.length;
+            for (const el of found) {
+                for (let i = 0; i < bestRank; i++) {
+                    if (el.matches(list[i])) {
+                        best = el;
+                        bestRank = i;
+                        break;
+                    }
+                }
+                if (bestRank === 0) break;
+            }
+            return best;
+        };
+
+        // Leaf elements read textContent, which needs no layout. Elements
+        // with children keep innerText so visually-hidden duplicate spans
+        // and line breaks render as on screen
+        const readText = (el) => (
+            el.childElementCount === 0 ? el.textContent : (el.innerText || el.textContent)
+        ).trim();
+        const getText = (element, selectors) => {
+            const el = pickFirst(element, selectors);
+            return el ? readText(el) : '';
+        };
+        const getAttr = (element, selectors, attr) => {
+            const el = pickFirst(element, selectors);
+            return el ? el.getAttribute(attr) : '';
+        };
+
+        // Fallback selector lists, in priority order, built once per evaluate
+        const URN_SELECTORS = cascade(['.feed-shared-update-v2', '[data-urn^="urn:li:activity:"]']);
+"""
+
+# Fallback selector lists shared by more than one activity script, in priority
+# order; activity_script() renders them into each script that asks for them
+OWNER_NAME_SELECTORS = (
+    '.update-components-actor__title span[aria-hidden="true"]',
+    '.feed-shared-actor__name',
+    '.update-components-actor__name',
+)
+OWNER_URL_SELECTORS = (
+    '.update-components-actor__meta-link',
+    '.feed-shared-actor__container-link',
+)
+ACTIVITY_TEXT_SELECTORS = (
+    '.feed-shared-update-v2__description .update-components-text',
+    '.feed-shared-update-v2__description',
+    '.feed-shared-text',
+    '.update-components-text',
+)
+ACTOR_TIMESTAMP_SELECTORS = (
+    '.update-components-actor__sub-description span[aria-hidden="true"]',
+    '.feed-shared-actor__sub-description span[aria-hidden="true"]',
+)
+
+def activity_script(body: str, **selector_lists) -> str:
+    """Build an activity script: shared prelude, generated cascade() constants, then the tab body"""
+    declarations = "".join(
+        f"        const {name} = cascade({json.dumps(list(selectors))});\n"
+        for name, selectors in selector_lists.items()
+    )
+    # The result crosses the wire as one JSON string for orjson to parse,
+    # instead of Playwright's per-value serialization of the column arrays
+    return textwrap.dedent(
+        "    () => JSON.stringify((() => {" + ACTIVITY_SCRIPT_PRELUDE + declarations + body + "    })())\n"
+    ).strip()
+
+POSTS_SCRIPT = activity_script("""
+        // Column per field rather than an object per post, so each key
+        // crosses the CDP boundary once; repacked by posts_from_columns()
+        const posts = {
+            reposted: [], author_name: [], author_url: [], url: [], text: [],
+            timestamp: [], likes: [], comments: [], shares: [], media: []
+        };
+
+        // Fallback selector lists, in priority order, built once per evaluate
+        const REPOST_HEADER_SELECTORS = cascade([
+            '.update-components-header__text-view',
+            '.feed-shared-actor__meta--repost',
+            '.update-components-actor__sub-description'
+        ]);
+        const AUTHOR_NAME_SELECTORS = cascade([
+            '.update-components-actor__title span[dir="ltr"] span[aria-hidden="true"]',
+            '.update-components-actor__name',
+            '.feed-shared-actor__name'
+        ]);
+        const AUTHOR_URL_SELECTORS = cascade([
+            '.update-components-actor__meta-link',
+            '.update-components-actor__image',
+            '.feed-shared-actor__container-link'
+        ]);
+        const POST_TEXT_SELECTORS = cascade([
+            '.update-components-update-v2__commentary .update-components-text',
+            '.feed-shared-update-v2__description',
+            '.feed-shared-text',
+            '.update-components-text',
+            '.feed-shared-article__description',
+            '.feed-shared-external-video__description',
+            '.feed-shared-linkedin-video__description'
+        ]);
+        const ENGAGEMENT_SELECTORS = cascade([
+            '.social-details-social-counts',
+            '.feed-shared-social-counts'
+        ]);
+        const LEFT_REACTIONS_SELECTOR = '.social-details-social-counts__reactions--left-aligned .social-details-social-counts__reactions-count';
+        const RIGHT_ITEMS_SELECTOR = '.social-details-social-counts__item--right-aligned';
+        const IMAGE_SELECTOR = '.update-components-image__image, .feed-shared-image__image, .feed-shared-image img';
+        const VIDEO_SELECTOR = '.update-components-linkedin-video, .feed-shared-video, .feed-shared-external-video';
+
+        // Engagement patterns, compiled once instead of per card
+        const LIKES_RE = /([\\d,.]+\\w*)\\s*(like|reaction)/i;
+        const COMMENTS_RE = /([\\d,.]+\\w*)\\s*comment/i;
+        const SHARES_RE = /([\\d,.]+\\w*)\\s*(repost|share)/i;
+        // Repost detection: one case-insensitive test instead of lowercasing the header
+        const REPOST_HEADER_RE = /(reposted|reshared) this/i;
+        // Right-aligned count items: number and kind captured in one match
+        const RIGHT_RE = /(\\d[\\d,.]*[KMB]?)\\s*(repost|share|comment)/i;
+
+        // Counts leave the page as integers: "1,234" -> 1234, "1.2K" -> 1200
+        const COUNT_RE = /^(\\d[\\d,]*(?:\\.\\d+)?)\\s*([KMB])?/i;
+        const COUNT_SCALE = { K: 1e3, M: 1e6, B: 1e9 };
+        const parseCount = (text) => {
+            const m = COUNT_RE.exec(text || '');
+            if (!m) return 0;
+            const value = parseFloat(m[1].replace(/,/g, ''));
+            return Math.round(m[2] ? value * COUNT_SCALE[m[2].toUpperCase()] : value);
+        };
+
+        // Media for every card in one document-wide pass each instead of two
+        // subtree queries per card. Each item is bucketed under every card
+        // element it sits inside, so a card gets exactly what a query on its
+        // own subtree would return, nested reshares and embeds included
+        const cardSet = new Set(cards);
+        const mediaByCard = new Map();
+        const bucketsOf = (el) => {
+            const buckets = [];
+            for (let node = el.parentElement; node; node = node.parentElement) {
+                if (!cardSet.has(node)) continue;
+                if (!mediaByCard.has(node)) mediaByCard.set(node, { images: [], video: false });
+                buckets.push(mediaByCard.get(node));
+            }
+            return buckets;
+        };
+        document.querySelectorAll(IMAGE_SELECTOR).forEach(img => {
+            if (!img.src) return;
+            for (const bucket of bucketsOf(img)) bucket.images.push({ type: 'image', url: img.src });
+        });
+        document.querySelectorAll(VIDEO_SELECTOR).forEach(video => {
+            for (const bucket of bucketsOf(video)) bucket.video = true;
+        });
+
+        for (const card of cards) {
+            // Deduplicate by data-urn
+            const postUrn = getAttr(card, URN_SELECTORS, 'data-urn');
+            // Only cards that resolve to an activity URN can yield a post URL, so skip
+            // the rest before any per-field queries run
+            if (!postUrn) continue;
+            const urnId = postUrn.slice(postUrn.lastIndexOf(':') + 1);
+            if (seen.has(urnId)) continue;
+            seen.add(urnId);
+
+            // Repost detection
+            const repostHeaderText = getText(card, REPOST_HEADER_SELECTORS);
+            const isRepost = REPOST_HEADER_RE.test(repostHeaderText) ? 1 : 0;
+
+            // Author
+            const authorName = getText(card, AUTHOR_NAME_SELECTORS);
+            let authorUrl = getAttr(card, AUTHOR_URL_SELECTORS, 'href');
+            // Relative hrefs start with '/'; a char compare avoids the startsWith call
+            if (authorUrl && authorUrl[0] === '/') {
+                authorUrl = 'https://www.linkedin.com' + authorUrl;
+            }
+            const postText = getText(card, POST_TEXT_SELECTORS);
+            const timestampText = getText(card, TIMESTAMP_SELECTORS);
+
+            // Post URL from data-urn
+            const postUrl = postUrn ? `https://www.linkedin.com/feed/update/${postUrn}` : '';
+
+            // Text before the first bullet, without split() allocating every piece
+            const bulletIdx = timestampText.indexOf('•');
+            const timestamp = (bulletIdx === -1 ? timestampText : timestampText.slice(0, bulletIdx)).trim();
+
+            // --- Engagement Metrics from both sides ---
+            // LEFT: reactions (likes)
+            let leftReactions = '';
+            const leftReactionsElem = card.querySelector(LEFT_REACTIONS_SELECTOR);
+            if (leftReactionsElem) {
+                leftReactions = readText(leftReactionsElem);
+            }
+
+            // RIGHT: reposts/shares/comments
+            let rightReposts = '';
+            let rightComments = '';
+            const rightItems = card.querySelectorAll(RIGHT_ITEMS_SELECTOR);
+            rightItems.forEach(item => {
+                const m = RIGHT_RE.exec(readText(item));
+                if (!m) return;
+                if (m[2].charAt(0).toLowerCase() === 'c') {
+                    rightComments = m[1];
+                } else {
+                    rightReposts = m[1];
+                }
+            });
+
+            // Fallback: also parse the general engagement text as before
+            const engagementText = getText(card, ENGAGEMENT_SELECTORS);
+            const likesMatch = engagementText.match(LIKES_RE);
+            const commentsMatch = engagementText.match(COMMENTS_RE);
+            const sharesMatch = engagementText.match(SHARES_RE);
+
+            // Combine all sources, prefer left/right if available, else fallback to regex
+            const engagement = {
+                likes: parseCount(leftReactions) || (likesMatch ? parseCount(likesMatch[1]) : 0),
+                comments: parseCount(rightComments) || (commentsMatch ? parseCount(commentsMatch[1]) : 0),
+                shares: parseCount(rightReposts) || (sharesMatch ? parseCount(sharesMatch[1]) : 0)
+            };
+
+            // Media, from the buckets built before the loop
+            const bucket = mediaByCard.get(card);
+            const media = bucket ? bucket.images.slice() : [];
+            if (bucket && bucket.video) {
+                media.push({ type: 'video', present: true });
+            }
+
+            // Only add if we have a post URL (guarantees uniqueness and validity)
+            if (postUrl) {
+                posts.reposted.push(isRepost);
+                posts.author_name.push(authorName);
+                posts.author_url.push(authorUrl);
+                posts.url.push(postUrl);
+                posts.text.push(postText);
+                posts.timestamp.push(timestamp);
+                posts.likes.push(engagement.likes);
+                posts.comments.push(engagement.comments);
+                posts.shares.push(engagement.shares);
+                posts.media.push(media);
+            }
+        }
+        return posts;
+""", TIMESTAMP_SELECTORS=ACTOR_TIMESTAMP_SELECTORS)
+
+COMMENTS_SCRIPT = activity_script("""
+        // Column per field; repacked by rows_from_columns()
+        const comments = {
+            post_owner_name: [], post_owner_url: [], post_url: [],
+            parent_post_text: [], text: [], timestamp: []
+        };
+
+        // Fallback selector lists, in priority order, built once per evaluate
+        const COMMENT_TEXT_SELECTORS = cascade([
+            'article.comments-comment-entity .comments-comment-item__main-content span[dir="ltr"]',
+            'article.comments-comment-entity .update-components-text',
+            '.comments-comment-entity .update-components-text',
+            'article.comments-comment-entity .comments-comment-item__main-content',
+            '.comments-comment-item__main-content span[aria-hidden="true"]'
+        ]);
+        const COMMENT_TIME_SELECTORS = cascade([
+            'article.comments-comment-entity time.comments-comment-meta__data',
+            'time.comments-comment-meta__data',
+            '.comments-comment-entity time',
+            'time'
+        ]);
+
+        for (const card of cards) {
+            // Deduplicate by data-urn if present
+            const postUrn = getAttr(card, URN_SELECTORS, 'data-urn');
+            if (postUrn) {
+                const urnId = postUrn.slice(postUrn.lastIndexOf(':') + 1);
+                if (seen.has(urnId)) continue;
+                seen.add(urnId);
+            }
+
+            // --- Post Owner Details (with fallbacks) ---
+            const postOwnerName = getText(card, OWNER_NAME_SELECTORS);
+            const postOwnerUrl = getAttr(card, OWNER_URL_SELECTORS, 'href');
+
+            // --- Post URL (most reliable method) ---
+            const postUrl = postUrn ? `https://www.linkedin.com/feed/update/${postUrn}` : '';
+
+            // --- Parent Post Text (fallbacks for various layouts) ---
+            const parentPostText = getText(card, POST_TEXT_SELECTORS);
+
+            // --- Your Comment Details (with fallbacks) ---
+            const yourCommentText = getText(card, COMMENT_TEXT_SELECTORS);
+            const yourCommentTimestamp = getText(card, COMMENT_TIME_SELECTORS);
+
+            // Filter out cards that are not valid comment activities
+            // Both your comment text and the post owner's name should exist
+            if (yourCommentText && postOwnerName) {
+                comments.post_owner_name.push(postOwnerName);
+                comments.post_owner_url.push(postOwnerUrl);
+                comments.post_url.push(postUrl);
+                comments.parent_post_text.push(parentPostText);
+                comments.text.push(yourCommentText);
+                comments.timestamp.push(yourCommentTimestamp);
+            }
+        }
+        return comments;
+""", OWNER_NAME_SELECTORS=OWNER_NAME_SELECTORS, OWNER_URL_SELECTORS=OWNER_URL_SELECTORS,
+    POST_TEXT_SELECTORS=ACTIVITY_TEXT_SELECTORS)
+
+REACTIONS_SCRIPT = activity_script("""
+        // Column per field; repacked by rows_from_columns()
+        const reactions = {
+            post_owner_name: [], post_owner_url: [], post_url: [],
+            post_text: [], timestamp: []
+        };
+
+        for (const card of cards) {
+            // Deduplicate by data-urn
+            const postUrn = getAttr(card, URN_SELECTORS, 'data-urn');
+            // Only cards that resolve to an activity URN can yield a post URL, so skip
+            // the rest before any per-field queries run
+            if (!postUrn) continue;
+            const urnId = postUrn.slice(postUrn.lastIndexOf(':') + 1);
+            if (seen.has(urnId)) continue;
+            seen.add(urnId);
+
+            // --- Post Owner Details (with fallbacks) ---
+            const postOwnerName = getText(card, OWNER_NAME_SELECTORS);
+            const postOwnerUrl = getAttr(card, OWNER_URL_SELECTORS, 'href');
+
+            // --- Post URL (most reliable method) ---
+            const postUrl = postUrn ? `https://www.linkedin.com/feed/update/${postUrn}` : '';
+
+            // --- Post Text (fallbacks for various layouts) ---
+            const postText = getText(card, POST_TEXT_SELECTORS);
+
+            // --- Timestamp (with fallbacks) ---
+            const timestampText = getText(card, TIMESTAMP_SELECTORS);
+            // Text before the first bullet, without split() allocating every piece
+            const bulletIdx = timestampText.indexOf('•');
+            const timestamp = (bulletIdx === -1 ? timestampText : timestampText.slice(0, bulletIdx)).trim();
+
+            // Only add if we have a post owner and a post URL
+            if (postOwnerName && postUrl) {
+                reactions.post_owner_name.push(postOwnerName);
+                reactions.post_owner_url.push(postOwnerUrl);
+                reactions.post_url.push(postUrl);
+                reactions.post_text.push(postText);
+                reactions.timestamp.push(timestamp);
+            }
+        }
+        return reactions;
+""", OWNER_NAME_SELECTORS=OWNER_NAME_SELECTORS, OWNER_URL_SELECTORS=OWNER_URL_SELECTORS,
+    POST_TEXT_SELECTORS=ACTIVITY_TEXT_SELECTORS, TIMESTAMP_SELECTORS=ACTOR_TIMESTAMP_SELECTORS)
+
+# Every selector _is_authwall_present() looks at, probed in one round-trip
+AUTHWALL_PROBE_SCRIPT = """() => ({
+    feed: !!document.querySelector('div.feed-identity-module'),
+    login: !!document.querySelector('form.login__form, div.authwall, div.sign-in-form'),
+    username: !!document.querySelector('#username')
+})"""
+
+# Scrolls by each step's dy, pausing pause_ms after each; the schedule is
+# randomized Python-side so the whole burst costs one round-trip
+SCROLL_BURST_SCRIPT = """async (steps) => {
+    for (const step of steps) {
+        window.scrollBy(0, step.dy);
+        await new Promise(resolve => setTimeout(resolve, step.pause_ms));
+    }
+}"""
+
+# Prompts that can appear right after login, and a probe reporting which of
+# a list of selectors currently match
+REMEMBER_DEVICE_SELECTOR = "button[data-litms-control-urn='remember_me_save']"
+MODAL_DISMISS_SELECTOR = "button.artdeco-modal__dismiss"
+POST_LOGIN_PROMPT_SELECTORS = (REMEMBER_DEVICE_SELECTOR, MODAL_DISMISS_SELECTOR)
+SELECTORS_PRESENT_SCRIPT = "(selectors) => selectors.map(s => !!document.querySelector(s))"
+
+# Gradual top-to-bottom scroll with variable steps, reading pauses and
+# occasional back-scrolls, ending partway up the page
+SCROLL_PAGE_SCRIPT = """async () => {
+    const sleep = (min, max) => new Promise(resolve => setTimeout(resolve, (min + Math.random() * (max - min)) * 1000));
+    const randInt = (min, max) => Math.floor(min + Math.random() * (max - min + 1));
+    const viewportHeight = window.innerHeight;
+    const nextStep = () => randInt(Math.floor(viewportHeight * 0.2), Math.floor(viewportHeight * 0.8));
+
+    // Track DOM activity so the bottom of the page waits exactly as long as
+    // lazy-loaded content keeps arriving
+    let lastMutation = Date.now();
+    const observer = new MutationObserver(() => { lastMutation = Date.now(); });
+    observer.observe(document.body, { childList: true, subtree: true });
+    const settled = (quietMs, maxMs) => new Promise(resolve => {
+        const start = Date.now();
+        const timer = setInterval(() => {
+            const now = Date.now();
+            if (now - lastMutation >= quietMs || now - start >= maxMs) {
+                clearInterval(timer);
+                resolve();
+            }
+        }, 250);
+    });
+
+    let pageHeight = document.body.scrollHeight;
+    let position = 0;
+    while (position < pageHeight) {
+        position += nextStep();
+        window.scrollTo({ top: position, behavior: 'smooth' });
+        if (position + viewportHeight >= document.body.scrollHeight) {
+            // At the bottom: wait for lazy loading to go quiet instead of a fixed pause
+            await settled(1500, 6000);
+        } else {
+            await sleep(0.7, 2.0);
+        }
+
+        // Occasionally pause longer to simulate reading
+        if (Math.random() < 0.3) await sleep(1.5, 4.0);
+
+        // Occasionally scroll back up slightly
+        if (Math.random() < 0.15) {
+            position = Math.max(0, position - randInt(100, 300));
+            window.scrollTo(0, position);
+            await sleep(0.7, 1.5);
+        }
+
+        // Lazy loading may have grown the page
+        pageHeight = document.body.scrollHeight;
+    }
+
+    observer.disconnect();
+    window.scrollTo(0, randInt(Math.floor(pageHeight * 0.2), Math.floor(pageHeight * 0.5)));
+}"""
+
+# A word plus its trailing whitespace, the unit _human_type() types in one call
+TYPING_CHUNK_RE = re.compile(r'\S+\s*|\s+')
+
+# Per-character chances of a corrected typo and of a thinking pause in _human_type()
+TYPO_CHANCE = 0.03
+PAUSE_CHANCE = 0.02
+
+# Loaded activity cards and the placeholder shown on an empty activity tab
+ACTIVITY_CARD_SELECTOR = "ul.display-flex.flex-wrap.list-style-none.justify-center > li"
+ACTIVITY_EMPTY_SELECTOR = ".pv-recent-activity-empty-container"
+# Counts the loaded cards, then scrolls to the bottom to load more
+ACTIVITY_SCROLL_STEP_SCRIPT = """(selector) => {
+    const count = document.querySelectorAll(selector).length;
+    window.scrollTo(0, document.body.scrollHeight);
+    return count;
+}"""
+
+# Markup of the experience card alone, located the same way as
+# _find_experience_section, so Python only parses that fragment
+EXPERIENCE_HTML_SCRIPT = """() => {
+    let section = null;
+    const anchor = document.querySelector('div#experience');
+    if (anchor) {
+        section = anchor.closest('section');
+    } else {
+        for (const h of document.querySelectorAll('h2, h3')) {
+            if (h.textContent.trim().toLowerCase().includes('experience')) {
+                section = h.closest('section') || h.closest('div');
+                break;
+            }
+        }
+    }
+    return section ? section.outerHTML : null;
+}"""
+
+# Name, headline and location from the profile top card
+TOP_CARD_SCRIPT = """() => {
+    const text = (selector) => {
+        const el = document.querySelector(selector);
+        return el ? el.innerText.trim() : null;
+    };
+    return {
+        name: text('h1.t-24.v-align-middle'),
+        headline: text('.text-body-medium.break-words'),
+        location: text('.text-body-small.inline.t-black--light.break-words')
+    };
+}"""
+
+# Profile URL, email and connection date from the open contact info modal
+CONTACT_INFO_SCRIPT = """() => {
+    const info = {};
+    for (const section of document.querySelectorAll('section.pv-contact-info__contact-type')) {
+        // The header identifies the type of information
+        const header = section.querySelector('h3.pv-contact-info__header');
+        if (!header) continue;
+        const headerText = header.innerText.trim();
+        if (headerText.includes('Profile')) {
+            const link = section.querySelector('a');
+            if (link) info.linkedin_profile_url = link.getAttribute('href');
+        } else if (headerText.includes('Email')) {
+            const email = section.querySelector('a');
+            if (email) info.email = email.innerText.trim();
+        } else if (headerText.includes('Connected')) {
+            const date = section.querySelector('span.t-14.t-black.t-normal');
+            if (date) info.connected_date = date.innerText.trim();
+        }
+        // This can be extended for other fields like 'Phone', 'Website', etc.
+    }
+    return info;
+}"""
+
+# Every education entry's fields in one pass, or null without an education section
+EDUCATION_SCRIPT = """() => {
+    const section = document.querySelector('div#education');
+    if (!section) return null;
+    const list = section.parentElement.querySelector('ul.WgIFHisduBdzsrWAQusrmrSnsmWzyvZPoKDpc');
+    if (!list) return [];
+    const fields = {
+        school: ".mr1.hoverable-link-text.t-bold span[aria-hidden='true']",
+        degree: ".t-14.t-normal span[aria-hidden='true']",
+        date_range: ".t-14.t-normal.t-black--light .pvs-entity__caption-wrapper[aria-hidden='true']",
+        description: ".PmOOsbJzcyufrBWTZcPmdIKMvpIECBvYKLZYQ span[aria-hidden='true']"
+    };
+    return Array.from(list.querySelectorAll('li.artdeco-list__item'), (item) => {
+        const edu = {};
+        for (const [key, selector] of Object.entries(fields)) {
+            const el = item.querySelector(selector);
+            if (el) edu[key] = el.innerText.trim();
+        }
+        return edu;
+    });
+}"""
+
+# Centre points of `count` random interactive elements inside the viewport
+HOVER_TARGETS_SCRIPT = """(count) => {
+    const visible = [];
+    for (const el of document.querySelectorAll("a, button, [role='button']")) {
+        const box = el.getBoundingClientRect();
+        if (box.width > 0 && box.height > 0 && box.top >= 0 && box.left >= 0
+                && box.bottom <= window.innerHeight && box.right <= window.innerWidth) {
+            visible.push([box.left + box.width / 2, box.top + box.height / 2]);
+        }
+    }
+    if (!visible.length) return [];
+    return Array.from({ length: count }, () => visible[Math.floor(Math.random() * visible.length)]);
+}"""
+
+# In-page CAPTCHA and human-verification checks for _check_for_blocks()
+BLOCK_PROBE_SCRIPT = """() => {
+    const iframes = document.querySelectorAll('iframe[src*="recaptcha"]');
+    let recaptchaVisible = false;
+    for (const iframe of iframes) {
+        const box = iframe.getBoundingClientRect();
+        if (box.height > 20 && box.width > 20) {
+            recaptchaVisible = true;
+            break;
+        }
+    }
+    const captchaWidget = !!document.querySelector('#captcha, .g-recaptcha')
+        || Array.from(document.getElementsByTagName('strong')).some(el => el.textContent === 'reCAPTCHA');
+    const humanCheck = document.documentElement.textContent.toLowerCase().includes('please verify you are a human');
+    return { recaptchaIframes: iframes.length, recaptchaVisible, captchaWidget, humanCheck };
+}"""
+
+# How long a successful profile scrape vouches for the session's cookies
+AUTH_CHECK_TTL = 300
+
+# Idle seconds after which a mass-scraper worker refreshes its session
+SESSION_IDLE_REFRESH = 1800  # 30 minutes
+
+# URL fragments that mean a checkpoint, challenge or login page
+AUTHWALL_URL_TOKENS = ("checkpoint", "challenge", "authwall", "/login", "/signup")
+
+class PlaywrightProfileScraper:
+    """LinkedIn profile scraper using Playwright"""
+    def __init__(self, worker_id: int, credentials: Dict[str, str], proxy: Optional[str] = None, headless: bool = False,
+                 use_shared_browser: bool = False, proxy_pool: Optional[ProxyPool] = None):
+        """Initialize the scraper with credentials"""
+        self.worker_id = worker_id
+        self.email = credentials['email']
+        self.password = credentials['password']
+        self.proxy = proxy
+        # When set, the worker leases its proxy from the pool and rotates on failure
+        self.proxy_pool = proxy_pool
+        self._proxy_failed = False
+        self.headless = headless
+        # When set, open contexts on the process-wide browser instead of launching one
+        self.use_shared_browser = use_shared_browser
+        self.playwright = None
+        self.proxy_config = None
+        self.browser = None
+        self.context_pool = None
+        # One spare context is enough: contexts are only taken on a session start
+        self.context_pool_size = 1
+        self._release_context = None
+        # Digest of the last cookie jar written to disk
+        self._cookies_digest = None
+        # Background tasks this worker started (strong refs until they finish)
+        # and the event that stops the keep-alive loop
+        self._owned_tasks = set()
+        self._stop_activity = asyncio.Event()
+        # Monotonic time of the last profile scraped while logged in
+        self._last_auth_ok = None
+        self.context = None
+        self.page = None
+        self.session_start_time = None
+        self.profiles_scraped = 0
+        self.max_profiles_per_session = random.randint(5, 10)  # Randomize session limits
+        self.session_duration_limit = timedelta(hours=random.uniform(2, 4))  # Random session duration
+        self.user_agents = load_user_agents()
+        
+        # State tracking
+        self.is_logged_in = False
+        self.in_cooldown = False
+        self.cooldown_until = None
+        
+        # Configuration
+        self.config = {
+            'scrape_activity': True,  # Whether to scrape activity (posts, comments)
+            'debug_dumps': False  # Whether to save each profile's page source
+        }
+    
+    async def _is_authwall_present(self) -> bool:
+        """Detect if we’re stuck on an auth-wall or login page rather than seeing feed content."""
+        probe = await self.page.evaluate(AUTHWALL_PROBE_SCRIPT)
+
+        # 1) If we see the main feed container, we're good.
+        if probe["feed"]:
+            return False
+
+        # 2) If the login form or authwall overlay is visible, we're blocked
+        if probe["login"]:
+            return True
+
+        # 3) URL heuristics for checkpoints or authwalls
+        url = self.page.url.lower()
+        if any(token in url for token in AUTHWALL_URL_TOKENS):
+            return True
+
+        # 4) Fallback: if we see the username field but aren't in feed
+        if probe["username"]:
+            return True
+
+        return False
+
+    async def save_cookies(self, context, path):
+        try:
+            cookies = await context.cookies()
+            data = orjson.dumps(cookies)
+            # Skip the write when the jar hasn't changed since the last save
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._cookies_digest:
+                logger.debug(f"Worker {self.worker_id}: Cookies unchanged, skipping save")
+                return
+            await asyncio.to_thread(atomic_write, path, data)
+            self._cookies_digest = digest
+            logger.info(f"Worker {self.worker_id}: Cookies saved to {path}")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Could not save cookies: {e}")
+
+    async def load_cookies(self, context, path):
+        try:
+            data = await asyncio.to_thread(self._read_cookie_file, path)
+            if data:
+                cookies = orjson.loads(data)
+                if cookies:  # Only load if cookies exist
+                    await context.add_cookies(cookies)
+                    self._cookies_digest = hashlib.blake2b(data, digest_size=16).digest()
+                    logger.info(f"Worker {self.worker_id}: Cookies loaded from {path}")
+                    return True
+        except (orjson.JSONDecodeError, FileNotFoundError) as e:
+            logger.warning(f"Worker {self.worker_id}: Could not load cookies: {e}")
+        return False
+
+    @staticmethod
+    def _read_cookie_file(path):
+        """Return the raw cookie file bytes, or None if there is nothing to load"""
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, "rb") as f:
+                return f.read()
+        return None
+
+    async def test_proxy(self, proxy_url):
+        """Test if a proxy is working"""
+        try:
+            proxies = {
+                'http': proxy_url,
+                'https': proxy_url
+            }
+            # Run the blocking probe on a thread so other workers keep going
+            response = await asyncio.to_thread(
+                PROXY_TEST_SESSION.get, 'https://httpbin.org/ip', proxies=proxies, timeout=10
+            )
+            if response.status_code == 200:
+                logger.info(f"Proxy {proxy_url} is working")
+                return True
+        except Exception as e:
+            logger.warning(f"Proxy {proxy_url} failed test: {e}")
+        return False
+
+    async def initialize(self):
+        """Initialize Playwright browser, context, and optionally restore session via cookies."""
+        try:
+            # The browser and the context pool survive session refreshes;
+            # only the context and page are replaced
+            if self.proxy_pool and (self.proxy is None or self._proxy_failed):
+                await self._rotate_proxy()
+            elif not self.browser:
+                self.proxy_config = await self._build_proxy_config()
+            if not self.browser:
+                if self.use_shared_browser:
+                    # Shared browser: this worker only owns its contexts and pages
+                    self.browser = await get_shared_browser(self.headless)
+                else:
+                    self.playwright = await async_playwright().start()
+                    self.browser = await self.playwright.chromium.launch(
+                        headless=self.headless,
+                        args=BROWSER_ARGS
+                    )
+            if not self.browser:
+                logger.error(f"Worker {self.worker_id}: Failed to launch browser.")
+                await self.cleanup()
+                return False
+
+            if not self.context_pool:
+                # The spare waits for the next session rotation, which comes at
+                # the latest after session_duration_limit; don't reap it sooner
+                self.context_pool = BrowserContextPool(
+                    self.browser, self.context_pool_size, self._new_context,
+                    max_idle_time=self.session_duration_limit.total_seconds()
+                )
+                await self.context_pool.warm_up()
+
+            # Take a pre-warmed context with a fresh fingerprint
+            self.context, self._release_context = await self.context_pool.acquire()
+            if not self.context:
+                logger.error(f"Worker {self.worker_id}: Failed to create browser context.")
+                await self.cleanup()
+                return False
+
+            # New page
+            self.page = await self.context.new_page()
+            if not self.page:
+                logger.error(f"Worker {self.worker_id}: Failed to create browser page.")
+                await self.cleanup()
+                return False
+
+            self.page.set_default_timeout(30000)
+            self.page.on("console", lambda msg: logger.debug(f"Browser console: {msg.text}"))
+            self._check_cooldown_state()
+
+            if self.in_cooldown:
+                logger.info(f"Worker {self.worker_id}: In cooldown until {self.cooldown_until}")
+                return True
+
+            # --- Attempt to load cookies BEFORE any navigation ---
+            cookie_path = f"cookies_worker_{self.worker_id}.json"
+            cookies_loaded = await self.load_cookies(self.context, cookie_path)
+
+            self.session_start_time = datetime.now()
+            self.profiles_scraped = 0
+
+            # Always go to /feed and check login status
+            try:
+                await self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
+            except Exception as nav_ex:
+                logger.error(f"Worker {self.worker_id}: Couldn't reach feed page: {nav_ex}")
+                await self.cleanup()
+                return False
+
+            # Robust login/authwall check
+            if cookies_loaded and "feed" in self.page.url and not await self._is_authwall_present():
+                self.is_logged_in = True
+                logger.info(f"Worker {self.worker_id}: Session restored via cookies.")
+            else:
+                self.is_logged_in = False
+                logger.info(f"Worker {self.worker_id}: Not logged in, will perform fresh login.")
+
+            self.last_activity_time = datetime.now()
+            self._check_cooldown_state()
+
+            # Only start activity simulation if logged in and not in cooldown
+            if not self.in_cooldown and self.is_logged_in:
+                await self.start_activity_simulation()
+
+            return True  # So login() will run if not authenticated
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error initializing browser: {e}")
+            logger.debug(traceback.format_exc())
+            await self.cleanup()
+            return False
+
+    async def _build_proxy_config(self):
+        """Test the worker proxy and convert it to a Playwright proxy dict"""
+        proxy_config = None
+        if self.proxy:
+            logger.info(f"Worker {self.worker_id}: Testing proxy {self.proxy}")
+            if await self.test_proxy(self.proxy):
+                proxy_config = parse_proxy(self.proxy)
+            else:
+                logger.warning(f"Worker {self.worker_id}: Proxy failed test, proceeding without proxy")
+                if self.proxy_pool:
+                    self.proxy_pool.report_failure(self.proxy)
+                    self.proxy_pool.release(self.proxy)
+                self.proxy = None
+        return proxy_config
+
+    async def _rotate_proxy(self):
+        """Swap this worker's proxy for the pool's best available one"""
+        if self.proxy:
+            self.proxy_pool.release(self.proxy)
+        self.proxy = self.proxy_pool.acquire()
+        self._proxy_failed = False
+        self.proxy_config = await self._build_proxy_config()
+        # Warm contexts were created with the old proxy
+        if self.context_pool:
+            await self.context_pool.close()
+            self.context_pool = None
+
+    async def _new_context(self, browser):
+        """Create a stealth context with a randomized viewport, UA and timezone"""
+        viewport = random.choice([
+            {'width': 1366, 'height': 768},
+            {'width': 1440, 'height': 900},
+            {'width': 1536, 'height': 864},
+            {'width': 1680, 'height': 1050},
+            {'width': 1920, 'height': 1080}
+        ])
+
+        user_agent = random.choice(self.user_agents)
+
+        context = await browser.new_context(
+            viewport=viewport,
+            user_agent=user_agent,
+            locale="en-US",
+            timezone_id=random.choice([
+                "America/New_York", "Europe/London", "Asia/Tokyo"
+            ]),
+            geolocation={"longitude": -122.084, "latitude": 37.422},
+            permissions=["geolocation"],
+            extra_http_headers={"Accept-Language": "en-US,en;q=0.9"},
+            proxy=self.proxy_config,
+        )
+        await context.route("**/*", self._block_heavy_resources)
+        await self._apply_stealth_mode(context)
+        return context
+
+    async def _block_heavy_resources(self, route):
+        """Abort images, media, fonts and tracking beacons; the scraper only reads the DOM"""
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.match(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _apply_stealth_mode(self, context=None):
+        """Apply stealth mode to avoid detection"""
+        context = context or self.context
+        # JavaScript to modify navigator properties
+        # Init scripts run as plain source, so the body must be invoked (IIFE);
+        # the guard makes re-injection into the same document a no-op
+        await context.add_init_script("""
+        (() => {
+            if (window.__stealth_applied__) return;
+            Object.defineProperty(window, '__stealth_applied__', { value: true, enumerable: false });
+
+            // Fingerprint values: table lookups and |0 truncation instead of Math.pow/Math.floor
+            const DEVICE_MEMORY_GB = [16, 32, 64, 128];
+
+            // Function to override property
+            const overrideProperty = (obj, propName, value) => {
+                Object.defineProperty(obj, propName, {
+                    value,
+                    writable: false,
+                    configurable: false,
+                    enumerable: true
+                });
+            };
+            
+            // WebDriver
+            overrideProperty(navigator, 'webdriver', false);
+            
+            // Plugins
+            overrideProperty(navigator, 'plugins', {
+                length: ((Math.random() * 5) | 0) + 3,
+                refresh: () => {},
+                item: () => {},
+                namedItem: () => {},
+                // Add some fake plugins
+                0: { name: 'Chrome PDF Plugin', description: 'Portable Document Format', filename: 'internal-pdf-viewer' },
+                1: { name: 'Chrome PDF Viewer', description: '', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+                2: { name: 'Native Client', description: '', filename: 'internal-nacl-plugin' }
+            });
+            
+            // User agent components
+            const brands = [
+                { brand: 'Chromium', version: '115' },
+                { brand: 'Not:A-Brand', version: '8' },
+                { brand: 'Google Chrome', version: '115' }
+            ];
+            
+            // userAgentData
+            if (!navigator.userAgentData) {
+                overrideProperty(navigator, 'userAgentData', {
+                    brands,
+                    mobile: false,
+                    platform: 'Windows',
+                    toJSON: () => ({}),
+                    getHighEntropyValues: () => Promise.resolve({
+                        architecture: 'x86',
+                        bitness: '64',
+                        brands,
+                        mobile: false,
+                        model: '',
+                        platform: 'Windows',
+                        platformVersion: '10.0',
+                        uaFullVersion: '120.0.6099.109'
+                    })
+                });
+            }
+            
+            // Hardware concurrency
+            overrideProperty(navigator, 'hardwareConcurrency', ((Math.random() * 8) | 0) + 4);
+            
+            // Device memory
+            overrideProperty(navigator, 'deviceMemory', DEVICE_MEMORY_GB[(Math.random() * 4) | 0]);
+            
+            // Languages
+            overrideProperty(navigator, 'languages', ['en-US', 'en']);
+            
+            // Add Chrome object
+            if (!window.chrome) {
+                window.chrome = {
+                    runtime: {},
+                    loadTimes: () => {},
+                    csi: () => {},
+                    app: {}
+                };
+            }
+        })();
+        """)
+
+    async def start_activity_simulation(self):
+        """Start a background task to keep the session alive with random activity"""
+        self._stop_activity.clear()
+        self._spawn(self._activity_simulation_loop(), f"activity_simulation_{self.worker_id}")
+
+    def _dump_html(self, path, html):
+        """Write a gzipped debug copy of the page source on a background thread"""
+        self._spawn(asyncio.to_thread(_write_gz, f"{path}.gz", html), f"dump_html_{self.worker_id}")
+
+    def _spawn(self, coro, name):
+        """Start a task owned by this worker; _end_session() cancels it"""
+        task = asyncio.create_task(coro, name=name)
+        self._owned_tasks.add(task)
+        task.add_done_callback(self._owned_tasks.discard)
+        return task
+
+    async def _activity_simulation_loop(self):
+        """Loop that performs random human-like actions to keep the session alive"""
+        logger.info(f"Worker {self.worker_id}: Started activity simulation loop")
+        
+        while self.is_logged_in and not self.in_cooldown:
+            # Wait for a random interval (5-15 minutes between activities),
+            # waking early if the session is ending
+            try:
+                await asyncio.wait_for(self._stop_activity.wait(), timeout=random.uniform(300, 900))
+                break
+            except asyncio.TimeoutError:
+                pass
+            
+            if not self.is_logged_in or self.in_cooldown:
+                break
+                
+            try:
+                logger.info(f"Worker {self.worker_id}: Performing random activity to keep session alive")
+                
+                # Select a random activity
+                activities = [
+                    self._check_feed_activity,
+                    self._check_notifications_activity,
+                    self._check_my_network_activity,
+                    self._check_messaging_activity,
+                    self._visit_own_profile_activity
+                ]
+                
+                # Perform 1-2 random activities
+                for _ in range(random.randint(1, 2)):
+                    activity = random.choice(activities)
+                    await activity()
+                    await self._human_sleep(2, 5)
+                    
+            except Exception as e:
+                logger.error(f"Worker {self.worker_id}: Error in activity simulation: {e}")
+
+    async def _check_feed_activity(self):
+        """Check feed and scroll through it"""
+        try:
+            await self.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
+            await self._human_sleep(2, 4)
+            
+            # Scroll feed 2-5 times
+            await self._scroll_burst(random.randint(2, 5), 300, 800, 1, 3)
+                
+            logger.debug(f"Worker {self.worker_id}: Performed feed activity")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Feed activity failed: {e}")
+
+    async def _check_notifications_activity(self):
+        """Check notifications"""
+        try:
+            # Click notifications icon
+            await self.page.click("a[data-test-global-nav-link='notifications']")
+            await self._human_sleep(2, 4)
+            
+            # Scroll through notifications
+            await self._scroll_burst(random.randint(1, 3), 300, 300, 1, 2)
+                
+            # Click back to close
+            await self.page.click("body")
+            await self._human_sleep(1, 2)
+            
+            logger.debug(f"Worker {self.worker_id}: Performed notifications activity")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Notifications activity failed: {e}")
+
+    async def _check_my_network_activity(self):
+        """Check my network page"""
+        try:
+            await self.page.click("a[data-test-global-nav-link='mynetwork']")
+            await self._human_sleep(2, 4)
+            
+            # Scroll through network page
+            await self._scroll_burst(random.randint(1, 3), 300, 300, 1, 2)
+                
+            logger.debug(f"Worker {self.worker_id}: Performed my network activity")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: My network activity failed: {e}")
+
+    async def _check_messaging_activity(self):
+        """Check messaging page"""
+        try:
+            await self.page.click("a[data-test-global-nav-link='messaging']")
+            await self._human_sleep(2, 4)
+            
+            # Scroll through messages
+            await self._scroll_burst(1, 200, 200, 1, 2)
+            
+            logger.debug(f"Worker {self.worker_id}: Performed messaging activity")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Messaging activity failed: {e}")
+
+    async def _visit_own_profile_activity(self):
+        """Visit own profile"""
+        try:
+            # Click on profile picture/menu
+            await self.page.click("button.global-nav__me-photo")
+            await self._human_sleep(1, 2)
+            
+            # Click "View profile"
+            profile_link = await self.page.query_selector("a[href*='/in/'][data-link-to='profile']")
+            if profile_link:
+                await profile_link.click()
+                await self._human_sleep(3, 5)
+                
+                # Scroll profile
+                await self._scroll_page()
+                
+            logger.debug(f"Worker {self.worker_id}: Performed own profile visit activity")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Own profile activity failed: {e}")
+
+    async def _end_session(self):
+        """Close the current page and discard its context, keeping the browser"""
+        self._last_auth_ok = None
+        self._stop_activity.set()
+        tasks = list(self._owned_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.page:
+            await self.page.close()
+            self.page = None
+        if self.context:
+            # A used context carries the old session's fingerprint, so it is
+            # closed rather than returned to the pool
+            if self._release_context:
+                await self._release_context(discard=True)
+                self._release_context = None
+            else:
+                await self.context.close()
+            self.context = None
+
+    async def cleanup(self):
+        try:
+            await self._end_session()
+            if self.context_pool:
+                await self.context_pool.close()
+                self.context_pool = None
+            if self.browser:
+                # A shared browser outlives the worker; close_shared_browser() ends it
+                if not self.use_shared_browser:
+                    await self.browser.close()
+                self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+            if self.proxy_pool and self.proxy:
+                self.proxy_pool.release(self.proxy)
+                self.proxy = None
+            logger.info(f"Worker {self.worker_id}: Resources cleaned up")
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error during cleanup: {e}")
+
+    async def login(self):
+        """Log into LinkedIn with robust session and authentication checks."""
+        # 1) Try to restore an existing session
+        try:
+            logger.info(f"Worker {self.worker_id}: Checking LinkedIn authentication status")
+            await self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Could not reach feed page for session check: {e}")
+
+        # If feed loads and no auth-wall, we’re good
+        if "feed" in self.page.url and not await self._is_authwall_present():
+            logger.info(f"Worker {self.worker_id}: Session restored via cookies.")
+            self.is_logged_in = True
+            return True
+
+        # 2) Fresh login
+        logger.info(f"Worker {self.worker_id}: Performing fresh login")
+        await self.page.goto("https://www.linkedin.com/login", wait_until="networkidle")
+
+        # Enter email
+        logger.debug(f"Worker {self.worker_id}: Entering email")
+        await self.page.wait_for_selector("#username", state="visible", timeout=10000)
+        await self._human_type("#username", self.email)
+
+        # Enter password
+        logger.debug(f"Worker {self.worker_id}: Entering password")
+        await self._human_type("input[name='session_password']", self.password)
+
+        # Submit form
+        logger.debug(f"Worker {self.worker_id}: Submitting login form")
+        await self.page.click("button[type='submit']")
+        await self._human_sleep(3, 6)
+
+        # Handle 2FA or other challenges
+        await self._handle_verification()
+
+        # 3) Verify real authentication by revisiting the feed
+        await self.page.goto("https://www.linkedin.com/feed/", wait_until="networkidle")
+        if "feed" in self.page.url and not await self._is_authwall_present():
+            logger.info(f"Worker {self.worker_id}: Login succeeded")
+            self.is_logged_in = True
+
+            # Persist cookies for next run
+            cookie_path = f"cookies_worker_{self.worker_id}.json"
+            await self.save_cookies(self.context, cookie_path)
+            return True
+
+        # Login failed or hit auth-wall
+        logger.warning(f"Worker {self.worker_id}: Login failed or auth-wall detected. URL={self.page.url}")
+        self.is_logged_in = False
+        return False
+    
+    async def _handle_verification(self):
+        """Handle verification challenges if they appear"""
+        try:
+            # Check for security verification
+            if "checkpoint" in self.page.url or "challenge" in self.page.url:
+                logger.warning(f"Worker {self.worker_id}: Hit verification challenge: {self.page.url}")
+                
+                # Check for email verification option
+                try:
+                    email_button = await self.page.wait_for_selector("button[data-auth-method='EMAIL']", timeout=5000)
+                    if email_button:
+                        await email_button.click()
+                        logger.info(f"Worker {self.worker_id}: Selected email verification")
+                        await self._human_sleep(2, 3)
+                        
+                        # Click send code button
+                        send_button = await self.page.wait_for_selector("button[type='submit']", timeout=5000)
+                        if send_button:
+                            await send_button.click()
+                            logger.info(f"Worker {self.worker_id}: Requested verification code")
+                            
+                            # Get verification code from user; prompt on an executor
+                            # thread so the other workers keep running meanwhile
+                            code = await asyncio.get_running_loop().run_in_executor(
+                                None, input, f"Worker {self.worker_id}: Enter the verification code sent to your email: "
+                            )
+                            
+                            # Enter the code
+                            await self._human_type("#input__email_verification_pin", code)
+                            
+                            # Submit the form
+                            await self.page.click("button[type='submit']")
+                            await self._human_sleep(3, 5)
+                except Exception as e:
+                    logger.warning(f"Worker {self.worker_id}: Couldn't process email verification: {e}")
+                
+                # If we're still on a challenge page, ask for manual intervention
+                if "checkpoint" in self.page.url or "challenge" in self.page.url:
+                    logger.warning(f"Worker {self.worker_id}: Manual verification required")
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, input, f"Worker {self.worker_id}: Please complete verification manually in the browser window and press Enter when done..."
+                    )
+                
+                return True
+            
+            # Wait once for whichever post-login prompt shows up first instead of
+            # paying a separate timeout per prompt, then probe for both
+            try:
+                await self.page.locator(", ".join(POST_LOGIN_PROMPT_SELECTORS)).first.wait_for(timeout=3000)
+            except Exception:
+                return False
+            remember_present, dismiss_present = await self.page.evaluate(
+                SELECTORS_PRESENT_SCRIPT, list(POST_LOGIN_PROMPT_SELECTORS)
+            )
+
+            # "Remember this device" prompt
+            if remember_present:
+                try:
+                    await self.page.click(REMEMBER_DEVICE_SELECTOR, timeout=3000)
+                    logger.info(f"Worker {self.worker_id}: Clicked 'Remember this device'")
+                    await self._human_sleep(1, 2)
+                except:
+                    pass
+            
+            # Premium offer or other popups
+            if dismiss_present:
+                try:
+                    await self.page.click(MODAL_DISMISS_SELECTOR, timeout=3000)
+                    logger.info(f"Worker {self.worker_id}: Dismissed modal popup")
+                    await self._human_sleep(1, 2)
+                except:
+                    pass
+            
+            return False
+            
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error handling verification: {e}")
+            return False
+    
+    async def scrape_profile(self, profile_url: str):
+        """Scrape a LinkedIn profile with robust error handling and processed URL tracking"""
+
+        if not self.session_start_time:
+            self.session_start_time = datetime.now()
+
+        # Check cooldown status first - if in cooldown, don't process anything
+        if self.in_cooldown:
+            if datetime.now() < self.cooldown_until:
+                remaining_time = (self.cooldown_until - datetime.now()).total_seconds()
+                logger.warning(f"Worker {self.worker_id}: In cooldown until {self.cooldown_until} ({remaining_time/3600:.1f} hours remaining)")
+                return None
+            else:
+                logger.info(f"Worker {self.worker_id}: Cooldown expired, resuming operations")
+                self.in_cooldown = False
+                # Clear cooldown state
+                update_state(f"worker_{self.worker_id}_cooldown", {"in_cooldown": False, "cooldown_until": None})
+
+        # Check if session needs to be refreshed
+        if (
+            datetime.now() - self.session_start_time > self.session_duration_limit or 
+            self.profiles_scraped >= self.max_profiles_per_session
+        ):
+            logger.info(f"Worker {self.worker_id}: Session limit reached. Starting a fresh session.")
+            await self._end_session()
+            await self.initialize()
+        elif self._proxy_failed:
+            logger.info(f"Worker {self.worker_id}: Proxy failed. Starting a fresh session on another proxy.")
+            await self._end_session()
+            await self.initialize()
+
+        # Ensure logged in
+        if not self.is_logged_in:
+            login_success = await self.login()
+            if not login_success:
+                logger.error(f"Worker {self.worker_id}: Failed to login")
+                return None
+
+        # --- Skip if already processed ---
+        state = load_state()
+        if is_processed(profile_url):
+            logger.info(f"Worker {self.worker_id}: Profile {profile_url} already processed, skipping.")
+            return None
+
+        # Get previous scraping state for this profile
+        profile_state = state.get(profile_url, {})
+        last_post_time = profile_state.get("last_post_time")
+        last_comment_time = profile_state.get("last_comment_time")
+        last_reaction_time = profile_state.get("last_reaction_time")
+
+        # Initialize profile data structure
+        profile_data = {
+            'basic_info': {},
+            'experience': [],
+            'scraped_at': datetime.now().isoformat(),
+            'profile_url': profile_url,
+            'scraper_worker_id': self.worker_id
+        }
+
+        try:
+            # At most MAX_CONCURRENT_PAGES pages are driven at once, so
+            # concurrency follows I/O capacity rather than worker count; this
+            # permit covers self.page
+            async with PAGE_SEMAPHORE:
+                # Navigate to profile
+                logger.info(f"Worker {self.worker_id}: Navigating to {profile_url}")
+                started = time.monotonic()
+                try:
+                    await self.page.goto(profile_url, wait_until="domcontentloaded", timeout=30000)
+                except Exception:
+                    # Blame the proxy so the next call rotates to another one
+                    if self.proxy_pool and self.proxy:
+                        self.proxy_pool.report_failure(self.proxy)
+                        self._proxy_failed = True
+                    raise
+                if self.proxy_pool and self.proxy:
+                    self.proxy_pool.report_success(self.proxy, time.monotonic() - started)
+                await self._human_sleep(2, 4)
+
+                # Check if we need to handle sign-in wall
+                await self._handle_sign_in_wall()
+
+                # Scroll the page to trigger lazy loading
+                await self._scroll_page()
+
+                # Check for blocks or limits
+                if await self._check_for_blocks():
+                    logger.warning(f"Worker {self.worker_id}: Detected block or limit")
+                    self._enter_cooldown()
+                    return None
+
+                # Save page source for debugging; opt-in, since it serializes
+                # the whole DOM on every profile
+                if self.config.get('debug_dumps', False):
+                    self._dump_html(f"profile_source_{self.worker_id}.html", await self.page.content())
+
+                # Serialize only the experience card instead of the whole DOM
+                experience_html = await self.page.evaluate(EXPERIENCE_HTML_SCRIPT)
+
+                # Extract profile sections
+                logger.info(f"Worker {self.worker_id}: Extracting profile data")
+                # Parse experience on a worker thread while the page-side
+                # extraction (including the contact modal wait) runs
+                profile_data['basic_info'], profile_data['experience'] = await asyncio.gather(
+                    self._extract_basic_info(),
+                    asyncio.to_thread(self._extract_experience, experience_html)
+                )
+
+                # Extract activity data if configured
+                if self.config.get('scrape_activity', False):
+                    logger.info(f"Worker {self.worker_id}: Extracting activity data")
+                    activity_data, new_times = await self.scrape_user_activity(
+                        profile_url,
+                        last_post_time,
+                        last_comment_time,
+                        last_reaction_time
+                    )
+                    profile_data['activity'] = activity_data
+
+                    # Save the latest timestamps for incremental scraping
+                    update_state(profile_url, new_times)
+
+            # Increment the profile count
+            self.profiles_scraped += 1
+
+            # Save the profile data; the JSON dump and file write run on a
+            # worker thread so the other workers' coroutines keep going
+            await asyncio.to_thread(self._save_profile_data, profile_data)
+
+            # --- Mark as processed ---
+            mark_processed([profile_url])
+
+            self._last_auth_ok = time.monotonic()
+            logger.info(f"Worker {self.worker_id}: Successfully scraped profile {profile_url}")
+
+            return profile_data
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error scraping profile {profile_url}: {e}")
+            logger.debug(traceback.format_exc())
+            return None
+
+    async def _handle_sign_in_wall(self):
+        """Handle the LinkedIn sign-in wall if it appears"""
+        try:
+            # A recent successful profile on this session means the cookies are
+            # still good; skip the probe unless the URL itself looks like a wall
+            if (
+                self._last_auth_ok is not None
+                and time.monotonic() - self._last_auth_ok < AUTH_CHECK_TTL
+                and not any(token in self.page.url.lower() for token in AUTHWALL_URL_TOKENS)
+            ):
+                return
+
+            # Check if we hit a sign-in wall
+            sign_in_wall = await self.page.query_selector(".signin-content, .organic-signup-modal")
+            
+            if sign_in_wall:
+                logger.info(f"Worker {self.worker_id}: Hit sign-in wall, logging in again")
+                await self.login()
+                
+                # Navigate back to the profile
+                current_url = self.page.url
+                await self.page.goto(current_url, wait_until="domcontentloaded")
+                await self._human_sleep(2, 4)
+        except:
+            pass
+    
+    async def _scroll_page(self):
+        """Scroll the page to simulate human behavior and trigger lazy loading"""
+        # Initial pause to let the page load
+        await self._human_sleep(2, 4)
+        
+        # The whole scroll-down pass runs in-page, re-reading the height as
+        # lazy content loads, so it costs one round-trip instead of several per step
+        await self.page.evaluate(SCROLL_PAGE_SCRIPT)
+        await self._human_sleep(1.0, 2.5)
+    
+    async def _check_for_blocks(self):
+        """
+        Improved block/captcha detection:
+        - Checks for known block URLs.
+        - Checks for visible or structural CAPTCHA in HTML (not just the word).
+        - Only blocks on visible reCAPTCHA iframe.
+        - Logs findings for debugging.
+        """
+        try:
+            current_url = self.page.url.lower()
+            # Every in-page check runs in one evaluate; the page HTML is only
+            # pulled across when there is a block worth dumping
+            probe = await self.page.evaluate(BLOCK_PROBE_SCRIPT)
+            blocked = False
+
+            # 1. URL-based block detection (very reliable)
+            block_url_keywords = [
+                "/checkpoint", "/authwall", "/login", "/signup", "/challenge", "/verify"
+            ]
+            for kw in block_url_keywords:
+                if kw in current_url:
+                    logger.warning(f"Worker {self.worker_id}: Block detected by URL: '{kw}' in '{current_url}'")
+                    blocked = True
+
+            # 2. Visible reCAPTCHA iframe (not just present in DOM)
+            if probe["recaptchaVisible"]:
+                logger.warning(f"Worker {self.worker_id}: **Visible** reCAPTCHA iframe detected on the page")
+                blocked = True
+            elif probe["recaptchaIframes"]:
+                logger.info(f"Worker {self.worker_id}: reCAPTCHA iframe(s) present but not visible—continuing")
+
+            # 3. Common structural CAPTCHA triggers in HTML (not just the word)
+            if probe["captchaWidget"]:
+                logger.warning(f"Worker {self.worker_id}: CAPTCHA widget detected in HTML")
+                blocked = True
+
+            # 4. Heuristic: page overlays asking to verify identity/human
+            if probe["humanCheck"]:
+                logger.warning(f"Worker {self.worker_id}: Human verification message found")
+                blocked = True
+
+            # 5. Save HTML for debugging if a block was detected
+            if blocked:
+                self._dump_html(f"debug_block_page_{self.worker_id}.html", await self.page.content())
+
+            return blocked
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error checking for blocks: {e}")
+            return False
+        
+    def _enter_cooldown(self, hours=None):
+        """
+        Enter a cooldown period to avoid detection
+        Optionally specify cooldown duration in hours, otherwise uses random default
+        """
+        if hours is None:
+            hours = random.uniform(2, 4)
+        
+        self.cooldown_until = datetime.now() + timedelta(hours=hours)
+        self.in_cooldown = True
+        
+        # Save the cooldown state to persist across restarts
+        try:
+            update_state(f"worker_{self.worker_id}_cooldown", {
+                "in_cooldown": True,
+                "cooldown_until": self.cooldown_until.isoformat()
+            })
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Failed to save cooldown state: {e}")
+        
+        logger.warning(f"Worker {self.worker_id}: Entering cooldown until {self.cooldown_until}")
+
+    def _check_cooldown_state(self):
+        """Check if worker should be in cooldown based on saved state"""
+        try:
+            state = load_state()
+            worker_state = state.get(f"worker_{self.worker_id}_cooldown", {})
+            
+            if worker_state.get("in_cooldown", False):
+                cooldown_until = datetime.fromisoformat(worker_state.get("cooldown_until", ""))
+                
+                if datetime.now() < cooldown_until:
+                    self.in_cooldown = True
+                    self.cooldown_until = cooldown_until
+                    logger.info(f"Worker {self.worker_id}: Restored cooldown state until {cooldown_until}")
+                else:
+                    # Cooldown expired
+                    self.in_cooldown = False
+                    self.cooldown_until = None
+                
+            # Clear the cooldown state
+            update_state(f"worker_{self.worker_id}_cooldown", {
+                "in_cooldown": False,
+                "cooldown_until": None
+            })
+            
+            logger.info(f"Worker {self.worker_id}: Cooldown expired")
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error checking cooldown state: {e}")
+
+    async def refresh_session(self):
+        """Refresh the session to avoid timeouts/logouts"""
+        try:
+            logger.info(f"Worker {self.worker_id}: Refreshing session")
+
+            # Navigate to LinkedIn homepage
+            await self.page.goto("https://www.linkedin.com/", wait_until="domcontentloaded")
+            await self._human_sleep(2, 4)
+
+            # Check if we need to re-login
+            if await self._is_authwall_present():
+                logger.info(f"Worker {self.worker_id}: Session expired, logging in again")
+                await self.login()
+            else:
+                logger.info(f"Worker {self.worker_id}: Session still valid")
+                
+            # Save cookies to maintain session for next time
+            cookie_path = f"cookies_worker_{self.worker_id}.json"
+            await self.save_cookies(self.context, cookie_path)
+
+            # Reset session start time
+            self.session_start_time = datetime.now()
+            return True
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error refreshing session: {e}")
+            return False
+
+    async def _perform_random_actions(self):
+        """Perform random actions to simulate natural browsing"""
+        try:
+            actions = [
+                self._random_scroll_action,
+                self._check_notifications_action,
+                self._hover_random_elements_action
+            ]
+                    
+            # Choose 1-2 random actions
+            num_actions = random.randint(1, 2)
+            selected_actions = random.sample(actions, num_actions)
+            
+            for action in selected_actions:
+                await action()
+                await self._human_sleep(1, 3)
+                    
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error performing random actions: {e}")
+    
+    async def _random_scroll_action(self):
+        """Random scrolling action"""
+        try:
+            scroll_amount = random.randint(300, 800)
+            direction = random.choice([-1, 1])
+            await self.page.evaluate(f"window.scrollBy(0, {direction * scroll_amount});")
+            logger.debug(f"Worker {self.worker_id}: Performed random scroll")
+        except:
+            pass
+    
+    async def _check_notifications_action(self):
+        """Check notifications action"""
+        try:
+            # Try to find and click notifications icon
+            notif_icon = await self.page.query_selector("a[data-test-global-nav-link='notifications']")
+            if notif_icon:
+                await notif_icon.click()
+                await self._human_sleep(2, 4)
+                
+                # Click back to close
+                await self.page.click("body")
+                logger.debug(f"Worker {self.worker_id}: Checked notifications")
+        except:
+            pass
+    
+    async def _hover_random_elements_action(self):
+        """Hover over random elements action"""
+        try:
+            # Pick 2-3 random on-screen interactive elements in-page and get
+            # back only their centre points, not a handle per element
+            targets = await self.page.evaluate(HOVER_TARGETS_SCRIPT, random.randint(2, 3))
+            
+            if targets:
+                for x, y in targets:
+                    await self.page.mouse.move(x, y, steps=random.randint(5, 15))
+                    await self._human_sleep(0.5, 1.5)
+                
+                logger.debug(f"Worker {self.worker_id}: Hovered over random elements")
+        except:
+            pass
+    
+    async def _scrape_contact_info_modal(self):
+        """
+        Parses the contact information from the modal dialog.
+        This function is designed to be called after the modal is visible.
+        """
+        contact_info = {}
+        try:
+            # Read every section of the modal (Profile, Email, etc.) in one round-trip
+            contact_info = await self.page.evaluate(CONTACT_INFO_SCRIPT)
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error parsing contact info modal: {e}")
+            
+        return contact_info
+
+    async def _extract_basic_info(self):
+        """Extracts basic profile information and clicks to reveal/scrape contact info."""
+        # The top card reads and the contact modal's click-and-wait don't
+        # depend on each other, so they run concurrently
+        basic_info, contact_details = await asyncio.gather(
+            self._extract_top_card(),
+            self._extract_contact_info()
+        )
+        basic_info.update(contact_details)
+        logger.info(f"Worker {self.worker_id}: Successfully extracted basic info.")
+        return basic_info
+
+    async def _extract_top_card(self):
+        """Extracts name, headline and location from the profile top card."""
+        basic_info = {}
+        
+        try:
+            # One round-trip for all three fields; missing elements come back null
+            top_card = await self.page.evaluate(TOP_CARD_SCRIPT)
+            basic_info = {key: value for key, value in top_card.items() if value is not None}
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: A critical error occurred in _extract_top_card: {e}")
+        return basic_info
+
+    async def _extract_contact_info(self):
+        """Opens the contact info modal, scrapes it and closes it again."""
+        contact_details = {}
+        try:
+            contact_info_link = await self.page.query_selector("a#top-card-text-details-contact-info")
+            if contact_info_link:
+                await contact_info_link.click()
+                
+                # Wait for the modal to be visible
+                await self.page.wait_for_selector("div.artdeco-modal__content section.pv-contact-info__contact-type", timeout=8000)
+                
+                # Use the new helper function to scrape the modal content
+                contact_details = await self._scrape_contact_info_modal()
+                
+                # Close the modal
+                close_button = await self.page.query_selector("button[aria-label='Dismiss']")
+                if close_button:
+                    await close_button.click()
+                    await self.page.wait_for_timeout(1000) # Give it a moment to close
+                
+                logger.info(f"Worker {self.worker_id}: Successfully scraped contact details: {contact_details}")
+
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id}: Could not open or scrape contact info modal: {e}")
+        return contact_details
+
+    def safe_get_text(self, soup_elem):
+        return soup_elem.get_text(strip=True) if soup_elem else None
+       
+    def _is_grouped_experience(self, top_li):
+        """Check if this is a grouped experience (multiple roles at same company)"""
+        # Look for nested ul elements that contain multiple li items (roles),
+        # stopping at the second role found
+        for ul in self._role_lists(top_li):
+            roles = 0
+            for li in ul.find_all('li', recursive=False):
+                if self._has_role_title(li):
+                    roles += 1
+                    if roles > 1:
+                        return True
+        return False
+
+    def _role_lists(self, top_li):
+        """Yield the ul elements whose nearest li ancestor is top_li"""
+        # Walk the subtree once without descending into nested li elements,
+        # instead of collecting every ul and climbing back up with find_parent
+        stack = [top_li]
+        while stack:
+            node = stack.pop()
+            children = [child for child in node.children if child.name]
+            for child in reversed(children):
+                if child.name == 'li':
+                    continue
+                stack.append(child)
+            if node is not top_li and node.name == 'ul':
+                yield node
+
+    def _has_role_title(self, li):
+        """Check if an li holds a job-title span (not skills or other metadata)"""
+        for span in ARIA_HIDDEN_SPAN_SELECTOR.iselect(li):
+            text = span.get_text(strip=True)
+            # Skip empty spans and ones that look like skills or other metadata
+            if not text or GROUPED_ROLE_SKIP_RE.search(text):
+                continue
+            # Check if parent structure suggests it's a job title
+            parent_div = span.find_parent('div')
+            if parent_div:
+                classes = parent_div.get('class', [])
+                if 'hoverable-link-text' in classes or 't-bold' in classes:
+                    return True
+        return False
+
+    def _extract_role(self,li, is_ungrouped):
+        """Extract a single role from an li element"""
+        role = {
+            "title": None,
+            "dates": None,
+            "location": None
+        }
+        
+        # Collect every aria-hidden span once as (text, span classes, parent div
+        # classes); title, date, location and caption lookups all read this list
+        spans = []
+        for span in ARIA_HIDDEN_SPAN_SELECTOR.select(li):
+            parent_div = span.find_parent('div')
+            spans.append((
+                span.get_text(strip=True),
+                span.get('class', []),
+                parent_div.get('class', []) if parent_div else None
+            ))
+
+        # Extract job title - look for spans with aria-hidden="true" in hoverable-link-text divs
+        title_span = ROLE_TITLE_SPAN_SELECTOR.select_one(li)
+        if title_span is None:
+            # Alternative selector for titles
+            for text, _, parent_classes in spans:
+                if text and not ROLE_TITLE_SKIP_RE.search(text):
+                    if parent_classes is not None and ('hoverable-link-text' in parent_classes or 't-bold' in parent_classes):
+                        role["title"] = text
+                        break
+        else:
+            role["title"] = title_span.get_text(strip=True)
+        
+        if not role["title"]:
+            return None
+
+        # Extract dates and location using LinkedIn's standard structure
+        # LinkedIn typically structures role info as: Title -> Company/Duration -> Date -> Location
+        
+        # Get all text spans in order, lowercased once for both scans below
+        span_texts = [(text, text.lower()) for text, _, _ in spans if text]
+        
+        # Extract dates first - look for patterns with years, months, duration
+        for text, text_lower in span_texts:
+            if text == role["title"]:
+                continue
+                
+            # Check if this looks like a date/duration
+            has_date_indicators = DATE_HINT_RE.search(text) is not None
+            
+            # Additional check for date format patterns
+            has_date_format = (
+                ('20' in text and len(text) > 4) or  # Contains year
+                (' - ' in text) or  # Date range
+                ('·' in text and ('yr' in text_lower or 'mo' in text_lower)) or  # Duration
+                'present' in text_lower
+            )
+            
+            if has_date_indicators and has_date_format and not role["dates"]:
+                role["dates"] = text
+                break
+        
+        # Extract location - it's typically the remaining text that's not title, dates, or company info
+        for text, text_lower in span_texts:
+            if text == role["title"] or text == role.get("dates"):
+                continue
+                
+            # Skip company info patterns (contains employment type indicators)
+            if '·' in text and EMPLOYMENT_TYPE_RE.search(text):
+                continue
+                
+            # Skip if it looks like a company name (no location-specific patterns)
+            
+            # Check if text has location-like patterns
+            has_location_pattern = ROLE_LOCATION_RE.search(text) is not None
+            
+            # Additional structural checks
+            is_likely_location = (
+                has_location_pattern or
+                (', ' in text and len(text.split(', ')) >= 2) or  # City, State pattern
+                text.endswith(' Area') or
+                text.endswith(' Region') or
+                text.endswith(' Metroplex') or
+                ('·' in text and not EMPLOYMENT_TYPE_RE.search(text))
+            )
+            
+            if is_likely_location and not role["location"]:
+                role["location"] = text
+                break
+        
+        # Alternative approach: use caption wrappers which often contain structured data
+        if not role["dates"] or not role["location"]:
+            caption_texts = [text for text, classes, _ in spans if 'pvs-entity__caption-wrapper' in classes]
+            
+            for i, text in enumerate(caption_texts):
+                if not text:
+                    continue
+                    
+                # First caption wrapper is usually dates
+                if i == 0 and not role["dates"]:
+                    # Check if it looks like a date
+                    if DATE_WORD_RE.search(text) or ' - ' in text:
+                        role["dates"] = text
+                        
+                # Second caption wrapper or non-date text is usually location
+                elif not role["location"]:
+                    # If it doesn't look like a date, treat as location
+                    if not DATE_WORD_RE.search(text) or '·' in text:
+                        role["location"] = text
+
+        return role
+    
+    def _find_experience_section(self,soup: BeautifulSoup):
+        """Find the experience section in the HTML"""
+        # Look for the section with id="experience" or containing "Experience" header
+        exp_section = EXPERIENCE_ANCHOR_SELECTOR.select_one(soup)
+        if exp_section:
+            return exp_section.find_parent('section')
+        
+        # Fallback: look for headers containing "Experience"
+        for h in SECTION_HEADER_SELECTOR.iselect(soup):
+            if 'experience' in h.get_text(strip=True).lower():
+                return h.find_parent('section') or h.find_parent('div')
+        return None
+
+    def _company_key(self, company_keys, company_name, index):
+        """Return the experience key for a company, reusing the first spelling seen"""
+        if not company_name:
+            return f"company_{index}"
+        return company_keys.setdefault(company_name.casefold(), company_name)
+
+    def _extract_experience(self, html: str) -> Dict[str, Any]:
+        """Main function to extract all experience data"""
+        experience = {}
+        if not html:
+            return experience
+        soup = BeautifulSoup(html, "lxml")
+
+        exp_section = self._find_experience_section(soup)
+        if not exp_section:
+            return experience
+
+        exp_list = exp_section.find("ul")
+        if not exp_list:
+            return experience
+
+        # Get all top-level experience items
+        top_level_items = exp_list.find_all('li', recursive=False)
+        # Case-insensitive company name -> the key it was first stored under,
+        # so repeat entries for one company share a single experience record
+        company_keys = {}
+        
+        for i, top_li in enumerate(top_level_items):
+            # Skip items that don't look like experience entries
+            if EXPERIENCE_ITEM_SELECTOR.select_one(top_li) is None:
+                continue
+
+            company_name = None
+            company_url = None
+            total_period = None
+            company_location = None
+
+            # Extract company URL
+            company_link_elem = COMPANY_LINK_SELECTOR.select_one(top_li)
+            if company_link_elem:
+                company_url = company_link_elem.get('href')
+
+            is_grouped = self._is_grouped_experience(top_li)
+
+            if is_grouped:
+                # For grouped experiences, extract company info from the top level
+                main_div = COMPANY_HEADER_SELECTOR.select_one(top_li)
+                if main_div:
+                    # Look for company name in hoverable-link-text spans
+                    company_elem = ROLE_TITLE_SPAN_SELECTOR.select_one(main_div)
+                    if company_elem:
+                        company_name = company_elem.get_text(strip=True)
+
+                    # Look for total period and company location
+                    for span in ARIA_HIDDEN_SPAN_SELECTOR.iselect(main_div):
+                        text = span.get_text(strip=True)
+                        if not text:
+                            continue
+                            
+                        # Check for total period (duration)
+                        if ('yr' in text.lower() or 'mo' in text.lower() or 'year' in text.lower() or 'month' in text.lower()) and not total_period:
+                            total_period = text
+                        # Check for company location (not company name, not duration)
+                        elif not company_location and text != company_name and text != total_period:
+                            # Generic location pattern detection; the regex also
+                            # covers the ", " and " Area"/" Region"/" Metroplex" forms
+                            if COMPANY_LOCATION_RE.search(text):
+                                company_location = text
+
+                company_key = self._company_key(company_keys, company_name, i)
+                if company_key not in experience:
+                    experience[company_key] = {
+                        "company_url": company_url,
+                        "total_period": total_period,
+                        "positions": []
+                    }
+
+                # Extract individual roles from nested lists
+                for ul in self._role_lists(top_li):
+                    for role_li in ul.find_all('li', recursive=False):
+                        role = self._extract_role(role_li, is_ungrouped=False)
+                        if role:
+                            # If role doesn't have location but company does, use company location
+                            if not role["location"] and company_location:
+                                role["location"] = company_location
+                            experience[company_key]["positions"].append(role)
+            else:
+                # For ungrouped experiences, extract company info differently
+                # Look for company name in the span.t-14.t-normal text (like "Zinc Technologies · Internship")
+                company_span = COMPANY_SPAN_SELECTOR.select_one(top_li)
+                if company_span:
+                    company_text = company_span.get_text(strip=True)
+                    # Extract company name (before the · symbol)
+                    if '·' in company_text:
+                        company_name = company_text.split('·')[0].strip()
+                    else:
+                        company_name = company_text
+                
+                # If no company name found, use the job title as fallback
+                if not company_name:
+                    title_elem = ROLE_TITLE_SPAN_SELECTOR.select_one(top_li)
+                    if title_elem:
+                        company_name = title_elem.get_text(strip=True)
+                
+                company_key = self._company_key(company_keys, company_name, i)
+                
+                # For ungrouped, each top-level li is a separate role; another role at a
+                # company already seen joins that entry instead of replacing it
+                if company_key not in experience:
+                    experience[company_key] = {
+                        "company_url": company_url,
+                        "total_period": total_period,
+                        "positions": []
+                    }
+                
+                role = self._extract_role(top_li, is_ungrouped=True)
+                if role:
+                    experience[company_key]["positions"].append(role)
+
+        return experience
+        
+    async def _extract_education(self):
+        """Extract education information"""
+        education = []
+
+        try:
+            # Find the education section anchor by id
+            edu_section = await self.page.query_selector("div#education")
+            if edu_section:
+                # Try to click "show all education" if it exists
+                try:
+                    show_all = await self.page.query_selector(
+                        ".pvs-list__footer .artdeco-button"
+                    )
+                    if show_all:
+                        await show_all.click()
+                        await self._human_sleep(2, 3)
+                except Exception:
+                    pass
+
+                # Read every entry in the education list in a single round-trip
+                education = await self.page.evaluate(EDUCATION_SCRIPT) or []
+
+                # Close the modal if it was opened
+                try:
+                    close_button = await self.page.query_selector("button.artdeco-modal__dismiss")
+                    if close_button:
+                        await close_button.click()
+                        await self._human_sleep(1, 2)
+                except Exception:
+                    pass
+
+            return education
+
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error extracting education section: {e}")
+            return education
+    
+    async def _extract_certifications(self):
+        """Extract certifications"""
+        certifications = []
+        
+        try:
+            # Find the certifications section
+            cert_section = await self.page.query_selector("section#certifications")
+            
+            if cert_section:
+                cert_items = await cert_section.query_selector_all(".pvs-list__item-container")
+                
+                for item in cert_items:
+                    try:
+                        cert = {}
+                        
+                        # Name
+                        name_elem = await item.query_selector(".t-bold span[aria-hidden='true']")
+                        if name_elem:
+                            cert['name'] = await name_elem.inner_text()
+                        
+                        # Issuer
+                        issuer_elem = await item.query_selector(".t-normal.t-black--light span[aria-hidden='true']")
+                        if issuer_elem:
+                            cert['issuer'] = await issuer_elem.inner_text()
+                        
+                        # Date
+                        date_elements = await item.query_selector_all(".t-normal.t-black--light span[aria-hidden='true']")
+                        if len(date_elements) > 1:
+                            cert['date'] = await date_elements[1].inner_text()
+                        
+                        certifications.append(cert)
+                        
+                    except Exception as ex:
+                        logger.error(f"Worker {self.worker_id}: Error extracting certification: {ex}")
+            
+            return certifications
+            
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error extracting certifications: {e}")
+            return certifications
+
+    async def scrape_user_activity(self, profile_url, last_post_time=None, last_comment_time=None, last_reaction_time=None):
+        """
+        Scrapes a user's activity incrementally. It gets posts from the '/all' endpoint
+        and then navigates directly to the specific URLs for comments and reactions.
+        Returns both the activity_data dict and a new_times dict for state saving.
+        """
+        logger.info(f"[STATE] {profile_url}: last_post_time={last_post_time}, last_comment_time={last_comment_time}, last_reaction_time={last_reaction_time}")
+
+        activity_data = {
+            'posts': [],
+            'comments': [],
+            'reactions': [],
+            'scraped_at': datetime.now().isoformat()
+        }
+        new_times = {
+            "last_post_time": last_post_time,
+            "last_comment_time": last_comment_time,
+            "last_reaction_time": last_reaction_time
+        }
+
+        base_url = profile_url.rstrip('/')
+
+        # Posts come from the '/all' view; comments and reactions have direct URLs
+        tabs = (
+            ("all", "posts", self._extract_posts, "last_post_time", "No activity found on the profile."),
+            ("comments", "comments", self._extract_comments, "last_comment_time", "No comment activity found."),
+            ("reactions", "reactions", self._extract_reactions, "last_reaction_time", "No reaction activity found."),
+        )
+        extra_pages = []
+        permits = 0
+        try:
+            # The tabs are independent, so they load, scroll and extract
+            # concurrently on pages in this worker's context (same cookies and
+            # resource blocking). Each extra page holds its own PAGE_SEMAPHORE
+            # permit; self.page already has the one scrape_profile took. Only
+            # free permits are taken, never awaited, so workers that each hold
+            # one can't deadlock; tabs without a page of their own wait for one
+            while permits < len(tabs) - 1 and not PAGE_SEMAPHORE.locked():
+                await PAGE_SEMAPHORE.acquire()
+                permits += 1
+            for _ in range(permits):
+                extra_pages.append(await self.context.new_page())
+            free_pages = asyncio.Queue()
+            for page in (self.page, *extra_pages):
+                free_pages.put_nowait(page)
+
+            async def scrape_tab(path, extract, since_timestamp, empty_message):
+                page = await free_pages.get()
+                try:
+                    return await self._scrape_activity_tab(page, f"{base_url}/recent-activity/{path}/", extract, since_timestamp, empty_message)
+                finally:
+                    free_pages.put_nowait(page)
+
+            results = await asyncio.gather(
+                *(
+                    scrape_tab(path, extract, new_times[time_key], empty_message)
+                    for path, _, extract, time_key, empty_message in tabs
+                ),
+                return_exceptions=True
+            )
+            for (path, key, _, time_key, _), result in zip(tabs, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scraping the '{path}' activity feed: {result}")
+                    continue
+                items, most_recent_time = result
+                activity_data[key] = items
+                if most_recent_time:
+                    new_times[time_key] = most_recent_time
+
+            print("Successfully completed all activity scraping.")
+            return activity_data, new_times
+
+        except Exception as e:
+            logger.error(f"A critical error occurred in scrape_user_activity: {e}")
+            return activity_data, new_times
+        finally:
+            for page in extra_pages:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            for _ in range(permits):
+                PAGE_SEMAPHORE.release()
+
+    async def _scrape_activity_tab(self, page, tab_url, extract, since_timestamp, empty_message):
+        """Open one activity feed on page and return (items, most_recent_time)"""
+        print(f"Navigating to activity feed: {tab_url}")
+        await page.goto(tab_url, wait_until="domcontentloaded")
+        # Proceed as soon as either cards or the empty placeholder render,
+        # waiting no longer than the old fixed 3s pause
+        try:
+            await page.locator(f"{ACTIVITY_CARD_SELECTOR}, {ACTIVITY_EMPTY_SELECTOR}").first.wait_for(timeout=3000)
+        except Exception:
+            pass
+
+        if not await self._has_activity(page):
+            logger.info(empty_message)
+            return [], None
+        return await extract(since_timestamp=since_timestamp, page=page)
+
+    async def _has_activity(self, page=None):
+        """Check whether the current activity tab shows items rather than the empty placeholder"""
+        page = page or self.page
+        return await page.evaluate(
+            "(selector) => !document.querySelector(selector)", ACTIVITY_EMPTY_SELECTOR
+        )
+
+    async def _extract_posts(self, since_timestamp=None, max_posts=None, page=None):
+        """
+        High-performance extractor for the 'Posts' tab.
+        Only returns posts newer than since_timestamp (if set).
+        Returns: (filtered_posts, most_recent_time_iso)
+        """
+        page = page or self.page
+        await self.efficient_scroll_page(page)
+        try:
+            print(" Starting high-performance post extraction with all selectors...")
+
+            posts_data = posts_from_columns(orjson.loads(await page.evaluate(POSTS_SCRIPT)))
+            if max_posts is not None:
+                posts_data = posts_data[:max_posts]
+            print(f"✅ Successfully extracted {len(posts_data)} posts with all selectors.")
+
+            # --- Incremental filtering ---
+            return incremental_filter(posts_data, since_timestamp, max_posts)
+
+        except Exception as e:
+            logger.error(f"Error during universal post extraction: {e}")
+            return [], None
+
+    async def efficient_scroll_page(self, page, max_scrolls=100, scroll_pause=1, patience=3):
+        """
+        Scrolls the main page efficiently and patiently to ensure all activity cards are loaded.
+        Stops early if 0 cards are found for 'patience' consecutive scrolls.
+        This is the correct method for the 'Comments' activity feed.
+        """
+        last_count = 0
+        stagnant_scrolls = 0
+        zero_scrolls = 0  # Tracks consecutive zero-card scrolls
+
+        print("🔁 Starting smart scroll of the main page to load all activity cards...")
+
+        for i in range(max_scrolls):
+            # 1. Count the number of loaded activity cards and scroll to the
+            # bottom (step 3) in the same round-trip; a scroll on the final
+            # pass is harmless
+            current_count = await page.evaluate(ACTIVITY_SCROLL_STEP_SCRIPT, ACTIVITY_CARD_SELECTOR)
+            
+            print(f"Scroll {i+1}/{max_scrolls}: Found {current_count} cards (previously {last_count}).")
+
+            # Stop if 0 cards found for 'patience' consecutive scrolls
+            if current_count == 0:
+                zero_scrolls += 1
+                if zero_scrolls >= patience:
+                    print(f"No cards found for {patience} consecutive scrolls. Stopping scroll.")
+                    break
+            else:
+                zero_scrolls = 0
+
+            # Check if scrolling has stalled (no new cards loaded for 'patience' scrolls)
+            if current_count == last_count and last_count > 0:
+                stagnant_scrolls += 1
+                if stagnant_scrolls >= patience:
+                    print(f"No new cards loaded for {patience} consecutive scrolls. Assuming all are loaded.")
+                    break
+            else:
+                stagnant_scrolls = 0  # Reset if new content is found
+
+            last_count = current_count
+
+            # 4. Wait for new content to load
+            await asyncio.sleep(scroll_pause)
+
+        print(f"🏁 Finished scrolling. A total of {last_count} cards are loaded and ready for extraction.")
+
+
+    async def _extract_comments(self, since_timestamp=None, max_comments=None, page=None):
+        """
+        High-performance extractor for the 'Comments' activity tab.
+        Returns only comments newer than since_timestamp, plus most recent ISO time.
+        """
+        page = page or self.page
+        await self.efficient_scroll_page(page)
+        try:
+            print("Starting high-performance comment extraction with all selectors...")
+
+            comments = rows_from_columns(orjson.loads(await page.evaluate(COMMENTS_SCRIPT)))
+            if max_comments is not None:
+                comments = comments[:max_comments]
+            print(f"Successfully extracted {len(comments)} comments using all selectors.")
+
+            # --- Incremental filtering ---
+            return incremental_filter(comments, since_timestamp, max_comments)
+
+        except Exception as e:
+            logger.error(f"Error during high-performance extraction: {e}")
+            return [], None
+
+    async def _extract_reactions(self, since_timestamp=None, max_reactions=None, page=None):
+        """
+        High-performance extractor for the 'Reactions' activity tab.
+        Returns only reactions newer than since_timestamp, plus most recent ISO time.
+        """
+        page = page or self.page
+        await self.efficient_scroll_page(page)
+        try:
+            print("Starting high-performance reaction extraction with all selectors...")
+
+            reactions_data = rows_from_columns(orjson.loads(await page.evaluate(REACTIONS_SCRIPT)))
+            if max_reactions is not None:
+                reactions_data = reactions_data[:max_reactions]
+            print(f"✅ Successfully extracted {len(reactions_data)} reactions with all selectors.")
+
+            # --- Incremental filtering ---
+            return incremental_filter(reactions_data, since_timestamp, max_reactions)
+
+        except Exception as e:
+            logger.error(f"Error during universal reaction extraction: {e}")
+            return [], None
+
+    def _save_profile_data(self, profile_data):
+        """Save profile data to a JSON file"""
+        try:
+            if not profile_data:
+                return
+                
+            # Create directory if it doesn't exist
+            os.makedirs("linkedin_data", exist_ok=True)
+            
+            # Create filename from name or URL
+            if 'basic_info' in profile_data and 'name' in profile_data['basic_info'] and profile_data['basic_info']['name']:
+                safe_name = FILENAME_UNSAFE_RE.sub('', profile_data['basic_info']['name'])
+                safe_name = FILENAME_SEPARATOR_RE.sub('_', safe_name).strip('_').lower()
+                filename = f"linkedin_data/profile_{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            else:
+                # Extract username from URL
+                username = PROFILE_USERNAME_RE.search(profile_data['profile_url'])
+                if username:
+                    filename = f"linkedin_data/profile_{username.group(1)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                else:
+                    # Use timestamp if no username or name available
+                    filename = f"linkedin_data/profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(profile_data, f, ensure_ascii=False, indent=2)
+            
+            logger.info(f"Worker {self.worker_id}: Saved profile data to {filename}")
+            
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error saving profile data: {e}")
+    
+    async def _human_sleep(self, min_seconds, max_seconds):
+        """Sleep for a random duration to mimic human behavior"""
+        sleep_time = range_delay(min_seconds, max_seconds)
+        await asyncio.sleep(sleep_time)
+
+    async def _scroll_burst(self, count, min_amount, max_amount, min_pause, max_pause):
+        """Run a burst of randomized scrolls and pauses in-page in one round-trip"""
+        steps = [
+            {'dy': random.randint(min_amount, max_amount),
+             'pause_ms': int(random.uniform(min_pause, max_pause) * 1000)}
+            for _ in range(count)
+        ]
+        await self.page.evaluate(SCROLL_BURST_SCRIPT, steps)
+    
+    async def _human_type(self, selector, text):
+        """Type text like a human with variable speed and occasional mistakes"""
+        try:
+            # Find the element
+            element = await self.page.query_selector(selector)
+            if not element:
+                logger.error(f"Worker {self.worker_id}: Element not found for typing: {selector}")
+                return
+            
+            # Clear the field first
+            await element.click()
+            await element.focus()
+            
+            # Type word by word: Playwright spaces the keystrokes of each word
+            # itself, so a word costs one round-trip instead of one per character
+            words = TYPING_CHUNK_RE.findall(text)
+            for word in words:
+                # Type the word with a variable per-keystroke delay (ms)
+                delay = random.uniform(50, 150)
+
+                # Roll for a typo at each character, so a long token such as an
+                # email or password gets proportionally more chances than a
+                # short word; the first hit is typed wrong, then corrected
+                typo_at = next((i for i in range(len(word)) if random.random() < TYPO_CHANCE), None)
+                if typo_at is not None:
+                    await self.page.keyboard.type(word[:typo_at], delay=delay)
+                    typo_char = random.choice('qwertyuiop[]asdfghjkl;\'zxcvbnm,./1234567890-=')
+                    await self.page.keyboard.type(typo_char)
+                    await asyncio.sleep(random.uniform(0.1, 0.3))
+                    await self.page.keyboard.press("Backspace")
+                    await asyncio.sleep(random.uniform(0.1, 0.3))
+                    word_rest = word[typo_at:]
+                else:
+                    word_rest = word
+                await self.page.keyboard.type(word_rest, delay=delay)
+                
+                # Longer pauses after spaces and punctuation
+                if word[-1] in ' .,;:?!':
+                    await asyncio.sleep(random.uniform(0.1, 0.4))
+                
+                # Occasionally pause longer to simulate thinking: the chance
+                # that any of the word's characters would have paused
+                if random.random() < 1 - (1 - PAUSE_CHANCE) ** len(word):
+                    await asyncio.sleep(random.uniform(0.5, 1.2))
+                    
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: Error during human typing: {e}")
+
+class LinkedInMassProfileScraper:
+    """Distributed scraper for handling thousands of LinkedIn profiles"""
+    
+    def __init__(self, config):
+        """Initialize the scraper with configuration"""
+        self.config = config
+        self.worker_pool = []
+        
+        # Event loop that runs every worker coroutine, the result processor
+        # and the progress monitor
+        # uvloop drives it on POSIX when installed; Windows keeps the default
+        # Proactor loop, which Playwright needs for its driver subprocess
+        if uvloop is not None and sys.platform != "win32":
+            self.loop = uvloop.new_event_loop()
+        else:
+            self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.run_task = None
+        # Set on the first termination signal; every wait in the worker loop
+        # returns as soon as it fires
+        self.shutdown_event = asyncio.Event()
+        
+        # Only touched from the loop; the file watcher thread hands its
+        # batches over with call_soon_threadsafe
+        self.profile_queue = asyncio.Queue()
+        self.results_queue = None
+        self.active_workers = 0
+        self.processed_profiles = 0
+        self.successful_profiles = 0
+        self.running = False
+        
+        self.file_watcher = None
+        if config.get('profile_file'):
+            self.file_watcher = ProfileFileWatcher(config.get('profile_file'), self.profile_queue, self.loop)
+        
+        # Load proxy list if provided
+        self.proxies = self._load_proxies(config.get('proxy_file'))
+        self.proxy_pool = ProxyPool(self.proxies) if self.proxies else None
+        
+        # Initialize workers
+        self._init_workers()
+    
+    def _load_proxies(self, proxy_file):
+        """Load proxies from a file if provided"""
+        proxies = []
+        
+        if not proxy_file:
+            return proxies
+            
+        try:
+            with open(proxy_file, 'r') as f:
+                for line in f:
+                    proxy = line.strip()
+                    if proxy:
+                        proxies.append(proxy)
+            
+            logger.info(f"Loaded {len(proxies)} proxies from {proxy_file}")
+            return proxies
+            
+        except Exception as e:
+            logger.error(f"Error loading proxies: {e}")
+            return []
+    
+    def _init_workers(self):
+        """Initialize worker threads based on configuration"""
+        worker_count = self.config.get('worker_count', 3)
+        credentials_list = self.config.get('credentials', [])
+        
+        if not credentials_list:
+            logger.error("No credentials provided. Cannot initialize workers.")
+            return
+        
+        logger.info(f"Initializing {worker_count} workers")
+        
+        for i in range(worker_count):
+            # Assign credentials with round-robin distribution
+            credentials = credentials_list[i % len(credentials_list)]
+            
+            # Create worker; it leases a proxy from the pool when it initializes
+            worker = PlaywrightProfileScraper(
+                worker_id=i,
+                credentials=credentials,
+                headless=self.config.get('headless', False),
+                use_shared_browser=self.config.get('shared_browser', True),
+                proxy_pool=self.proxy_pool
+            )
+            worker.context_pool_size = self.config.get('context_pool_size', 1)
+            worker.config['debug_dumps'] = self.config.get('debug_dumps', False)
+            
+            self.worker_pool.append(worker)
+    
+    def load_profile_urls(self, source):
+        """Load profile URLs from file or database"""
+        try:
+            if isinstance(source, str) and os.path.isfile(source):
+                # Load from file
+                count = self._enqueue_profiles(read_profile_urls(source))
+                
+                logger.info(f"Loaded {count} profile URLs from {source}")
+                
+            elif isinstance(source, list):
+                # Load from list
+                count = self._enqueue_profiles([url for url in source if url and "/in/" in url])
+                
+                logger.info(f"Loaded {count} profile URLs from provided list")
+                
+            else:
+                logger.error(f"Unsupported profile source: {source}")
+                
+        except Exception as e:
+            logger.error(f"Error loading profile URLs: {e}")
+    
+    def _enqueue_profiles(self, urls):
+        """Put a list of profile URLs on the queue in one pass; returns how many"""
+        # Profiles scraped in an earlier run are skipped up front rather than
+        # taking a worker slot, and the watcher learns about the rest so its
+        # first read of the same file doesn't queue them a second time
+        urls = filter_unprocessed(urls)
+        if self.file_watcher:
+            self.file_watcher.mark_seen(urls)
+        put = self.profile_queue.put_nowait
+        for url in urls:
+            put(url)
+        return len(urls)
+
+    def start_scraping(self):
+        """Start the scraping process with multiple workers"""
+        if self.running:
+            logger.warning("Scraping already in progress")
+            return
+            
+        if self.profile_queue.empty():
+            logger.error("No profiles to scrape. Load profiles first.")
+            return
+            
+        self.running = True
+        logger.info(f"Starting scraping with {len(self.worker_pool)} workers")
+        
+        if self.file_watcher:
+            self.file_watcher.start()
+
+        start_state_flusher()
+
+        # Register signal handlers for graceful shutdown, only for the run
+        # itself so an interrupt while loading profiles still stops at once.
+        # On POSIX they run on the loop, between coroutine steps; Windows has
+        # no loop signal support
+        if sys.platform != "win32":
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                self.loop.add_signal_handler(sig, self._request_stop, sig)
+        else:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+
+        # Run every worker, the result processor and the progress monitor as
+        # coroutines on the one scraping loop
+        self.run_task = self.loop.create_task(self._run_workers())
+        try:
+            self.loop.run_until_complete(self.run_task)
+        except KeyboardInterrupt:
+            logger.info("Received keyboard interrupt. Shutting down...")
+            self._shutdown()
+        except asyncio.CancelledError:
+            self._shutdown()
+        else:
+            if self.shutdown_event.is_set():
+                self._shutdown()
+        finally:
+            if sys.platform != "win32":
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    self.loop.remove_signal_handler(sig)
+        
+        self.running = False
+        try:
+            self.loop.run_until_complete(close_shared_browser())
+        except Exception as e:
+            logger.error(f"Error closing shared browser: {e}")
+        stop_state_flusher()
+        logger.info("Scraping completed")
+
+    async def _run_workers(self):
+        """Run all workers, the result processor and the progress monitor until they finish"""
+        self.results_queue = asyncio.Queue()
+        result_task = asyncio.create_task(self._result_processor(), name="ResultProcessor")
+        monitor_task = asyncio.create_task(self._progress_monitor(), name="ProgressMonitor")
+        tasks = []
+        for i, worker in enumerate(self.worker_pool):
+            tasks.append(asyncio.create_task(self._worker_loop(worker), name=f"Worker-{i}"))
+            logger.info(f"Started worker {i}")
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Every worker has exited; let the processor drain what they queued
+            self.running = False
+            await result_task
+        finally:
+            for task in (result_task, monitor_task):
+                task.cancel()
+
+    async def _wait_for_shutdown(self, timeout):
+        """Sleep up to timeout seconds; return True if shutdown was requested meanwhile"""
+        try:
+            await asyncio.wait_for(self.shutdown_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _next_profile(self, timeout):
+        """Wait up to timeout seconds for a queued profile URL; None on timeout or shutdown"""
+        get_task = asyncio.ensure_future(self.profile_queue.get())
+        stop_task = asyncio.ensure_future(self.shutdown_event.wait())
+        try:
+            await asyncio.wait((get_task, stop_task), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # A cancelled get leaves its item in the queue
+            for task in (get_task, stop_task):
+                if not task.done():
+                    task.cancel()
+        if not get_task.done() or get_task.cancelled():
+            return None
+        profile_url = get_task.result()
+        if self.shutdown_event.is_set():
+            # Shutdown won the race; hand the URL back instead of starting it
+            self.profile_queue.put_nowait(profile_url)
+            self.profile_queue.task_done()
+            return None
+        return profile_url
+    
+    async def _worker_loop(self, worker):
+        """Worker coroutine: scrape profiles from the queue until shutdown"""
+        self.active_workers += 1
+        
+        try:
+            # Initialize the worker
+            init_success = await worker.initialize()
+            if not init_success:
+                logger.error(f"Worker {worker.worker_id}: Initialization failed")
+                return
+                
+            last_profile_time = time.time()
+
+            while self.running:
+                try:
+                    # Check if worker is in cooldown
+                    if worker.in_cooldown and worker.cooldown_until:
+                        remaining_cooldown = (worker.cooldown_until - datetime.now()).total_seconds()
+                        if remaining_cooldown > 0:
+                            logger.info(f"Worker {worker.worker_id}: In cooldown for {remaining_cooldown/3600:.1f} more hours")
+                            # Sleep for 5 minutes or remaining time
+                            if await self._wait_for_shutdown(min(300, remaining_cooldown)):
+                                break
+                            continue
+                        else:
+                            worker.in_cooldown = False
+                            logger.info(f"Worker {worker.worker_id}: Cooldown expired")
+                    
+                    # Check for session timeout
+                    if time.time() - last_profile_time > SESSION_IDLE_REFRESH:
+                        logger.info(f"Worker {worker.worker_id}: Refreshing session due to inactivity")
+                        await worker.refresh_session()
+                        last_profile_time = time.time()
+                    
+                    # Wait for the next profile URL; the timeout brings the loop
+                    # back round when the idle session is due for a refresh
+                    idle_left = last_profile_time + SESSION_IDLE_REFRESH - time.time()
+                    profile_url = await self._next_profile(max(idle_left, 1))
+                    if profile_url is None:
+                        if self.shutdown_event.is_set():
+                            break
+                        continue
+                    last_profile_time = time.time()
+                    
+                    # Process the profile
+                    logger.info(f"Worker {worker.worker_id}: Processing {profile_url}")
+                    profile_data = await worker.scrape_profile(profile_url)
+                    
+                    # Put result in results queue
+                    self.results_queue.put_nowait({
+                        'url': profile_url,
+                        'success': profile_data is not None,
+                        'data': profile_data,
+                        'worker_id': worker.worker_id,
+                        'timestamp': datetime.now().isoformat()
+                    })
+                    
+                    self.profile_queue.task_done()
+                    
+                    # If scraping failed (likely due to blocks), increase delay
+                    if profile_data is None:
+                        delay = range_delay(300, 600)  # ~5-10 minutes if failed
+                        logger.warning(f"Worker {worker.worker_id}: Profile failed, extended wait of {delay:.1f}s")
+                    else:
+                        # Normal delay for successful scrapes; with the default
+                        # 120-300s range this is a ~190s median within 60-600s
+                        delay = range_delay(
+                            self.config.get('min_delay', 120),
+                            self.config.get('max_delay', 300),
+                            sigma=0.6
+                        )
+                    
+                    logger.info(f"Worker {worker.worker_id}: Waiting {delay:.1f}s before next profile")
+                    if await self._wait_for_shutdown(delay):
+                        break
+                    
+                except Exception as e:
+                    logger.error(f"Worker {worker.worker_id}: Error processing profile: {e}")
+                    if await self._wait_for_shutdown(5):
+                        break
+        
+        finally:
+            # Clean up
+            try:
+                await worker.cleanup()
+            except Exception as e:
+                logger.error(f"Worker {worker.worker_id}: Cleanup error: {e}")
+                
+            self.active_workers -= 1
+    
+    async def _result_processor(self):
+        """Process and store results from workers"""
+        while self.running or not self.results_queue.empty():
+            try:
+                # Get result with timeout
+                try:
+                    result = await asyncio.wait_for(self.results_queue.get(), timeout=5)
+                except asyncio.TimeoutError:
+                    continue
+                
+                # Update counters; only coroutines on this loop touch them, so
+                # no lock is needed
+                self.processed_profiles += 1
+                if result['success']:
+                    self.successful_profiles += 1
+                
+                # Save combined data periodically
+                if self.processed_profiles % 10 == 0:
+                    self._save_progress_stats()
+                
+                # Mark as done
+                self.results_queue.task_done()
+                
+            except Exception as e:
+                logger.error(f"Error processing result: {e}")
+    
+    async def _progress_monitor(self):
+        """Monitor progress"""
+        while self.running or self.active_workers > 0:
+            try:
+                # The counters are only written by coroutines on this loop, so
+                # plain reads are consistent
+                remaining = self.profile_queue.qsize()
+                active = self.active_workers
+                processed = self.processed_profiles
+                successful = self.successful_profiles
+                
+                logger.info(f"Progress: {processed} processed ({successful} successful), {remaining} remaining, {active} active workers")
+                
+                await asyncio.sleep(60)
+                
+            except Exception as e:
+                logger.error(f"Error in progress monitor: {e}")
+                await asyncio.sleep(60)
+    
+    def _save_progress_stats(self):
+        """Save progress statistics"""
+        try:
+            stats = {
+                'timestamp': datetime.now().isoformat(),
+                'total_processed': self.processed_profiles,
+                'successful': self.successful_profiles,
+                'remaining': self.profile_queue.qsize(),
+                'active_workers': self.active_workers,
+                'worker_stats': [
+                    {
+                        'worker_id': worker.worker_id,
+                        'profiles_scraped': worker.profiles_scraped,
+                        'in_cooldown': worker.in_cooldown,
+                        'cooldown_until': worker.cooldown_until.isoformat() if worker.cooldown_until else None
+                    }
+                    for worker in self.worker_pool
+                ]
+            }
+            
+            atomic_write(
+                f"linkedin_data/scraping_stats_{datetime.now().strftime('%Y%m%d')}.json",
+                orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+            )
+                
+        except Exception as e:
+            logger.error(f"Error saving progress stats: {e}")
+    
+    def _request_stop(self, sig):
+        """Handle termination signals on the loop"""
+        if self.shutdown_event.is_set():
+            # Second signal: cancel the run, including profiles mid-scrape;
+            # every worker's cleanup still runs
+            logger.info(f"Received signal {sig} again. Stopping now...")
+            if self.run_task and not self.run_task.done():
+                self.run_task.cancel()
+            return
+        # First signal: workers finish the profile in hand, then their waits
+        # wake on the event and they exit; start_scraping() finishes the shutdown
+        logger.info(f"Received signal {sig}. Shutting down gracefully...")
+        self.running = False
+        self.shutdown_event.set()
+
+    def _signal_handler(self, sig, frame):
+        """Handle termination signals"""
+        logger.info(f"Received signal {sig}. Shutting down gracefully...")
+        self._shutdown()
+        sys.exit(0)
+    
+    def _shutdown(self):
+        """Shutdown the scraper gracefully"""
+        logger.info("Shutting down scrapers...")
+        self.running = False
+        
+        # Final progress report
+        logger.info(f"Final stats: {self.processed_profiles} processed, {self.successful_profiles} successful")
+        
+        if self.file_watcher:
+            self.file_watcher.stop()
+
+        # Save final stats and any state not yet flushed
+        self._save_progress_stats()
+        flush_state()
+
+def main():
+    """Main function to run the mass profile scraper"""
+    parser = argparse.ArgumentParser(description='LinkedIn Mass Profile Scraper (Playwright version)')
+    
+    parser.add_argument('--profile-file', type=str, help='File containing LinkedIn profile URLs')
+    parser.add_argument('--workers', type=int, default=3, help='Number of worker threads')
+    parser.add_argument('--credentials-file', type=str, required=True, help='JSON file with LinkedIn credentials')
+    parser.add_argument('--proxy-file', type=str, help='File containing proxy list')
+    parser.add_argument('--headless', action='store_true', help='Run in headless mode')
+    parser.add_argument('--min-delay', type=int, default=30, help='Minimum delay between profiles in seconds')
+    parser.add_argument('--max-delay', type=int, default=90, help='Maximum delay between profiles in seconds')
+    parser.add_argument('--debug-dumps', action='store_true', help='Save each profile page source for debugging')
+    
+    args = parser.parse_args()
+    
+    # Load credentials from file
+    try:
+        with open(args.credentials_file, 'r') as f:
+            credentials = json.load(f)
+    except Exception as e:
+        logger.error(f"Error loading credentials: {e}")
+        return
+    
+    # Configure the scraper
+    config = {
+        'worker_count': 1,
+        'credentials': credentials,
+        'proxy_file': args.proxy_file,
+        # 'headless': args.headless,
+        'headless': False,
+        'min_delay': 120,
+        'max_delay': 300,
+        'profile_file': args.profile_file,
+        'debug_dumps': args.debug_dumps
+    }
+    
+    # Initialize the scraper
+    scraper = LinkedInMassProfileScraper(config)
+    
+    # Load profile URLs
+    if args.profile_file:
+        scraper.load_profile_urls(args.profile_file)
+    else:
+        logger.error("No profile source provided. Use --profile-file")
+        return
+    
+    # Start scraping
+    scraper.start_scraping()
+
+if __name__ == "__main__":
     main()  
\ No newline at end of file
@@ -0,0 +1,88 @@
+import heapq
+import itertools
+import logging
+import time
+
+
+logger = logging.getLogger("ProxyPool")
+
+class ProxyPool:
+    """Hands out proxies by lowest recent latency and quarantines ones that fail"""
+
+    def __init__(self, proxies, alpha=0.3, initial_latency=1.0):
+        """Initialize the pool; alpha weights the newest sample in the latency EMA"""
+        self.alpha = alpha
+        self.latency = dict.fromkeys(proxies, initial_latency)
+        self.in_use = dict.fromkeys(proxies, 0)
+        self.failures = dict.fromkeys(proxies, 0)
+        self.quarantined_until = dict.fromkeys(proxies, 0.0)
+        # Heap entries are (score, tiebreak, version, proxy); an entry whose
+        # version is behind the proxy's current one is stale and skipped
+        self.version = dict.fromkeys(proxies, 0)
+        self.heap = []
+        self.counter = itertools.count()
+        for proxy in self.latency:
+            self._push(proxy)
+
+    def __len__(self):
+        return len(self.latency)
+
+    def _push(self, proxy):
+        """Re-queue a proxy under its current score, invalidating older entries"""
+        self.version[proxy] += 1
+        # Leased proxies rank lower so workers spread out when there are fewer
+        # proxies than workers
+        score = self.latency[proxy] * (1 + self.in_use[proxy])
+        heapq.heappush(self.heap, (score, next(self.counter), self.version[proxy], proxy))
+        # Drop stale entries before they pile up
+        if len(self.heap) > 4 * len(self.latency):
+            self.heap = [entry for entry in self.heap if entry[2] == self.version[entry[3]]]
+            heapq.heapify(self.heap)
+
+    def acquire(self):
+        """Lease the best available proxy, or return None if all are quarantined"""
+        now = time.monotonic()
+        quarantined = []
+        proxy = None
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            candidate = entry[3]
+            if entry[2] != self.version[candidate]:
+                continue
+            if self.quarantined_until[candidate] > now:
+                quarantined.append(entry)
+                continue
+            proxy = candidate
+            break
+        for entry in quarantined:
+            heapq.heappush(self.heap, entry)
+        if proxy is None:
+            return None
+        self.in_use[proxy] += 1
+        self._push(proxy)
+        return proxy
+
+    def release(self, proxy):
+        """Return a leased proxy to the pool"""
+        if proxy not in self.in_use:
+            return
+        self.in_use[proxy] = max(0, self.in_use[proxy] - 1)
+        self._push(proxy)
+
+    def report_success(self, proxy, latency):
+        """Fold a request latency (seconds) into the proxy's EMA"""
+        if proxy not in self.latency:
+            return
+        self.latency[proxy] += self.alpha * (latency - self.latency[proxy])
+        self.failures[proxy] = 0
+        self._push(proxy)
+
+    def report_failure(self, proxy):
+        """Quarantine a proxy with exponential backoff, capped at an hour"""
+        if proxy not in self.failures:
+            return
+        self.failures[proxy] += 1
+        delay = min(60 * 2 ** self.failures[proxy], 3600)
+        self.quarantined_until[proxy] = time.monotonic() + delay
+        logger.warning(f"Quarantining proxy {proxy} for {delay}s after {self.failures[proxy]} failures")
+        self._push(proxy)